@@ -3,8 +3,10 @@ from typing import Generator
 
 from fastapi import Depends
 
+from modules.main_backend.config import settings
 from modules.main_backend.database.connection import get_db_connection
 from modules.main_backend.repositories.interfaces import (
+    AgendaJobRepository,
     AgendaRepository,
     AvailabilityHoursRepository,
     BusinessServiceHoursRepository,
@@ -12,14 +14,18 @@ from modules.main_backend.repositories.interfaces import (
     RoleRepository,
 )
 from modules.main_backend.repositories.sqlite_repositories import (
+    SQLiteAgendaJobRepository,
     SQLiteAgendaRepository,
     SQLiteAvailabilityHoursRepository,
     SQLiteBusinessServiceHoursRepository,
     SQLitePersonRepository,
     SQLiteRoleRepository,
 )
+from modules.scheduler.greedy_scheduler import GreedyScheduler
 from modules.scheduler.interfaces import Scheduler
 from modules.scheduler.or_tools_scheduler import ORToolsScheduler
+from modules.main_backend.services.agenda_job_runner import AgendaJobRunner
+from modules.main_backend.services.agenda_job_service import AgendaJobService
 from modules.main_backend.services.agenda_service import AgendaService
 from modules.main_backend.services.availability_hours_service import AvailabilityHoursService
 from modules.main_backend.services.business_service_hours_service import BusinessServiceHoursService
@@ -27,6 +33,8 @@ from modules.main_backend.services.calendar_service import CalendarService
 from modules.main_backend.services.person_service import PersonService
 from modules.main_backend.services.role_service import RoleService
 
+_agenda_job_runner: AgendaJobRunner | None = None
+
 
 def get_person_repository(
     conn: sqlite3.Connection = Depends(get_db_connection),
@@ -88,7 +96,15 @@ def get_agenda_repository(
 
 
 def get_scheduler() -> Scheduler:
-    return ORToolsScheduler()
+    return ORToolsScheduler(
+        greedy_hints=settings.solver_greedy_hints,
+        symmetry_breaking=settings.solver_symmetry_breaking,
+        export_dir=settings.solver_export_dir,
+    )
+
+
+def get_greedy_scheduler() -> Scheduler:
+    return GreedyScheduler(export_dir=settings.solver_export_dir)
 
 
 def get_agenda_service(
@@ -99,6 +115,7 @@ def get_agenda_service(
     ),
     role_repo: RoleRepository = Depends(get_role_repository),
     scheduler: Scheduler = Depends(get_scheduler),
+    greedy_scheduler: Scheduler = Depends(get_greedy_scheduler),
 ) -> AgendaService:
     return AgendaService(
         agenda_repo,
@@ -106,9 +123,42 @@ def get_agenda_service(
         business_service_hours_repo,
         role_repo,
         scheduler,
+        greedy_scheduler,
     )
 
 
+def get_agenda_job_repository(
+    conn: sqlite3.Connection = Depends(get_db_connection),
+) -> Generator[AgendaJobRepository, None, None]:
+    yield SQLiteAgendaJobRepository(conn)
+
+
+def get_agenda_job_runner() -> AgendaJobRunner:
+    global _agenda_job_runner
+    if _agenda_job_runner is None:
+        _agenda_job_runner = AgendaJobRunner(
+            get_db_connection,
+            get_scheduler,
+            settings.agenda_job_max_workers,
+            get_greedy_scheduler,
+        )
+    return _agenda_job_runner
+
+
+def shutdown_agenda_job_runner() -> None:
+    global _agenda_job_runner
+    if _agenda_job_runner is not None:
+        _agenda_job_runner.shutdown()
+        _agenda_job_runner = None
+
+
+def get_agenda_job_service(
+    agenda_job_repo: AgendaJobRepository = Depends(get_agenda_job_repository),
+    agenda_job_runner: AgendaJobRunner = Depends(get_agenda_job_runner),
+) -> AgendaJobService:
+    return AgendaJobService(agenda_job_repo, agenda_job_runner)
+
+
 def get_calendar_service(
     availability_hours_repo: AvailabilityHoursRepository = Depends(get_availability_hours_repository),
     person_repo: PersonRepository = Depends(get_person_repository),
@@ -1,15 +1,38 @@
+from typing import AsyncIterator
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 
-from modules.main_backend.api.dependencies import get_agenda_service
+from modules.main_backend.api.dependencies import (
+    get_agenda_job_service,
+    get_agenda_service,
+)
+from modules.main_backend.config import settings
 from modules.main_backend.domain.schemas import (
+    AgendaCompareRequest,
+    AgendaComparisonResponse,
     AgendaCoverageResponse,
     AgendaEntryResponse,
     AgendaGenerateRequest,
+    AgendaJobResponse,
+    AgendaReoptimizeRequest,
     AgendaResponse,
+    AgendaSolutionEntryResponse,
+    AgendaSolutionResponse,
+)
+from modules.main_backend.domain.models import Agenda, AgendaJob
+from modules.main_backend.services.agenda_job_runner import (
+    ACTIVE_JOB_STATUSES,
+    JOB_CANCELLED,
 )
+from modules.main_backend.services.agenda_job_service import AgendaJobService
 from modules.main_backend.services.agenda_service import AgendaService
+from modules.main_backend.services.scheduler_adapter import to_scheduler_solver_parameters
+from modules.scheduler.interfaces import IntermediateSolution
+from modules.scheduler.neighborhood import ChangeSet
 
 router = APIRouter(prefix="/api/agendas", tags=["agendas"])
 
@@ -19,66 +42,183 @@ def generate_agenda(
     request: AgendaGenerateRequest,
     agenda_service: AgendaService = Depends(get_agenda_service),
 ):
-    if request.optimization_strategy not in [
-        "maximize_coverage",
-        "minimize_gaps",
-        "balance_workload",
-    ]:
+    _validate_generate_request(request, agenda_service)
+
+    agenda = agenda_service.generate_draft_agenda(
+        request.role_id,
+        request.weeks,
+        request.year,
+        request.optimization_strategy,
+        to_scheduler_solver_parameters(request.solver_parameters),
+        request.base_agenda_id,
+        solver=request.solver,
+    )
+
+    if not agenda:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Role not found or no availability/business service hours available",
+        )
+
+    return _to_agenda_response(agenda, agenda_service)
+
+
+@router.post(
+    "/compare",
+    response_model=list[AgendaComparisonResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+def compare_agendas(
+    request: AgendaCompareRequest,
+    agenda_service: AgendaService = Depends(get_agenda_service),
+):
+    if not request.optimization_strategies:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid optimization strategy. Must be one of: maximize_coverage, minimize_gaps, balance_workload",
+            detail="At least one optimization strategy is required",
         )
+    for optimization_strategy in request.optimization_strategies:
+        _validate_solver_options(optimization_strategy, request.solver)
 
-    agenda = agenda_service.generate_draft_agenda(
+    comparisons = agenda_service.compare_draft_agendas(
         request.role_id,
         request.weeks,
         request.year,
+        list(dict.fromkeys(request.optimization_strategies)),
+        to_scheduler_solver_parameters(request.solver_parameters),
+        request.solver,
+    )
+
+    if not comparisons:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Role not found or no availability/business service hours available",
+        )
+
+    return [
+        AgendaComparisonResponse(
+            optimization_strategy=optimization_strategy,
+            objective_value=objective_value,
+            agenda=_to_agenda_response(agenda, agenda_service),
+        )
+        for optimization_strategy, agenda, objective_value in comparisons
+    ]
+
+
+@router.post(
+    "/{agenda_id}/reoptimize",
+    response_model=AgendaResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+def reoptimize_agenda(
+    agenda_id: UUID,
+    request: AgendaReoptimizeRequest,
+    agenda_service: AgendaService = Depends(get_agenda_service),
+):
+    _validate_solver_options(request.optimization_strategy, request.solver)
+    if not agenda_service.get_agenda_with_details(agenda_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Agenda not found",
+        )
+
+    agenda = agenda_service.reoptimize_agenda(
+        agenda_id,
+        request.weeks,
+        request.year,
         request.optimization_strategy,
+        ChangeSet(person_ids=set(request.person_ids), dates=set(request.dates)),
+        to_scheduler_solver_parameters(request.solver_parameters),
+        request.solver,
     )
 
     if not agenda:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Role not found or no availability/business service hours available",
+            detail="No availability/business service hours available",
         )
 
-    entries = agenda_service.agenda_repository.get_entries_by_agenda(agenda.id)
-    coverage = agenda_service.agenda_repository.get_coverage_by_agenda(agenda.id)
+    return _to_agenda_response(agenda, agenda_service)
 
-    return AgendaResponse(
-        id=agenda.id,
-        role_id=agenda.role_id,
-        status=agenda.status,
-        created_at=agenda.created_at,
-        updated_at=agenda.updated_at,
-        entries=[
-            AgendaEntryResponse(
-                id=e.id,
-                agenda_id=e.agenda_id,
-                person_id=e.person_id,
-                date=e.date,
-                start_time=e.start_time,
-                end_time=e.end_time,
-                role_id=e.role_id,
-            )
-            for e in entries
-        ],
-        coverage=[
-            AgendaCoverageResponse(
-                id=c.id,
-                agenda_id=c.agenda_id,
-                date=c.date,
-                start_time=c.start_time,
-                end_time=c.end_time,
-                role_id=c.role_id,
-                is_covered=c.is_covered,
-                required_person_count=c.required_person_count,
-            )
-            for c in coverage
-        ],
+
+@router.post(
+    "/jobs", response_model=AgendaJobResponse, status_code=status.HTTP_202_ACCEPTED
+)
+def submit_agenda_job(
+    request: AgendaGenerateRequest,
+    agenda_service: AgendaService = Depends(get_agenda_service),
+    agenda_job_service: AgendaJobService = Depends(get_agenda_job_service),
+):
+    _validate_generate_request(request, agenda_service)
+
+    job = agenda_job_service.submit_job(
+        request.role_id,
+        request.weeks,
+        request.year,
+        request.optimization_strategy,
+        to_scheduler_solver_parameters(request.solver_parameters),
+        request.base_agenda_id,
+        request.solver,
+    )
+    return _to_job_response(job)
+
+
+@router.get("/jobs/{job_id}", response_model=AgendaJobResponse)
+def get_agenda_job(
+    job_id: UUID,
+    agenda_job_service: AgendaJobService = Depends(get_agenda_job_service),
+):
+    job = agenda_job_service.get_job(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Agenda job not found",
+        )
+    return _to_job_response(job)
+
+
+@router.get("/jobs/{job_id}/solutions")
+def stream_agenda_job_solutions(
+    job_id: UUID,
+    agenda_job_service: AgendaJobService = Depends(get_agenda_job_service),
+):
+    if not agenda_job_service.get_job(job_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Agenda job not found",
+        )
+    return StreamingResponse(
+        _stream_job_events(job_id, agenda_job_service),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
     )
 
 
+@router.post("/jobs/{job_id}/cancel", response_model=AgendaJobResponse)
+def cancel_agenda_job(
+    job_id: UUID,
+    agenda_job_service: AgendaJobService = Depends(get_agenda_job_service),
+):
+    job = agenda_job_service.get_job(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Agenda job not found",
+        )
+    if job.status not in ACTIVE_JOB_STATUSES:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Agenda job is already {job.status}",
+        )
+    job = agenda_job_service.cancel_job(job_id)
+    if job.status != JOB_CANCELLED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Agenda job is already {job.status}",
+        )
+    return _to_job_response(job)
+
+
 @router.get("/{agenda_id}", response_model=AgendaResponse)
 def get_agenda(
     agenda_id: UUID,
@@ -91,6 +231,29 @@ def get_agenda(
             detail="Agenda not found",
         )
 
+    return _to_agenda_response(agenda, agenda_service)
+
+
+@router.get("", response_model=list[AgendaResponse])
+def get_agendas(
+    role_id: UUID | None = Query(None),
+    status: str | None = Query(None),
+    agenda_service: AgendaService = Depends(get_agenda_service),
+):
+    if not role_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="role_id is required",
+        )
+
+    agendas = agenda_service.get_agendas_by_role(role_id, status)
+
+    return [_to_agenda_response(agenda, agenda_service) for agenda in agendas]
+
+
+def _to_agenda_response(
+    agenda: Agenda, agenda_service: AgendaService
+) -> AgendaResponse:
     entries = agenda_service.agenda_repository.get_entries_by_agenda(agenda.id)
     coverage = agenda_service.agenda_repository.get_coverage_by_agenda(agenda.id)
 
@@ -100,6 +263,7 @@ def get_agenda(
         status=agenda.status,
         created_at=agenda.created_at,
         updated_at=agenda.updated_at,
+        solver_stats=agenda.solver_stats,
         entries=[
             AgendaEntryResponse(
                 id=e.id,
@@ -128,58 +292,93 @@ def get_agenda(
     )
 
 
-@router.get("", response_model=list[AgendaResponse])
-def get_agendas(
-    role_id: UUID | None = Query(None),
-    status: str | None = Query(None),
-    agenda_service: AgendaService = Depends(get_agenda_service),
-):
-    if not role_id:
+def _validate_generate_request(
+    request: AgendaGenerateRequest, agenda_service: AgendaService
+) -> None:
+    _validate_solver_options(request.optimization_strategy, request.solver)
+
+    if request.base_agenda_id:
+        base_agenda = agenda_service.get_agenda_with_details(request.base_agenda_id)
+        if not base_agenda or base_agenda.role_id != request.role_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Base agenda not found for this role",
+            )
+
+
+def _validate_solver_options(optimization_strategy: str, solver: str) -> None:
+    if optimization_strategy not in [
+        "maximize_coverage",
+        "minimize_gaps",
+        "balance_workload",
+        "lexicographic",
+    ]:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="role_id is required",
+            detail="Invalid optimization strategy. Must be one of: maximize_coverage, minimize_gaps, balance_workload, lexicographic",
         )
 
-    agendas = agenda_service.get_agendas_by_role(role_id, status)
-
-    result = []
-    for agenda in agendas:
-        entries = agenda_service.agenda_repository.get_entries_by_agenda(agenda.id)
-        coverage = agenda_service.agenda_repository.get_coverage_by_agenda(agenda.id)
-        result.append(
-            AgendaResponse(
-                id=agenda.id,
-                role_id=agenda.role_id,
-                status=agenda.status,
-                created_at=agenda.created_at,
-                updated_at=agenda.updated_at,
-                entries=[
-                    AgendaEntryResponse(
-                        id=e.id,
-                        agenda_id=e.agenda_id,
-                        person_id=e.person_id,
-                        date=e.date,
-                        start_time=e.start_time,
-                        end_time=e.end_time,
-                        role_id=e.role_id,
-                    )
-                    for e in entries
-                ],
-                coverage=[
-                    AgendaCoverageResponse(
-                        id=c.id,
-                        agenda_id=c.agenda_id,
-                        date=c.date,
-                        start_time=c.start_time,
-                        end_time=c.end_time,
-                        role_id=c.role_id,
-                        is_covered=c.is_covered,
-                        required_person_count=c.required_person_count,
-                    )
-                    for c in coverage
-                ],
-            )
+    if solver not in ["cp_sat", "greedy"]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid solver. Must be one of: cp_sat, greedy",
         )
 
-    return result
 
+def _to_job_response(job: AgendaJob) -> AgendaJobResponse:
+    return AgendaJobResponse(
+        id=job.id,
+        role_id=job.role_id,
+        weeks=job.weeks,
+        year=job.year,
+        optimization_strategy=job.optimization_strategy,
+        solver=job.solver,
+        base_agenda_id=job.base_agenda_id,
+        status=job.status,
+        progress=job.progress,
+        agenda_id=job.agenda_id,
+        error=job.error,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+    )
+
+
+async def _stream_job_events(
+    job_id: UUID, agenda_job_service: AgendaJobService
+) -> AsyncIterator[str]:
+    feed = agenda_job_service.get_solution_feed(job_id)
+    if feed:
+        async for solution in feed.follow(
+            settings.agenda_job_stream_heartbeat_seconds
+        ):
+            if solution is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield _format_event("solution", _to_solution_response(solution))
+
+    job = await run_in_threadpool(agenda_job_service.get_job, job_id)
+    yield _format_event("job", _to_job_response(job))
+
+
+def _format_event(event: str, payload: BaseModel) -> str:
+    return f"event: {event}\ndata: {payload.model_dump_json()}\n\n"
+
+
+def _to_solution_response(solution: IntermediateSolution) -> AgendaSolutionResponse:
+    return AgendaSolutionResponse(
+        objective_value=solution.objective_value,
+        best_objective_bound=solution.best_objective_bound,
+        wall_time=solution.wall_time,
+        objective=solution.objective,
+        stage=solution.stage,
+        entries=[
+            AgendaSolutionEntryResponse(
+                person_id=a.person_id,
+                date=a.date,
+                start_time=a.start_time,
+                end_time=a.end_time,
+                role_id=a.role_id,
+            )
+            for a in solution.assignments
+        ],
+    )
@@ -4,6 +4,17 @@ from pathlib import Path
 class Settings:
     database_path: str = "agendalo.db"
     database_url: str = f"sqlite:///{database_path}"
+    solver_max_time_in_seconds: float = 30.0
+    solver_max_time_in_seconds_cap: float = 300.0
+    solver_num_search_workers: int | None = None
+    solver_num_search_workers_cap: int = 16
+    solver_relative_gap_limit: float | None = None
+    solver_log_search_progress: bool = False
+    solver_greedy_hints: bool = False
+    solver_symmetry_breaking: bool = False
+    solver_export_dir: str | None = None
+    agenda_job_max_workers: int = 2
+    agenda_job_stream_heartbeat_seconds: float = 15.0
 
     @classmethod
     def get_database_path(cls) -> str:
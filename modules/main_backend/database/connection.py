@@ -71,6 +71,7 @@ def init_database() -> None:
             id TEXT PRIMARY KEY,
             role_id TEXT NOT NULL,
             status TEXT NOT NULL,
+            solver_stats TEXT,
             created_at TEXT NOT NULL,
             updated_at TEXT NOT NULL,
             FOREIGN KEY(role_id) REFERENCES roles(id)
@@ -107,8 +108,42 @@ def init_database() -> None:
         )
     """)
 
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS agenda_jobs (
+            id TEXT PRIMARY KEY,
+            role_id TEXT NOT NULL,
+            weeks TEXT NOT NULL,
+            year INTEGER NOT NULL,
+            optimization_strategy TEXT NOT NULL,
+            solver TEXT NOT NULL DEFAULT 'cp_sat',
+            solver_parameters TEXT,
+            base_agenda_id TEXT,
+            status TEXT NOT NULL,
+            progress REAL NOT NULL DEFAULT 0,
+            agenda_id TEXT,
+            error TEXT,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            FOREIGN KEY(role_id) REFERENCES roles(id),
+            FOREIGN KEY(agenda_id) REFERENCES agendas(id)
+        )
+    """)
+
+    _add_missing_column(cursor, "agendas", "solver_stats", "TEXT")
+    _add_missing_column(
+        cursor, "agenda_jobs", "solver", "TEXT NOT NULL DEFAULT 'cp_sat'"
+    )
+
     conn.commit()
     conn.close()
 
     seed_database()
 
+
+def _add_missing_column(
+    cursor: sqlite3.Cursor, table: str, column: str, definition: str
+) -> None:
+    columns = {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+    if column not in columns:
+        cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
@@ -51,6 +51,7 @@ class Agenda:
     status: str
     created_at: datetime
     updated_at: datetime
+    solver_stats: dict | None = None
 
 
 @dataclass
@@ -75,3 +76,20 @@ class AgendaCoverage:
     is_covered: bool
     required_person_count: int = 1
 
+
+@dataclass
+class AgendaJob:
+    id: UUID
+    role_id: UUID
+    weeks: list[int]
+    year: int
+    optimization_strategy: str
+    status: str
+    created_at: datetime
+    updated_at: datetime
+    solver: str = "cp_sat"
+    solver_parameters: dict | None = None
+    base_agenda_id: UUID | None = None
+    progress: float = 0.0
+    agenda_id: UUID | None = None
+    error: str | None = None
@@ -1,7 +1,7 @@
 from datetime import date, datetime, time
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
 class PersonCreate(BaseModel):
@@ -112,11 +112,105 @@ class BusinessServiceHoursBulkCreate(BaseModel):
     days: str
 
 
+class SolverParametersRequest(BaseModel):
+    max_time_in_seconds: float | None = Field(None, gt=0)
+    num_search_workers: int | None = Field(None, ge=1)
+    relative_gap_limit: float | None = Field(None, ge=0, le=1)
+    random_seed: int | None = Field(None, ge=0)
+    log_search_progress: bool | None = None
+
+
 class AgendaGenerateRequest(BaseModel):
     role_id: UUID
     weeks: list[int]
     year: int
     optimization_strategy: str
+    solver: str = "cp_sat"
+    solver_parameters: SolverParametersRequest | None = None
+    base_agenda_id: UUID | None = None
+
+
+class AgendaReoptimizeRequest(BaseModel):
+    weeks: list[int]
+    year: int
+    optimization_strategy: str
+    solver: str = "cp_sat"
+    solver_parameters: SolverParametersRequest | None = None
+    person_ids: list[UUID] = []
+    dates: list[date] = []
+
+
+class AgendaCompareRequest(BaseModel):
+    role_id: UUID
+    weeks: list[int]
+    year: int
+    optimization_strategies: list[str] = [
+        "maximize_coverage",
+        "minimize_gaps",
+        "balance_workload",
+    ]
+    solver: str = "cp_sat"
+    solver_parameters: SolverParametersRequest | None = None
+
+
+class AgendaJobResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    role_id: UUID
+    weeks: list[int]
+    year: int
+    optimization_strategy: str
+    solver: str
+    base_agenda_id: UUID | None = None
+    status: str
+    progress: float
+    agenda_id: UUID | None = None
+    error: str | None = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class AgendaSolutionEntryResponse(BaseModel):
+    person_id: UUID
+    date: date
+    start_time: time
+    end_time: time
+    role_id: UUID
+
+
+class AgendaSolutionResponse(BaseModel):
+    objective_value: float
+    best_objective_bound: float
+    wall_time: float
+    objective: str | None = None
+    stage: int = 0
+    entries: list[AgendaSolutionEntryResponse] = []
+
+
+class SolverRunResponse(BaseModel):
+    status: str
+    num_variables: int
+    num_constraints: int
+    objective_value: float
+    best_objective_bound: float
+    num_conflicts: int
+    num_branches: int
+    presolve_time: float | None
+    search_time: float
+    wall_time: float
+    model_file: str | None = None
+    objective: str | None = None
+    stage: int = 0
+
+
+class SolverStatsResponse(BaseModel):
+    phase_times: dict[str, float] = {}
+    num_variables: int
+    num_constraints: int
+    solver_runs: list[SolverRunResponse] = []
+    wall_time: float
+    export_dir: str | None = None
 
 
 class AgendaEntryResponse(BaseModel):
@@ -152,6 +246,13 @@ class AgendaResponse(BaseModel):
     status: str
     created_at: datetime
     updated_at: datetime
+    solver_stats: SolverStatsResponse | None = None
     entries: list[AgendaEntryResponse] = []
     coverage: list[AgendaCoverageResponse] = []
 
+
+class AgendaComparisonResponse(BaseModel):
+    optimization_strategy: str
+    objective_value: float | None = None
+    agenda: AgendaResponse
+
@@ -11,13 +11,19 @@ from modules.main_backend.api.routes import (
     people,
     roles,
 )
+from modules.main_backend.api.dependencies import (
+    get_agenda_job_runner,
+    shutdown_agenda_job_runner,
+)
 from modules.main_backend.database.connection import init_database
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     init_database()
+    get_agenda_job_runner().resume_pending_jobs()
     yield
+    shutdown_agenda_job_runner()
 
 
 app = FastAPI(
@@ -6,6 +6,7 @@ from modules.main_backend.domain.models import (
     Agenda,
     AgendaCoverage,
     AgendaEntry,
+    AgendaJob,
     AvailabilityHours,
     BusinessServiceHours,
     Person,
@@ -134,3 +135,24 @@ class AgendaRepository(ABC):
     def update_status(self, agenda_id: UUID, status: str) -> bool:
         pass
 
+
+class AgendaJobRepository(ABC):
+    @abstractmethod
+    def create(self, job: AgendaJob) -> AgendaJob:
+        pass
+
+    @abstractmethod
+    def get_by_id(self, job_id: UUID) -> AgendaJob | None:
+        pass
+
+    @abstractmethod
+    def get_by_statuses(self, statuses: list[str]) -> list[AgendaJob]:
+        pass
+
+    @abstractmethod
+    def update(self, job: AgendaJob) -> AgendaJob:
+        pass
+
+    @abstractmethod
+    def update_if_status(self, job: AgendaJob, statuses: list[str]) -> bool:
+        pass
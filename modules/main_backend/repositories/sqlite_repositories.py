@@ -1,3 +1,4 @@
+import json
 import sqlite3
 from datetime import date, datetime, time
 from uuid import UUID, uuid4
@@ -6,12 +7,14 @@ from modules.main_backend.domain.models import (
     Agenda,
     AgendaCoverage,
     AgendaEntry,
+    AgendaJob,
     AvailabilityHours,
     BusinessServiceHours,
     Person,
     Role,
 )
 from modules.main_backend.repositories.interfaces import (
+    AgendaJobRepository,
     AgendaRepository,
     AvailabilityHoursRepository,
     BusinessServiceHoursRepository,
@@ -300,11 +303,12 @@ class SQLiteAgendaRepository(AgendaRepository):
     def create(self, agenda: Agenda) -> Agenda:
         cursor = self.conn.cursor()
         cursor.execute(
-            "INSERT INTO agendas (id, role_id, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+            "INSERT INTO agendas (id, role_id, status, solver_stats, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
             (
                 str(agenda.id),
                 str(agenda.role_id),
                 agenda.status,
+                json.dumps(agenda.solver_stats) if agenda.solver_stats else None,
                 agenda.created_at.isoformat(),
                 agenda.updated_at.isoformat(),
             ),
@@ -317,29 +321,14 @@ class SQLiteAgendaRepository(AgendaRepository):
         cursor.execute("SELECT * FROM agendas WHERE id = ?", (str(agenda_id),))
         row = cursor.fetchone()
         if row:
-            return Agenda(
-                id=UUID(row["id"]),
-                role_id=UUID(row["role_id"]),
-                status=row["status"],
-                created_at=datetime.fromisoformat(row["created_at"]),
-                updated_at=datetime.fromisoformat(row["updated_at"]),
-            )
+            return self._row_to_agenda(row)
         return None
 
     def get_by_role(self, role_id: UUID) -> list[Agenda]:
         cursor = self.conn.cursor()
         cursor.execute("SELECT * FROM agendas WHERE role_id = ?", (str(role_id),))
         rows = cursor.fetchall()
-        return [
-            Agenda(
-                id=UUID(row["id"]),
-                role_id=UUID(row["role_id"]),
-                status=row["status"],
-                created_at=datetime.fromisoformat(row["created_at"]),
-                updated_at=datetime.fromisoformat(row["updated_at"]),
-            )
-            for row in rows
-        ]
+        return [self._row_to_agenda(row) for row in rows]
 
     def get_by_role_and_status(self, role_id: UUID, status: str) -> list[Agenda]:
         cursor = self.conn.cursor()
@@ -348,16 +337,7 @@ class SQLiteAgendaRepository(AgendaRepository):
             (str(role_id), status),
         )
         rows = cursor.fetchall()
-        return [
-            Agenda(
-                id=UUID(row["id"]),
-                role_id=UUID(row["role_id"]),
-                status=row["status"],
-                created_at=datetime.fromisoformat(row["created_at"]),
-                updated_at=datetime.fromisoformat(row["updated_at"]),
-            )
-            for row in rows
-        ]
+        return [self._row_to_agenda(row) for row in rows]
 
     def create_entry(self, entry: AgendaEntry) -> AgendaEntry:
         cursor = self.conn.cursor()
@@ -446,3 +426,119 @@ class SQLiteAgendaRepository(AgendaRepository):
         self.conn.commit()
         return cursor.rowcount > 0
 
+    def _row_to_agenda(self, row: sqlite3.Row) -> Agenda:
+        return Agenda(
+            id=UUID(row["id"]),
+            role_id=UUID(row["role_id"]),
+            status=row["status"],
+            created_at=datetime.fromisoformat(row["created_at"]),
+            updated_at=datetime.fromisoformat(row["updated_at"]),
+            solver_stats=json.loads(row["solver_stats"]) if row["solver_stats"] else None,
+        )
+
+
+class SQLiteAgendaJobRepository(AgendaJobRepository):
+    def __init__(self, connection: sqlite3.Connection):
+        self.conn = connection
+
+    def create(self, job: AgendaJob) -> AgendaJob:
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """INSERT INTO agenda_jobs (id, role_id, weeks, year, optimization_strategy, solver,
+               solver_parameters, base_agenda_id, status, progress, agenda_id, error, created_at, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                str(job.id),
+                str(job.role_id),
+                json.dumps(job.weeks),
+                job.year,
+                job.optimization_strategy,
+                job.solver,
+                json.dumps(job.solver_parameters) if job.solver_parameters is not None else None,
+                str(job.base_agenda_id) if job.base_agenda_id else None,
+                job.status,
+                job.progress,
+                str(job.agenda_id) if job.agenda_id else None,
+                job.error,
+                job.created_at.isoformat(),
+                job.updated_at.isoformat(),
+            ),
+        )
+        self.conn.commit()
+        return job
+
+    def get_by_id(self, job_id: UUID) -> AgendaJob | None:
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT * FROM agenda_jobs WHERE id = ?", (str(job_id),))
+        row = cursor.fetchone()
+        if row:
+            return self._row_to_job(row)
+        return None
+
+    def get_by_statuses(self, statuses: list[str]) -> list[AgendaJob]:
+        cursor = self.conn.cursor()
+        placeholders = ", ".join("?" for _ in statuses)
+        cursor.execute(
+            f"SELECT * FROM agenda_jobs WHERE status IN ({placeholders}) ORDER BY created_at",
+            tuple(statuses),
+        )
+        rows = cursor.fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def update(self, job: AgendaJob) -> AgendaJob:
+        job.updated_at = datetime.now()
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """UPDATE agenda_jobs SET status = ?, progress = ?, agenda_id = ?, error = ?, updated_at = ?
+               WHERE id = ?""",
+            (
+                job.status,
+                job.progress,
+                str(job.agenda_id) if job.agenda_id else None,
+                job.error,
+                job.updated_at.isoformat(),
+                str(job.id),
+            ),
+        )
+        self.conn.commit()
+        return job
+
+    def update_if_status(self, job: AgendaJob, statuses: list[str]) -> bool:
+        job.updated_at = datetime.now()
+        placeholders = ", ".join("?" for _ in statuses)
+        cursor = self.conn.cursor()
+        cursor.execute(
+            f"""UPDATE agenda_jobs SET status = ?, progress = ?, agenda_id = ?, error = ?, updated_at = ?
+               WHERE id = ? AND status IN ({placeholders})""",
+            (
+                job.status,
+                job.progress,
+                str(job.agenda_id) if job.agenda_id else None,
+                job.error,
+                job.updated_at.isoformat(),
+                str(job.id),
+                *statuses,
+            ),
+        )
+        self.conn.commit()
+        return cursor.rowcount > 0
+
+    def _row_to_job(self, row: sqlite3.Row) -> AgendaJob:
+        return AgendaJob(
+            id=UUID(row["id"]),
+            role_id=UUID(row["role_id"]),
+            weeks=json.loads(row["weeks"]),
+            year=row["year"],
+            optimization_strategy=row["optimization_strategy"],
+            solver=row["solver"],
+            status=row["status"],
+            created_at=datetime.fromisoformat(row["created_at"]),
+            updated_at=datetime.fromisoformat(row["updated_at"]),
+            solver_parameters=(
+                json.loads(row["solver_parameters"]) if row["solver_parameters"] else None
+            ),
+            base_agenda_id=UUID(row["base_agenda_id"]) if row["base_agenda_id"] else None,
+            progress=row["progress"],
+            agenda_id=UUID(row["agenda_id"]) if row["agenda_id"] else None,
+            error=row["error"],
+        )
@@ -0,0 +1,174 @@
+import sqlite3
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from threading import Event, Lock
+from typing import Callable, Generator
+from uuid import UUID
+
+from modules.main_backend.domain.models import AgendaJob
+from modules.main_backend.repositories.interfaces import AgendaJobRepository
+from modules.main_backend.repositories.sqlite_repositories import (
+    SQLiteAgendaJobRepository,
+    SQLiteAgendaRepository,
+    SQLiteAvailabilityHoursRepository,
+    SQLiteBusinessServiceHoursRepository,
+    SQLiteRoleRepository,
+)
+from modules.main_backend.services.agenda_service import AgendaService
+from modules.main_backend.services.solution_feed import SolutionFeed
+from modules.scheduler.greedy_scheduler import GreedyScheduler
+from modules.scheduler.interfaces import Scheduler, SolveCancelled
+from modules.scheduler.models import SolverParameters
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+ACTIVE_JOB_STATUSES = [JOB_QUEUED, JOB_RUNNING]
+
+
+class AgendaJobRunner:
+    def __init__(
+        self,
+        connection_factory: Callable[[], Generator[sqlite3.Connection, None, None]],
+        scheduler_factory: Callable[[], Scheduler],
+        max_workers: int,
+        greedy_scheduler_factory: Callable[[], Scheduler] = GreedyScheduler,
+    ):
+        self.connection_factory = contextmanager(connection_factory)
+        self.scheduler_factory = scheduler_factory
+        self.greedy_scheduler_factory = greedy_scheduler_factory
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="agenda-job"
+        )
+        self.futures: dict[UUID, Future] = {}
+        self.feeds: dict[UUID, SolutionFeed] = {}
+        self.stop_events: dict[UUID, Event] = {}
+        self.lock = Lock()
+
+    def submit(self, job_id: UUID) -> None:
+        with self.lock:
+            self.feeds[job_id] = SolutionFeed()
+            self.stop_events[job_id] = Event()
+            self.futures[job_id] = self.executor.submit(self._run, job_id)
+
+    def cancel(self, job_id: UUID) -> None:
+        with self.lock:
+            future = self.futures.get(job_id)
+            stop_event = self.stop_events.get(job_id)
+        if stop_event:
+            stop_event.set()
+        if future and future.cancel():
+            self._release(job_id)
+
+    def get_feed(self, job_id: UUID) -> SolutionFeed | None:
+        with self.lock:
+            return self.feeds.get(job_id)
+
+    def resume_pending_jobs(self) -> list[UUID]:
+        with self.connection_factory() as conn:
+            job_repository = SQLiteAgendaJobRepository(conn)
+            jobs = job_repository.get_by_statuses(ACTIVE_JOB_STATUSES)
+            for job in jobs:
+                if job.status == JOB_RUNNING:
+                    job.status = JOB_QUEUED
+                    job.progress = 0.0
+                    job_repository.update(job)
+
+        for job in jobs:
+            self.submit(job.id)
+        return [job.id for job in jobs]
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job_id: UUID) -> None:
+        with self.lock:
+            stop_event = self.stop_events.get(job_id, Event())
+        try:
+            with self.connection_factory() as conn:
+                self._run_job(job_id, conn, self.get_feed(job_id), stop_event)
+        finally:
+            self._release(job_id)
+
+    def _release(self, job_id: UUID) -> None:
+        with self.lock:
+            self.futures.pop(job_id, None)
+            self.stop_events.pop(job_id, None)
+            feed = self.feeds.pop(job_id, None)
+        if feed:
+            feed.close()
+
+    def _run_job(
+        self,
+        job_id: UUID,
+        conn: sqlite3.Connection,
+        feed: SolutionFeed | None,
+        stop_event: Event,
+    ) -> None:
+        job_repository = SQLiteAgendaJobRepository(conn)
+        job = job_repository.get_by_id(job_id)
+        if not job or job.status != JOB_QUEUED:
+            return
+
+        job.status = JOB_RUNNING
+        job.progress = 0.0
+        if not job_repository.update_if_status(job, [JOB_QUEUED]):
+            return
+
+        agenda_service = AgendaService(
+            SQLiteAgendaRepository(conn),
+            SQLiteAvailabilityHoursRepository(conn),
+            SQLiteBusinessServiceHoursRepository(conn),
+            SQLiteRoleRepository(conn),
+            self.scheduler_factory(),
+            self.greedy_scheduler_factory(),
+        )
+
+        try:
+            agenda = agenda_service.generate_draft_agenda(
+                job.role_id,
+                job.weeks,
+                job.year,
+                job.optimization_strategy,
+                SolverParameters(**job.solver_parameters)
+                if job.solver_parameters
+                else None,
+                job.base_agenda_id,
+                lambda progress: self._report_progress(
+                    job_repository, job, stop_event, progress
+                ),
+                feed.publish if feed else None,
+                job.solver,
+                stop_event.is_set,
+            )
+        except SolveCancelled:
+            return
+        except Exception as error:
+            job.status = JOB_FAILED
+            job.error = str(error)
+            job_repository.update_if_status(job, [JOB_RUNNING])
+            return
+
+        if agenda:
+            job.status = JOB_COMPLETED
+            job.progress = 1.0
+            job.agenda_id = agenda.id
+        else:
+            job.status = JOB_FAILED
+            job.error = "Role not found or no availability/business service hours available"
+        job_repository.update_if_status(job, [JOB_RUNNING])
+
+    def _report_progress(
+        self,
+        job_repository: AgendaJobRepository,
+        job: AgendaJob,
+        stop_event: Event,
+        progress: float,
+    ) -> None:
+        job.progress = progress
+        if stop_event.is_set() or not job_repository.update_if_status(
+            job, [JOB_RUNNING]
+        ):
+            raise SolveCancelled()
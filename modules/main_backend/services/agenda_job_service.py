@@ -0,0 +1,68 @@
+from dataclasses import asdict
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from modules.main_backend.domain.models import AgendaJob
+from modules.main_backend.repositories.interfaces import AgendaJobRepository
+from modules.main_backend.services.agenda_job_runner import (
+    ACTIVE_JOB_STATUSES,
+    JOB_CANCELLED,
+    JOB_QUEUED,
+    AgendaJobRunner,
+)
+from modules.main_backend.services.solution_feed import SolutionFeed
+from modules.scheduler.models import SolverParameters
+
+
+class AgendaJobService:
+    def __init__(
+        self,
+        agenda_job_repository: AgendaJobRepository,
+        agenda_job_runner: AgendaJobRunner,
+    ):
+        self.agenda_job_repository = agenda_job_repository
+        self.agenda_job_runner = agenda_job_runner
+
+    def submit_job(
+        self,
+        role_id: UUID,
+        weeks: list[int],
+        year: int,
+        optimization_strategy: str,
+        solver_parameters: SolverParameters | None = None,
+        base_agenda_id: UUID | None = None,
+        solver: str = "cp_sat",
+    ) -> AgendaJob:
+        job = AgendaJob(
+            id=uuid4(),
+            role_id=role_id,
+            weeks=weeks,
+            year=year,
+            optimization_strategy=optimization_strategy,
+            solver=solver,
+            status=JOB_QUEUED,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+            solver_parameters=asdict(solver_parameters) if solver_parameters else None,
+            base_agenda_id=base_agenda_id,
+        )
+        job = self.agenda_job_repository.create(job)
+        self.agenda_job_runner.submit(job.id)
+        return job
+
+    def get_job(self, job_id: UUID) -> AgendaJob | None:
+        return self.agenda_job_repository.get_by_id(job_id)
+
+    def get_solution_feed(self, job_id: UUID) -> SolutionFeed | None:
+        return self.agenda_job_runner.get_feed(job_id)
+
+    def cancel_job(self, job_id: UUID) -> AgendaJob | None:
+        job = self.agenda_job_repository.get_by_id(job_id)
+        if not job or job.status not in ACTIVE_JOB_STATUSES:
+            return job
+
+        job.status = JOB_CANCELLED
+        if not self.agenda_job_repository.update_if_status(job, ACTIVE_JOB_STATUSES):
+            return self.agenda_job_repository.get_by_id(job_id)
+        self.agenda_job_runner.cancel(job.id)
+        return job
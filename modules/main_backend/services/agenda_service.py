@@ -1,5 +1,7 @@
 from collections import defaultdict
+from dataclasses import asdict
 from datetime import date, datetime, timedelta, time
+from typing import Callable
 from uuid import UUID, uuid4
 
 from modules.main_backend.domain.models import Agenda, AgendaCoverage, AgendaEntry
@@ -10,10 +12,18 @@ from modules.main_backend.repositories.interfaces import (
     RoleRepository,
 )
 from modules.main_backend.services.scheduler_adapter import (
+    to_scheduler_assignment,
     to_scheduler_availability_hours,
     to_scheduler_business_service_hours,
 )
-from modules.scheduler.interfaces import Assignment, Scheduler
+from modules.scheduler.interfaces import (
+    Assignment,
+    IntermediateSolution,
+    Scheduler,
+    ScheduleResult,
+)
+from modules.scheduler.models import SolverParameters
+from modules.scheduler.neighborhood import ChangeSet
 
 
 class AgendaService:
@@ -24,16 +34,146 @@ class AgendaService:
         business_service_hours_repository: BusinessServiceHoursRepository,
         role_repository: RoleRepository,
         scheduler: Scheduler,
+        greedy_scheduler: Scheduler | None = None,
     ):
         self.agenda_repository = agenda_repository
         self.availability_hours_repository = availability_hours_repository
         self.business_service_hours_repository = business_service_hours_repository
         self.role_repository = role_repository
         self.scheduler = scheduler
+        self.greedy_scheduler = greedy_scheduler
 
     def generate_draft_agenda(
-        self, role_id: UUID, weeks: list[int], year: int, optimization_strategy: str
+        self,
+        role_id: UUID,
+        weeks: list[int],
+        year: int,
+        optimization_strategy: str,
+        solver_parameters: SolverParameters | None = None,
+        base_agenda_id: UUID | None = None,
+        on_progress: Callable[[float], None] | None = None,
+        on_solution: Callable[[IntermediateSolution], None] | None = None,
+        solver: str = "cp_sat",
+        should_stop: Callable[[], bool] | None = None,
+    ) -> Agenda | None:
+        inputs = self._load_scheduler_inputs(role_id, weeks, year)
+        if not inputs:
+            return None
+
+        scheduler_availability_hours, business_service_hours = inputs
+        scheduler_business_service_hours = [
+            to_scheduler_business_service_hours(bsh) for bsh in business_service_hours
+        ]
+
+        hints = (
+            self._get_base_agenda_hints(base_agenda_id) if base_agenda_id else None
+        )
+
+        if on_progress:
+            on_progress(0.1)
+
+        result = self._select_scheduler(solver).solve(
+            scheduler_availability_hours,
+            scheduler_business_service_hours,
+            weeks,
+            year,
+            optimization_strategy,
+            solver_parameters,
+            hints,
+            on_solution,
+            should_stop,
+        )
+
+        if on_progress:
+            on_progress(0.8)
+
+        return self._create_draft_agenda(
+            role_id, weeks, year, business_service_hours, result
+        )
+
+    def reoptimize_agenda(
+        self,
+        agenda_id: UUID,
+        weeks: list[int],
+        year: int,
+        optimization_strategy: str,
+        change_set: ChangeSet,
+        solver_parameters: SolverParameters | None = None,
+        solver: str = "cp_sat",
     ) -> Agenda | None:
+        agenda = self.agenda_repository.get_by_id(agenda_id)
+        if not agenda:
+            return None
+
+        inputs = self._load_scheduler_inputs(agenda.role_id, weeks, year)
+        if not inputs:
+            return None
+
+        scheduler_availability_hours, business_service_hours = inputs
+        result = self._select_scheduler(solver).reoptimize(
+            scheduler_availability_hours,
+            [to_scheduler_business_service_hours(bsh) for bsh in business_service_hours],
+            weeks,
+            year,
+            optimization_strategy,
+            self._get_base_agenda_hints(agenda_id),
+            change_set,
+            solver_parameters,
+        )
+        return self._create_draft_agenda(
+            agenda.role_id, weeks, year, business_service_hours, result
+        )
+
+    def compare_draft_agendas(
+        self,
+        role_id: UUID,
+        weeks: list[int],
+        year: int,
+        optimization_strategies: list[str],
+        solver_parameters: SolverParameters | None = None,
+        solver: str = "cp_sat",
+    ) -> list[tuple[str, Agenda, float | None]] | None:
+        inputs = self._load_scheduler_inputs(role_id, weeks, year)
+        if not inputs:
+            return None
+
+        scheduler_availability_hours, business_service_hours = inputs
+        results = self._select_scheduler(solver).compare(
+            scheduler_availability_hours,
+            [to_scheduler_business_service_hours(bsh) for bsh in business_service_hours],
+            weeks,
+            year,
+            optimization_strategies,
+            solver_parameters,
+        )
+        return [
+            (
+                strategy,
+                self._create_draft_agenda(
+                    role_id, weeks, year, business_service_hours, result
+                ),
+                result.objective_value,
+            )
+            for strategy, result in results.items()
+        ]
+
+    def get_agenda_with_details(self, agenda_id: UUID) -> Agenda | None:
+        agenda = self.agenda_repository.get_by_id(agenda_id)
+        return agenda
+
+    def get_agendas_by_role(self, role_id: UUID, status: str | None = None) -> list[Agenda]:
+        if status:
+            return self.agenda_repository.get_by_role_and_status(role_id, status)
+        return self.agenda_repository.get_by_role(role_id)
+
+    def _select_scheduler(self, solver: str) -> Scheduler:
+        if solver == "greedy" and self.greedy_scheduler:
+            return self.greedy_scheduler
+        return self.scheduler
+
+    def _load_scheduler_inputs(
+        self, role_id: UUID, weeks: list[int], year: int
+    ) -> tuple[list, list] | None:
         role = self.role_repository.get_by_id(role_id)
         if not role:
             return None
@@ -64,31 +204,30 @@ class AgendaService:
         if not availability_hours or not business_service_hours:
             return None
 
-        scheduler_availability_hours = [
-            to_scheduler_availability_hours(ah) for ah in availability_hours
-        ]
-        scheduler_business_service_hours = [
-            to_scheduler_business_service_hours(bsh) for bsh in business_service_hours
-        ]
-
-        assignments = self.scheduler.optimize(
-            scheduler_availability_hours,
-            scheduler_business_service_hours,
-            weeks,
-            year,
-            optimization_strategy,
+        return (
+            [to_scheduler_availability_hours(ah) for ah in availability_hours],
+            business_service_hours,
         )
 
+    def _create_draft_agenda(
+        self,
+        role_id: UUID,
+        weeks: list[int],
+        year: int,
+        business_service_hours: list,
+        result: ScheduleResult,
+    ) -> Agenda:
         agenda = Agenda(
             id=uuid4(),
             role_id=role_id,
             status="draft",
             created_at=datetime.now(),
             updated_at=datetime.now(),
+            solver_stats=asdict(result.stats),
         )
         agenda = self.agenda_repository.create(agenda)
 
-        for assignment in assignments:
+        for assignment in result.assignments:
             entry = AgendaEntry(
                 id=uuid4(),
                 agenda_id=agenda.id,
@@ -101,21 +240,20 @@ class AgendaService:
             self.agenda_repository.create_entry(entry)
 
         coverage = self._calculate_coverage(
-            business_service_hours, assignments, date_range, agenda.id, role_id
+            business_service_hours,
+            result.assignments,
+            self._get_date_range_for_weeks(weeks, year),
+            agenda.id,
+            role_id,
         )
         for cov in coverage:
             self.agenda_repository.create_coverage(cov)
 
         return agenda
 
-    def get_agenda_with_details(self, agenda_id: UUID) -> Agenda | None:
-        agenda = self.agenda_repository.get_by_id(agenda_id)
-        return agenda
-
-    def get_agendas_by_role(self, role_id: UUID, status: str | None = None) -> list[Agenda]:
-        if status:
-            return self.agenda_repository.get_by_role_and_status(role_id, status)
-        return self.agenda_repository.get_by_role(role_id)
+    def _get_base_agenda_hints(self, base_agenda_id: UUID) -> list[Assignment]:
+        entries = self.agenda_repository.get_entries_by_agenda(base_agenda_id)
+        return [to_scheduler_assignment(entry) for entry in entries]
 
     def _get_date_range_for_weeks(self, weeks: list[int], year: int) -> list[date]:
         dates = []
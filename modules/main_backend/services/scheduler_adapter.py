@@ -1,7 +1,12 @@
+from modules.main_backend.config import settings
+from modules.main_backend.domain.models import AgendaEntry
 from modules.main_backend.domain.models import AvailabilityHours as DomainAvailabilityHours
 from modules.main_backend.domain.models import BusinessServiceHours as DomainBusinessServiceHours
 from modules.scheduler.models import AvailabilityHours as SchedulerAvailabilityHours
+from modules.main_backend.domain.schemas import SolverParametersRequest
+from modules.scheduler.interfaces import Assignment
 from modules.scheduler.models import BusinessServiceHours as SchedulerBusinessServiceHours
+from modules.scheduler.models import SolverParameters
 
 
 def to_scheduler_availability_hours(
@@ -36,3 +41,46 @@ def to_scheduler_business_service_hours(
         specific_date=domain_bsh.specific_date,
     )
 
+
+def to_scheduler_assignment(entry: AgendaEntry) -> Assignment:
+    return Assignment(
+        person_id=entry.person_id,
+        date=entry.date,
+        start_time=entry.start_time,
+        end_time=entry.end_time,
+        role_id=entry.role_id,
+    )
+
+
+def to_scheduler_solver_parameters(
+    request: SolverParametersRequest | None,
+) -> SolverParameters:
+    request = request or SolverParametersRequest()
+    max_time_in_seconds = request.max_time_in_seconds or settings.solver_max_time_in_seconds
+    num_search_workers = (
+        request.num_search_workers
+        if request.num_search_workers is not None
+        else settings.solver_num_search_workers
+    )
+    log_search_progress = (
+        request.log_search_progress
+        if request.log_search_progress is not None
+        else settings.solver_log_search_progress
+    )
+    return SolverParameters(
+        max_time_in_seconds=min(
+            max_time_in_seconds, settings.solver_max_time_in_seconds_cap
+        ),
+        num_search_workers=(
+            min(num_search_workers, settings.solver_num_search_workers_cap)
+            if num_search_workers is not None
+            else None
+        ),
+        relative_gap_limit=(
+            request.relative_gap_limit
+            if request.relative_gap_limit is not None
+            else settings.solver_relative_gap_limit
+        ),
+        random_seed=request.random_seed,
+        log_search_progress=log_search_progress,
+    )
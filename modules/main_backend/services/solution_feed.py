@@ -0,0 +1,60 @@
+import asyncio
+from threading import Lock
+from typing import AsyncIterator, Callable
+
+from modules.scheduler.interfaces import IntermediateSolution
+
+
+class SolutionFeed:
+    def __init__(self):
+        self.lock = Lock()
+        self.latest: IntermediateSolution | None = None
+        self.version = 0
+        self.closed = False
+        self.listeners: list[Callable[[], None]] = []
+
+    def publish(self, solution: IntermediateSolution) -> None:
+        with self.lock:
+            self.latest = solution
+            self.version += 1
+            self._notify()
+
+    def close(self) -> None:
+        with self.lock:
+            self.closed = True
+            self._notify()
+
+    async def follow(
+        self, heartbeat_seconds: float
+    ) -> AsyncIterator[IntermediateSolution | None]:
+        loop = asyncio.get_running_loop()
+        changes: asyncio.Queue[None] = asyncio.Queue()
+
+        def notify() -> None:
+            loop.call_soon_threadsafe(changes.put_nowait, None)
+
+        with self.lock:
+            self.listeners.append(notify)
+        try:
+            seen_version = 0
+            while True:
+                with self.lock:
+                    version, latest, closed = self.version, self.latest, self.closed
+
+                if version != seen_version:
+                    seen_version = version
+                    yield latest
+                elif closed:
+                    return
+                else:
+                    try:
+                        await asyncio.wait_for(changes.get(), heartbeat_seconds)
+                    except asyncio.TimeoutError:
+                        yield None
+        finally:
+            with self.lock:
+                self.listeners.remove(notify)
+
+    def _notify(self) -> None:
+        for listener in self.listeners:
+            listener()
@@ -4,9 +4,11 @@ from typing import Generator
 import pytest
 from fastapi.testclient import TestClient
 
-from modules.main_backend.api.dependencies import get_db_connection
+from modules.main_backend.api.dependencies import get_agenda_job_runner, get_db_connection
 from modules.main_backend.database.connection import get_db_connection as original_get_db_connection
 from modules.main_backend.main import app
+from modules.main_backend.services.agenda_job_runner import AgendaJobRunner
+from modules.scheduler.or_tools_scheduler import ORToolsScheduler
 
 
 _shared_test_conn: sqlite3.Connection | None = None
@@ -72,6 +74,7 @@ def _get_test_db_connection() -> Generator[sqlite3.Connection, None, None]:
                 id TEXT PRIMARY KEY,
                 role_id TEXT NOT NULL,
                 status TEXT NOT NULL,
+                solver_stats TEXT,
                 created_at TEXT NOT NULL,
                 updated_at TEXT NOT NULL,
                 FOREIGN KEY(role_id) REFERENCES roles(id)
@@ -108,6 +111,27 @@ def _get_test_db_connection() -> Generator[sqlite3.Connection, None, None]:
             )
         """)
 
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS agenda_jobs (
+                id TEXT PRIMARY KEY,
+                role_id TEXT NOT NULL,
+                weeks TEXT NOT NULL,
+                year INTEGER NOT NULL,
+                optimization_strategy TEXT NOT NULL,
+                solver TEXT NOT NULL DEFAULT 'cp_sat',
+                solver_parameters TEXT,
+                base_agenda_id TEXT,
+                status TEXT NOT NULL,
+                progress REAL NOT NULL DEFAULT 0,
+                agenda_id TEXT,
+                error TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                FOREIGN KEY(role_id) REFERENCES roles(id),
+                FOREIGN KEY(agenda_id) REFERENCES agendas(id)
+            )
+        """)
+
         _shared_test_conn.commit()
     yield _shared_test_conn
 
@@ -117,6 +141,7 @@ def reset_test_db():
     global _shared_test_conn
     if _shared_test_conn:
         cursor = _shared_test_conn.cursor()
+        cursor.execute("DELETE FROM agenda_jobs")
         cursor.execute("DELETE FROM agenda_entries")
         cursor.execute("DELETE FROM agenda_coverage")
         cursor.execute("DELETE FROM agendas")
@@ -132,11 +157,14 @@ def client() -> Generator[TestClient, None, None]:
     global _shared_test_conn
     _shared_test_conn = None
 
+    agenda_job_runner = AgendaJobRunner(_get_test_db_connection, ORToolsScheduler, 1)
     app.dependency_overrides[get_db_connection] = _get_test_db_connection
+    app.dependency_overrides[get_agenda_job_runner] = lambda: agenda_job_runner
 
     with TestClient(app) as test_client:
         yield test_client
 
+    agenda_job_runner.executor.shutdown(wait=True)
     app.dependency_overrides.clear()
     if _shared_test_conn:
         _shared_test_conn.close()
@@ -1,8 +1,55 @@
+import asyncio
+import json
+import threading
+import time
 from datetime import date, timedelta
 
 import pytest
 from fastapi.testclient import TestClient
 
+from modules.main_backend.api.dependencies import get_agenda_job_runner, get_db_connection
+from modules.main_backend.config import settings
+from modules.main_backend.domain.schemas import SolverParametersRequest
+from modules.main_backend.main import app
+from modules.main_backend.services.agenda_job_runner import AgendaJobRunner
+from modules.main_backend.services.agenda_service import AgendaService
+from modules.main_backend.services.solution_feed import SolutionFeed
+from modules.main_backend.services.scheduler_adapter import to_scheduler_solver_parameters
+from modules.scheduler.case_export import find_cases, load_case
+from modules.scheduler.greedy_scheduler import GreedyScheduler
+from modules.scheduler.interfaces import IntermediateSolution, SolveCancelled
+from modules.scheduler.or_tools_scheduler import ORToolsScheduler
+
+
+class BlockingScheduler(ORToolsScheduler):
+    def __init__(self, release: threading.Event):
+        super().__init__()
+        self.release = release
+
+    def solve(self, *args, **kwargs):
+        self.release.wait(timeout=10)
+        return super().solve(*args, **kwargs)
+
+
+def read_events(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.split("\n\n"):
+        fields = dict(
+            line.split(": ", 1) for line in block.splitlines() if not line.startswith(":")
+        )
+        if "event" in fields:
+            events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def wait_for_job(client: TestClient, job_id: str, statuses: list[str]) -> dict:
+    deadline = time.monotonic() + 10
+    while True:
+        job = client.get(f"/api/agendas/jobs/{job_id}").json()
+        if job["status"] in statuses or time.monotonic() > deadline:
+            return job
+        time.sleep(0.05)
+
 
 @pytest.fixture
 def person_id(client: TestClient) -> str:
@@ -163,6 +210,30 @@ def test_generate_agenda_balance_workload(
     assert "coverage" in data
 
 
+def test_generate_agenda_lexicographic(
+    client: TestClient,
+    role_id: str,
+    setup_availability_and_business_hours,
+):
+    response = client.post(
+        "/api/agendas/generate",
+        json={
+            "role_id": role_id,
+            "weeks": [1],
+            "year": 2024,
+            "optimization_strategy": "lexicographic",
+        },
+    )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["status"] == "draft"
+    assert len(data["entries"]) == 1
+    assert [run["status"] for run in data["solver_stats"]["solver_runs"]] == [
+        "OPTIMAL"
+    ]
+
+
 def test_generate_agenda_invalid_strategy(client: TestClient, role_id: str):
     response = client.post(
         "/api/agendas/generate",
@@ -210,6 +281,44 @@ def test_get_agenda(
     assert "coverage" in data
 
 
+def test_generate_agenda_persists_solver_stats(
+    client: TestClient,
+    role_id: str,
+    setup_availability_and_business_hours,
+):
+    jan1_2024 = date(2024, 1, 1)
+    jan1_weekday = jan1_2024.weekday()
+    days_to_monday = (jan1_weekday - 0) % 7
+    first_monday = jan1_2024 - timedelta(days=days_to_monday)
+    if first_monday.year < 2024:
+        first_monday = first_monday + timedelta(weeks=1)
+    week_number = ((first_monday - date(2024, 1, 1)).days // 7) + 1
+
+    create_response = client.post(
+        "/api/agendas/generate",
+        json={
+            "role_id": role_id,
+            "weeks": [week_number],
+            "year": 2024,
+            "optimization_strategy": "balance_workload",
+        },
+    )
+    assert create_response.status_code == 201
+    agenda_id = create_response.json()["id"]
+
+    response = client.get(f"/api/agendas/{agenda_id}")
+    assert response.status_code == 200
+    stats = response.json()["solver_stats"]
+    assert stats == create_response.json()["solver_stats"]
+    assert {"expansion", "encoding", "variables", "constraints", "search"} <= set(
+        stats["phase_times"]
+    )
+    assert stats["num_variables"] > 0
+    assert stats["num_constraints"] > 0
+    assert stats["wall_time"] > 0
+    assert stats["solver_runs"][0]["status"] in ["OPTIMAL", "FEASIBLE"]
+
+
 def test_get_agenda_not_found(client: TestClient):
     fake_id = "00000000-0000-0000-0000-000000000000"
     response = client.get(f"/api/agendas/{fake_id}")
@@ -275,3 +384,693 @@ def test_get_agendas_by_role_and_status(
     assert len(data) >= 1
     assert all(agenda["status"] == "draft" for agenda in data)
 
+
+def test_generate_agenda_with_solver_parameters(
+    client: TestClient,
+    role_id: str,
+    setup_availability_and_business_hours,
+):
+    jan1_2024 = date(2024, 1, 1)
+    jan1_weekday = jan1_2024.weekday()
+    days_to_monday = (jan1_weekday - 0) % 7
+    first_monday = jan1_2024 - timedelta(days=days_to_monday)
+    if first_monday.year < 2024:
+        first_monday = first_monday + timedelta(weeks=1)
+    week_number = ((first_monday - date(2024, 1, 1)).days // 7) + 1
+
+    response = client.post(
+        "/api/agendas/generate",
+        json={
+            "role_id": role_id,
+            "weeks": [week_number],
+            "year": 2024,
+            "optimization_strategy": "maximize_coverage",
+            "solver_parameters": {
+                "max_time_in_seconds": 5,
+                "num_search_workers": 1,
+                "relative_gap_limit": 0.05,
+                "random_seed": 42,
+            },
+        },
+    )
+
+    assert response.status_code == 201
+    assert len(response.json()["entries"]) > 0
+
+
+def test_solver_parameters_leave_the_worker_split_to_the_scheduler():
+    assert to_scheduler_solver_parameters(None).num_search_workers is None
+    assert (
+        to_scheduler_solver_parameters(
+            SolverParametersRequest(num_search_workers=64)
+        ).num_search_workers
+        == settings.solver_num_search_workers_cap
+    )
+
+
+def test_generate_agenda_invalid_solver_parameters(client: TestClient, role_id: str):
+    response = client.post(
+        "/api/agendas/generate",
+        json={
+            "role_id": role_id,
+            "weeks": [1],
+            "year": 2024,
+            "optimization_strategy": "maximize_coverage",
+            "solver_parameters": {"max_time_in_seconds": 0},
+        },
+    )
+
+    assert response.status_code == 422
+
+
+def test_generate_agenda_from_base_agenda(
+    client: TestClient,
+    role_id: str,
+    setup_availability_and_business_hours,
+):
+    base_response = client.post(
+        "/api/agendas/generate",
+        json={
+            "role_id": role_id,
+            "weeks": [1],
+            "year": 2024,
+            "optimization_strategy": "maximize_coverage",
+        },
+    )
+    base_agenda = base_response.json()
+
+    response = client.post(
+        "/api/agendas/generate",
+        json={
+            "role_id": role_id,
+            "weeks": [1],
+            "year": 2024,
+            "optimization_strategy": "maximize_coverage",
+            "base_agenda_id": base_agenda["id"],
+        },
+    )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["id"] != base_agenda["id"]
+    assert {
+        (e["date"], e["start_time"], e["end_time"]) for e in data["entries"]
+    } == {
+        (e["date"], e["start_time"], e["end_time"]) for e in base_agenda["entries"]
+    }
+
+
+def test_generate_agenda_base_agenda_not_found(
+    client: TestClient,
+    role_id: str,
+    setup_availability_and_business_hours,
+):
+    response = client.post(
+        "/api/agendas/generate",
+        json={
+            "role_id": role_id,
+            "weeks": [1],
+            "year": 2024,
+            "optimization_strategy": "maximize_coverage",
+            "base_agenda_id": "00000000-0000-0000-0000-000000000000",
+        },
+    )
+
+    assert response.status_code == 404
+
+
+def test_reoptimize_agenda_only_changes_affected_dates(
+    client: TestClient,
+    person2_id: str,
+    role_id: str,
+    setup_availability_and_business_hours,
+):
+    base_agenda = client.post(
+        "/api/agendas/generate",
+        json={
+            "role_id": role_id,
+            "weeks": [1],
+            "year": 2024,
+            "optimization_strategy": "balance_workload",
+        },
+    ).json()
+    client.post(
+        f"/api/people/{person2_id}/availability-hours",
+        json={
+            "role_id": role_id,
+            "day_of_week": 1,
+            "start_time": "09:00:00",
+            "end_time": "17:00:00",
+            "is_recurring": True,
+        },
+    )
+    client.post(
+        "/api/business-service-hours",
+        json={
+            "role_id": role_id,
+            "day_of_week": 1,
+            "start_time": "09:00:00",
+            "end_time": "17:00:00",
+            "is_recurring": True,
+        },
+    )
+
+    response = client.post(
+        f"/api/agendas/{base_agenda['id']}/reoptimize",
+        json={
+            "weeks": [1],
+            "year": 2024,
+            "optimization_strategy": "balance_workload",
+            "dates": ["2024-01-02"],
+        },
+    )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["id"] != base_agenda["id"]
+    assert data["status"] == "draft"
+    assert sorted(
+        (e["person_id"], e["date"]) for e in data["entries"]
+    ) == sorted(
+        [(e["person_id"], e["date"]) for e in base_agenda["entries"]]
+        + [(person2_id, "2024-01-02")]
+    )
+    assert all(c["is_covered"] for c in data["coverage"])
+    assert "neighborhood" in data["solver_stats"]["phase_times"]
+
+
+def test_reoptimize_agenda_not_found(client: TestClient):
+    response = client.post(
+        "/api/agendas/00000000-0000-0000-0000-000000000000/reoptimize",
+        json={
+            "weeks": [1],
+            "year": 2024,
+            "optimization_strategy": "balance_workload",
+        },
+    )
+
+    assert response.status_code == 404
+
+
+def test_reoptimize_agenda_invalid_strategy(
+    client: TestClient,
+    role_id: str,
+    setup_availability_and_business_hours,
+):
+    base_agenda = client.post(
+        "/api/agendas/generate",
+        json={
+            "role_id": role_id,
+            "weeks": [1],
+            "year": 2024,
+            "optimization_strategy": "balance_workload",
+        },
+    ).json()
+
+    response = client.post(
+        f"/api/agendas/{base_agenda['id']}/reoptimize",
+        json={"weeks": [1], "year": 2024, "optimization_strategy": "invalid"},
+    )
+
+    assert response.status_code == 400
+
+
+def test_compare_agendas_returns_a_draft_per_strategy(
+    client: TestClient,
+    role_id: str,
+    setup_availability_and_business_hours,
+):
+    response = client.post(
+        "/api/agendas/compare",
+        json={"role_id": role_id, "weeks": [1], "year": 2024},
+    )
+
+    assert response.status_code == 201
+    comparisons = response.json()
+    assert [c["optimization_strategy"] for c in comparisons] == [
+        "maximize_coverage",
+        "minimize_gaps",
+        "balance_workload",
+    ]
+    assert len({c["agenda"]["id"] for c in comparisons}) == 3
+    for comparison in comparisons:
+        assert comparison["agenda"]["status"] == "draft"
+        assert len(comparison["agenda"]["entries"]) == 1
+        assert comparison["agenda"]["solver_stats"]["phase_times"]["encoding"] >= 0
+    assert [c["objective_value"] for c in comparisons] == [1, 0, -8]
+
+    agendas = client.get(f"/api/agendas?role_id={role_id}").json()
+    assert len(agendas) == 3
+
+
+def test_compare_agendas_with_selected_strategies(
+    client: TestClient,
+    role_id: str,
+    setup_availability_and_business_hours,
+):
+    response = client.post(
+        "/api/agendas/compare",
+        json={
+            "role_id": role_id,
+            "weeks": [1],
+            "year": 2024,
+            "optimization_strategies": ["balance_workload", "minimize_gaps"],
+            "solver": "greedy",
+        },
+    )
+
+    assert response.status_code == 201
+    assert [c["optimization_strategy"] for c in response.json()] == [
+        "balance_workload",
+        "minimize_gaps",
+    ]
+    assert [c["objective_value"] for c in response.json()] == [-8, 0]
+
+
+def test_compare_agendas_invalid_strategy(client: TestClient, role_id: str):
+    response = client.post(
+        "/api/agendas/compare",
+        json={
+            "role_id": role_id,
+            "weeks": [1],
+            "year": 2024,
+            "optimization_strategies": ["minimize_gaps", "invalid_strategy"],
+        },
+    )
+
+    assert response.status_code == 400
+
+
+def test_compare_agendas_without_availability(client: TestClient, role_id: str):
+    response = client.post(
+        "/api/agendas/compare",
+        json={"role_id": role_id, "weeks": [1], "year": 2024},
+    )
+
+    assert response.status_code == 404
+
+
+def test_generate_agenda_keeps_partial_schedule_when_a_slot_is_uncoverable(
+    client: TestClient,
+    role_id: str,
+    setup_availability_and_business_hours,
+):
+    client.post(
+        "/api/business-service-hours",
+        json={
+            "role_id": role_id,
+            "day_of_week": 1,
+            "start_time": "09:00:00",
+            "end_time": "17:00:00",
+            "is_recurring": True,
+        },
+    )
+
+    response = client.post(
+        "/api/agendas/generate",
+        json={
+            "role_id": role_id,
+            "weeks": [1],
+            "year": 2024,
+            "optimization_strategy": "balance_workload",
+        },
+    )
+
+    assert response.status_code == 201
+    assert [e["date"] for e in response.json()["entries"]] == ["2024-01-01"]
+
+
+def test_generate_agenda_with_greedy_solver(
+    client: TestClient,
+    role_id: str,
+    setup_availability_and_business_hours,
+):
+    response = client.post(
+        "/api/agendas/generate",
+        json={
+            "role_id": role_id,
+            "weeks": [1],
+            "year": 2024,
+            "optimization_strategy": "balance_workload",
+            "solver": "greedy",
+        },
+    )
+
+    assert response.status_code == 201
+    assert len(response.json()["entries"]) == 1
+    assert all(c["is_covered"] for c in response.json()["coverage"])
+
+
+def test_generate_agenda_invalid_solver(client: TestClient, role_id: str):
+    response = client.post(
+        "/api/agendas/generate",
+        json={
+            "role_id": role_id,
+            "weeks": [1],
+            "year": 2024,
+            "optimization_strategy": "maximize_coverage",
+            "solver": "simulated_annealing",
+        },
+    )
+
+    assert response.status_code == 400
+
+
+def test_submit_agenda_job_completes_in_background(
+    client: TestClient,
+    role_id: str,
+    setup_availability_and_business_hours,
+):
+    response = client.post(
+        "/api/agendas/jobs",
+        json={
+            "role_id": role_id,
+            "weeks": [1],
+            "year": 2024,
+            "optimization_strategy": "maximize_coverage",
+        },
+    )
+
+    assert response.status_code == 202
+    assert response.json()["status"] in ["queued", "running", "completed"]
+
+    job = wait_for_job(client, response.json()["id"], ["completed", "failed"])
+
+    assert job["status"] == "completed"
+    assert job["solver"] == "cp_sat"
+    assert job["progress"] == 1.0
+    agenda = client.get(f"/api/agendas/{job['agenda_id']}").json()
+    assert agenda["role_id"] == role_id
+    assert len(agenda["entries"]) > 0
+
+
+def test_submit_agenda_job_invalid_strategy(client: TestClient, role_id: str):
+    response = client.post(
+        "/api/agendas/jobs",
+        json={
+            "role_id": role_id,
+            "weeks": [1],
+            "year": 2024,
+            "optimization_strategy": "invalid_strategy",
+        },
+    )
+
+    assert response.status_code == 400
+
+
+def test_agenda_job_fails_without_availability(client: TestClient, role_id: str):
+    response = client.post(
+        "/api/agendas/jobs",
+        json={
+            "role_id": role_id,
+            "weeks": [1],
+            "year": 2024,
+            "optimization_strategy": "maximize_coverage",
+        },
+    )
+
+    job = wait_for_job(client, response.json()["id"], ["completed", "failed"])
+
+    assert job["status"] == "failed"
+    assert job["agenda_id"] is None
+    assert job["error"]
+
+
+def test_get_agenda_job_not_found(client: TestClient):
+    response = client.get("/api/agendas/jobs/00000000-0000-0000-0000-000000000000")
+
+    assert response.status_code == 404
+
+
+def test_cancel_agenda_jobs(
+    client: TestClient,
+    role_id: str,
+    setup_availability_and_business_hours,
+):
+    release = threading.Event()
+    runner = AgendaJobRunner(
+        app.dependency_overrides[get_db_connection],
+        lambda: BlockingScheduler(release),
+        1,
+    )
+    app.dependency_overrides[get_agenda_job_runner] = lambda: runner
+    request = {
+        "role_id": role_id,
+        "weeks": [1],
+        "year": 2024,
+        "optimization_strategy": "maximize_coverage",
+    }
+
+    running_id = client.post("/api/agendas/jobs", json=request).json()["id"]
+    assert wait_for_job(client, running_id, ["running"])["status"] == "running"
+    queued_id = client.post("/api/agendas/jobs", json=request).json()["id"]
+
+    assert client.post(f"/api/agendas/jobs/{queued_id}/cancel").json()["status"] == "cancelled"
+    assert client.post(f"/api/agendas/jobs/{running_id}/cancel").json()["status"] == "cancelled"
+
+    release.set()
+    runner.executor.shutdown(wait=True)
+
+    for job_id in [running_id, queued_id]:
+        job = client.get(f"/api/agendas/jobs/{job_id}").json()
+        assert job["status"] == "cancelled"
+        assert job["agenda_id"] is None
+    assert client.get(f"/api/agendas?role_id={role_id}").json() == []
+    assert client.post(f"/api/agendas/jobs/{queued_id}/cancel").status_code == 409
+
+
+def test_cancel_agenda_job_stops_the_running_solver(
+    client: TestClient,
+    role_id: str,
+    setup_availability_and_business_hours,
+):
+    started = threading.Event()
+    cancellations = []
+
+    class StopAwareScheduler(ORToolsScheduler):
+        def solve(self, *args):
+            should_stop = args[-1]
+            started.set()
+            deadline = time.monotonic() + 10
+            while not should_stop() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            cancellations.append(should_stop())
+            raise SolveCancelled()
+
+    runner = AgendaJobRunner(
+        app.dependency_overrides[get_db_connection], StopAwareScheduler, 1
+    )
+    app.dependency_overrides[get_agenda_job_runner] = lambda: runner
+
+    job_ids = [
+        client.post(
+            "/api/agendas/jobs",
+            json={
+                "role_id": role_id,
+                "weeks": [1],
+                "year": 2024,
+                "optimization_strategy": "minimize_gaps",
+            },
+        ).json()["id"]
+    ]
+    started.wait(timeout=10)
+    client.post(f"/api/agendas/jobs/{job_ids[0]}/cancel")
+    runner.executor.shutdown(wait=True)
+
+    job = client.get(f"/api/agendas/jobs/{job_ids[0]}").json()
+    assert job["status"] == "cancelled"
+    assert job["agenda_id"] is None
+    assert cancellations == [True]
+    assert client.get(f"/api/agendas?role_id={role_id}").json() == []
+
+
+def test_cancel_after_the_solve_is_not_overwritten(
+    client: TestClient,
+    role_id: str,
+    setup_availability_and_business_hours,
+    monkeypatch,
+):
+    submitted = threading.Event()
+    job_ids = []
+    create_draft_agenda = AgendaService._create_draft_agenda
+
+    def cancel_then_create(self, *args, **kwargs):
+        submitted.wait(timeout=10)
+        client.post(f"/api/agendas/jobs/{job_ids[0]}/cancel")
+        return create_draft_agenda(self, *args, **kwargs)
+
+    monkeypatch.setattr(AgendaService, "_create_draft_agenda", cancel_then_create)
+    runner = AgendaJobRunner(
+        app.dependency_overrides[get_db_connection], ORToolsScheduler, 1
+    )
+    app.dependency_overrides[get_agenda_job_runner] = lambda: runner
+
+    job_ids.append(
+        client.post(
+            "/api/agendas/jobs",
+            json={
+                "role_id": role_id,
+                "weeks": [1],
+                "year": 2024,
+                "optimization_strategy": "maximize_coverage",
+            },
+        ).json()["id"]
+    )
+    submitted.set()
+    runner.executor.shutdown(wait=True)
+
+    job = client.get(f"/api/agendas/jobs/{job_ids[0]}").json()
+    assert job["status"] == "cancelled"
+    assert job["agenda_id"] is None
+
+
+def test_agenda_job_uses_the_greedy_scheduler_factory(
+    client: TestClient,
+    role_id: str,
+    setup_availability_and_business_hours,
+    tmp_path,
+):
+    runner = AgendaJobRunner(
+        app.dependency_overrides[get_db_connection],
+        ORToolsScheduler,
+        1,
+        lambda: GreedyScheduler(export_dir=str(tmp_path)),
+    )
+    app.dependency_overrides[get_agenda_job_runner] = lambda: runner
+
+    job_id = client.post(
+        "/api/agendas/jobs",
+        json={
+            "role_id": role_id,
+            "weeks": [1],
+            "year": 2024,
+            "optimization_strategy": "balance_workload",
+            "solver": "greedy",
+        },
+    ).json()["id"]
+    runner.executor.shutdown(wait=True)
+
+    assert client.get(f"/api/agendas/jobs/{job_id}").json()["status"] == "completed"
+    [case_dir] = find_cases([tmp_path])
+    assert load_case(case_dir).scheduler == "GreedyScheduler"
+
+
+def test_resume_pending_agenda_jobs(
+    client: TestClient,
+    role_id: str,
+    setup_availability_and_business_hours,
+):
+    stopped_runner = AgendaJobRunner(
+        app.dependency_overrides[get_db_connection], ORToolsScheduler, 1
+    )
+    stopped_runner.submit = lambda job_id: None
+    app.dependency_overrides[get_agenda_job_runner] = lambda: stopped_runner
+    job_id = client.post(
+        "/api/agendas/jobs",
+        json={
+            "role_id": role_id,
+            "weeks": [1],
+            "year": 2024,
+            "optimization_strategy": "maximize_coverage",
+        },
+    ).json()["id"]
+    conn = next(app.dependency_overrides[get_db_connection]())
+    conn.execute("UPDATE agenda_jobs SET status = 'running' WHERE id = ?", (job_id,))
+    conn.commit()
+
+    restarted_runner = AgendaJobRunner(
+        app.dependency_overrides[get_db_connection], ORToolsScheduler, 1
+    )
+
+    assert [str(resumed) for resumed in restarted_runner.resume_pending_jobs()] == [job_id]
+    assert wait_for_job(client, job_id, ["completed"])["status"] == "completed"
+    restarted_runner.executor.shutdown(wait=True)
+
+
+def test_stream_agenda_job_solutions(
+    client: TestClient,
+    role_id: str,
+    setup_availability_and_business_hours,
+):
+    release = threading.Event()
+    runner = AgendaJobRunner(
+        app.dependency_overrides[get_db_connection],
+        lambda: BlockingScheduler(release),
+        1,
+    )
+    app.dependency_overrides[get_agenda_job_runner] = lambda: runner
+    job_id = client.post(
+        "/api/agendas/jobs",
+        json={
+            "role_id": role_id,
+            "weeks": [1],
+            "year": 2024,
+            "optimization_strategy": "balance_workload",
+        },
+    ).json()["id"]
+    assert wait_for_job(client, job_id, ["running"])["status"] == "running"
+    threading.Timer(0.2, release.set).start()
+
+    response = client.get(f"/api/agendas/jobs/{job_id}/solutions")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = read_events(response.text)
+    solutions = [data for event, data in events if event == "solution"]
+    assert solutions
+    assert all(
+        solution["best_objective_bound"] >= solution["objective_value"]
+        for solution in solutions
+    )
+    assert solutions[-1]["objective"] == "balance_workload"
+    assert events[-1][0] == "job"
+    assert events[-1][1]["status"] == "completed"
+    agenda = client.get(f"/api/agendas/{events[-1][1]['agenda_id']}").json()
+    assert len(solutions[-1]["entries"]) == len(agenda["entries"])
+    runner.executor.shutdown(wait=True)
+
+
+def test_stream_finished_agenda_job_sends_final_status(
+    client: TestClient,
+    role_id: str,
+    setup_availability_and_business_hours,
+):
+    job_id = client.post(
+        "/api/agendas/jobs",
+        json={
+            "role_id": role_id,
+            "weeks": [1],
+            "year": 2024,
+            "optimization_strategy": "maximize_coverage",
+        },
+    ).json()["id"]
+    wait_for_job(client, job_id, ["completed"])
+
+    response = client.get(f"/api/agendas/jobs/{job_id}/solutions")
+
+    event, job = read_events(response.text)[-1]
+    assert event == "job"
+    assert job["status"] == "completed"
+
+
+def test_solution_feed_wakes_followers_on_publish_from_another_thread():
+    feed = SolutionFeed()
+    solution = IntermediateSolution(
+        objective_value=1.0, best_objective_bound=1.0, wall_time=0.0, assignments=[]
+    )
+
+    async def follow() -> list:
+        threading.Timer(0.05, feed.publish, [solution]).start()
+        threading.Timer(0.1, feed.close).start()
+        return [item async for item in feed.follow(10)]
+
+    assert asyncio.run(follow()) == [solution]
+    assert feed.listeners == []
+
+
+def test_stream_agenda_job_solutions_not_found(client: TestClient):
+    response = client.get(
+        "/api/agendas/jobs/00000000-0000-0000-0000-000000000000/solutions"
+    )
+
+    assert response.status_code == 404
@@ -0,0 +1,83 @@
+import sqlite3
+from datetime import datetime
+from uuid import uuid4
+
+from modules.main_backend.config import Settings
+from modules.main_backend.database.connection import init_database
+from modules.main_backend.domain.models import Agenda
+from modules.main_backend.repositories.sqlite_repositories import (
+    SQLiteAgendaRepository,
+)
+
+
+def test_init_database_migrates_agendas_without_solver_stats(tmp_path, monkeypatch):
+    database_path = str(tmp_path / "agendalo.db")
+    monkeypatch.setattr(Settings, "database_path", database_path)
+    conn = sqlite3.connect(database_path)
+    conn.execute("""
+        CREATE TABLE agendas (
+            id TEXT PRIMARY KEY,
+            role_id TEXT NOT NULL,
+            status TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+    """)
+    conn.commit()
+    conn.close()
+
+    init_database()
+    init_database()
+
+    conn = sqlite3.connect(database_path)
+    conn.row_factory = sqlite3.Row
+    now = datetime.now()
+    agenda = Agenda(
+        id=uuid4(),
+        role_id=uuid4(),
+        status="draft",
+        created_at=now,
+        updated_at=now,
+        solver_stats={"wall_time": 1.0},
+    )
+    repository = SQLiteAgendaRepository(conn)
+    repository.create(agenda)
+
+    assert repository.get_by_id(agenda.id).solver_stats == {"wall_time": 1.0}
+    conn.close()
+
+
+def test_init_database_migrates_agenda_jobs_without_solver(tmp_path, monkeypatch):
+    database_path = str(tmp_path / "agendalo.db")
+    monkeypatch.setattr(Settings, "database_path", database_path)
+    conn = sqlite3.connect(database_path)
+    conn.execute("""
+        CREATE TABLE agenda_jobs (
+            id TEXT PRIMARY KEY,
+            role_id TEXT NOT NULL,
+            weeks TEXT NOT NULL,
+            year INTEGER NOT NULL,
+            optimization_strategy TEXT NOT NULL,
+            solver_parameters TEXT,
+            base_agenda_id TEXT,
+            status TEXT NOT NULL,
+            progress REAL NOT NULL DEFAULT 0,
+            agenda_id TEXT,
+            error TEXT,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+    """)
+    conn.execute(
+        "INSERT INTO agenda_jobs (id, role_id, weeks, year, optimization_strategy, "
+        "status, created_at, updated_at) VALUES ('job', 'role', '[1]', 2024, "
+        "'maximize_coverage', 'pending', 'now', 'now')"
+    )
+    conn.commit()
+    conn.close()
+
+    init_database()
+
+    conn = sqlite3.connect(database_path)
+    assert conn.execute("SELECT solver FROM agenda_jobs").fetchall() == [("cp_sat",)]
+    conn.close()
@@ -1,5 +1,25 @@
-from modules.scheduler.interfaces import Assignment, Scheduler
+from modules.scheduler.interfaces import (
+    Assignment,
+    IntermediateSolution,
+    Scheduler,
+    ScheduleResult,
+    UncoverableSlot,
+)
+from modules.scheduler.greedy_scheduler import GreedyScheduler
+from modules.scheduler.neighborhood import ChangeSet
 from modules.scheduler.or_tools_scheduler import ORToolsScheduler
+from modules.scheduler.stats import SolverRun, SolveStats
 
-__all__ = ["Scheduler", "ORToolsScheduler", "Assignment"]
+__all__ = [
+    "Scheduler",
+    "ORToolsScheduler",
+    "GreedyScheduler",
+    "Assignment",
+    "ChangeSet",
+    "IntermediateSolution",
+    "ScheduleResult",
+    "SolveStats",
+    "SolverRun",
+    "UncoverableSlot",
+]
 
@@ -0,0 +1,25 @@
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+from ortools.sat.python import cp_model
+
+
+class AssignmentIndex:
+    def __init__(self, assignments: Dict[Tuple[int, int], cp_model.IntVar]):
+        pairs = np.array(list(assignments), dtype=np.int64).reshape(-1, 2)
+        self._people = pairs[:, 0]
+        self._slots = pairs[:, 1]
+        self._variables = np.fromiter(
+            (var.Index() for var in assignments.values()),
+            dtype=np.int64,
+            count=len(assignments),
+        )
+        self._size = int(self._variables.max()) + 1 if len(self._variables) else 0
+
+    def __len__(self) -> int:
+        return len(self._variables)
+
+    def slot_people(self, solution: Iterable[int]) -> Dict[int, int]:
+        values = np.fromiter(solution, dtype=np.int64, count=self._size)
+        selected = np.flatnonzero(values[self._variables])
+        return dict(zip(self._slots[selected].tolist(), self._people[selected].tolist()))
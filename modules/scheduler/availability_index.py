@@ -0,0 +1,84 @@
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+
+class AvailabilityIndex:
+    def __init__(self, availability_slots: Iterable[Tuple[int, int, int, int]]):
+        rows = np.array(list(availability_slots), dtype=np.int64).reshape(-1, 4)
+        people, days, starts, ends = self._merge_intervals(rows)
+
+        self._starts: List[int] = starts.tolist()
+        self._ends: List[int] = ends.tolist()
+        self._ranges: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        self._days: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        if not len(people):
+            return
+
+        key_starts = np.flatnonzero(
+            np.r_[True, (people[1:] != people[:-1]) | (days[1:] != days[:-1])]
+        )
+        key_ends = np.r_[key_starts[1:], len(people)]
+        self._ranges = dict(
+            zip(
+                zip(people[key_starts].tolist(), days[key_starts].tolist()),
+                zip(key_starts.tolist(), key_ends.tolist()),
+            )
+        )
+
+        by_day = np.argsort(days, kind="stable")
+        day_values, day_starts = np.unique(days[by_day], return_index=True)
+        for day, indices in zip(day_values.tolist(), np.split(by_day, day_starts[1:])):
+            self._days[day] = (people[indices], starts[indices], ends[indices])
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def covers(self, person: int, day: int, slot_start: int, slot_end: int) -> bool:
+        key_range = self._ranges.get((person, day))
+        if not key_range:
+            return False
+
+        low, high = key_range
+        position = bisect_right(self._starts, slot_start, low, high) - 1
+        if position < low:
+            return False
+        return slot_end <= self._ends[position]
+
+    def people_on(self, day: int) -> List[int]:
+        if day not in self._days:
+            return []
+        return np.unique(self._days[day][0]).tolist()
+
+    def people_covering(self, day: int, slot_start: int, slot_end: int) -> List[int]:
+        if day not in self._days:
+            return []
+        people, starts, ends = self._days[day]
+        return people[(starts <= slot_start) & (slot_end <= ends)].tolist()
+
+    def intervals(self, person: int, day: int) -> List[Tuple[int, int]]:
+        low, high = self._ranges.get((person, day), (0, 0))
+        return list(zip(self._starts[low:high], self._ends[low:high]))
+
+    def _merge_intervals(
+        self, rows: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        if not len(rows):
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, empty, empty
+
+        rows = rows[np.lexsort((rows[:, 2], rows[:, 1], rows[:, 0]))]
+        people, days, starts, ends = rows.T
+        new_key = np.r_[True, (people[1:] != people[:-1]) | (days[1:] != days[:-1])]
+        offsets = (np.cumsum(new_key) - 1) * (int(ends.max()) + 1)
+        running_ends = np.maximum.accumulate(ends + offsets)
+        new_block = new_key | np.r_[True, starts[1:] + offsets[1:] > running_ends[:-1]]
+
+        block_starts = np.flatnonzero(new_block)
+        return (
+            people[block_starts],
+            days[block_starts],
+            starts[block_starts],
+            np.maximum.reduceat(ends, block_starts),
+        )
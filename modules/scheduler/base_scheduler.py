@@ -0,0 +1,812 @@
+import time as timer
+from abc import abstractmethod
+from collections import defaultdict
+from dataclasses import replace
+from datetime import date, datetime, timedelta, time
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from modules.scheduler.availability_index import AvailabilityIndex
+from modules.scheduler.case_export import export_case
+from modules.scheduler.encoding import EncodedProblem
+from modules.scheduler.expansion import (
+    expand_availability_hours,
+    expand_business_hours,
+)
+from modules.scheduler.greedy import GreedyAssigner
+from modules.scheduler.models import (
+    AvailabilityHours,
+    BusinessServiceHours,
+    SolverParameters,
+)
+from modules.scheduler.neighborhood import (
+    ChangeSet,
+    build_neighborhood,
+    find_changed_slots,
+    freeze_assignments,
+)
+from modules.scheduler.objectives import evaluate_objective
+from modules.scheduler.rolling_horizon import HorizonContext, split_into_windows
+from modules.scheduler.stats import SolveStats
+from modules.scheduler.interfaces import (
+    Assignment,
+    IntermediateSolution,
+    Scheduler,
+    ScheduleResult,
+    UncoverableSlot,
+)
+
+
+class BaseScheduler(Scheduler):
+    gap_formulation = "consecutive"
+    variable_names = False
+
+    def __init__(
+        self, rolling_horizon_weeks: int | None = None, export_dir: str | None = None
+    ):
+        self.rolling_horizon_weeks = rolling_horizon_weeks
+        self.export_dir = export_dir
+        self.solver_parameters = SolverParameters()
+
+    def optimize(
+        self,
+        availability_hours: list[AvailabilityHours],
+        business_service_hours: list[BusinessServiceHours],
+        weeks: list[int],
+        year: int,
+        strategy: str,
+        solver_parameters: SolverParameters | None = None,
+        hints: list[Assignment] | None = None,
+    ) -> list[Assignment]:
+        return self.solve(
+            availability_hours,
+            business_service_hours,
+            weeks,
+            year,
+            strategy,
+            solver_parameters,
+            hints,
+        ).assignments
+
+    def solve(
+        self,
+        availability_hours: list[AvailabilityHours],
+        business_service_hours: list[BusinessServiceHours],
+        weeks: list[int],
+        year: int,
+        strategy: str,
+        solver_parameters: SolverParameters | None = None,
+        hints: list[Assignment] | None = None,
+        on_solution: Callable[[IntermediateSolution], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> ScheduleResult:
+        solver_parameters = solver_parameters or self.solver_parameters
+        hinted_keys = self._to_assignment_keys(hints or [])
+        if not self._has_valid_inputs(availability_hours, business_service_hours):
+            return ScheduleResult(assignments=[])
+
+        stats = SolveStats(
+            export_dir=self._export_case(
+                availability_hours,
+                business_service_hours,
+                weeks,
+                year,
+                strategy,
+                solver_parameters,
+                hints,
+            )
+        )
+        started = timer.perf_counter()
+        windows = self._get_horizon_windows(weeks)
+        if len(windows) > 1:
+            result = self._optimize_rolling_horizon(
+                availability_hours,
+                business_service_hours,
+                windows,
+                year,
+                strategy,
+                solver_parameters,
+                hinted_keys,
+                on_solution,
+                should_stop,
+                stats,
+            )
+        else:
+            result = self._optimize_window(
+                availability_hours,
+                business_service_hours,
+                weeks,
+                year,
+                strategy,
+                solver_parameters,
+                hinted_keys,
+                None,
+                on_solution,
+                should_stop,
+                stats,
+            )
+        stats.wall_time = timer.perf_counter() - started
+        result.stats = stats
+        return result
+
+    def reoptimize(
+        self,
+        availability_hours: list[AvailabilityHours],
+        business_service_hours: list[BusinessServiceHours],
+        weeks: list[int],
+        year: int,
+        strategy: str,
+        current_assignments: list[Assignment],
+        change_set: ChangeSet,
+        solver_parameters: SolverParameters | None = None,
+        on_solution: Callable[[IntermediateSolution], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> ScheduleResult:
+        solver_parameters = solver_parameters or self.solver_parameters
+        if not self._has_valid_inputs(availability_hours, business_service_hours):
+            return ScheduleResult(assignments=[])
+
+        stats = SolveStats(
+            export_dir=self._export_case(
+                availability_hours,
+                business_service_hours,
+                weeks,
+                year,
+                strategy,
+                solver_parameters,
+                current_assignments,
+            )
+        )
+        started = timer.perf_counter()
+        encoded = self._encode_window(
+            availability_hours, business_service_hours, weeks, year, stats
+        )
+        if encoded is None:
+            return ScheduleResult(assignments=[], stats=stats)
+
+        problem, slot_candidates = encoded
+        with stats.measure("neighborhood"):
+            current_pairs = self._encode_hints(
+                problem, self._to_assignment_keys(current_assignments)
+            )
+            person_index = problem.person_index()
+            changed_people = {
+                person_index[person_id]
+                for person_id in change_set.person_ids
+                if person_id in person_index
+            }
+            changed_slots = (
+                find_changed_slots(
+                    problem.absolute_starts,
+                    problem.absolute_ends,
+                    {problem.encode_day(day) for day in change_set.dates},
+                )
+                if change_set.dates
+                else None
+            )
+            frozen = freeze_assignments(
+                current_pairs, slot_candidates, changed_people, changed_slots
+            )
+            neighborhood = build_neighborhood(
+                slot_candidates,
+                frozen,
+                self._encode_assigned_slots(problem, current_assignments)
+                - frozen.keys(),
+                problem.absolute_starts,
+                problem.absolute_ends,
+                changed_people,
+                changed_slots,
+            )
+            frozen_assignments = self._decode_slot_people(
+                problem, frozen, business_service_hours
+            )
+            context = self._build_neighborhood_context(
+                problem, neighborhood, frozen_assignments
+            )
+
+        assignments = self._merge_component_assignments(
+            [
+                frozen_assignments,
+                self._solve_coverable_slots(
+                    problem,
+                    neighborhood,
+                    strategy,
+                    business_service_hours,
+                    solver_parameters,
+                    current_pairs,
+                    context,
+                    self._prepend_committed_assignments(on_solution, frozen_assignments),
+                    should_stop,
+                    stats,
+                ),
+            ]
+        )
+        stats.wall_time = timer.perf_counter() - started
+        return ScheduleResult(
+            assignments=assignments,
+            uncoverable_slots=self._find_uncovered_slots(
+                problem, assignments, business_service_hours
+            ),
+            stats=stats,
+        )
+
+    def compare(
+        self,
+        availability_hours: list[AvailabilityHours],
+        business_service_hours: list[BusinessServiceHours],
+        weeks: list[int],
+        year: int,
+        strategies: list[str],
+        solver_parameters: SolverParameters | None = None,
+    ) -> Dict[str, ScheduleResult]:
+        solver_parameters = solver_parameters or self.solver_parameters
+        windows = self._get_horizon_windows(weeks)
+        if not self._has_valid_inputs(availability_hours, business_service_hours):
+            return super().compare(
+                availability_hours,
+                business_service_hours,
+                weeks,
+                year,
+                strategies,
+                solver_parameters,
+            )
+        if len(windows) > 1:
+            results = super().compare(
+                availability_hours,
+                business_service_hours,
+                weeks,
+                year,
+                strategies,
+                solver_parameters,
+            )
+            encoded = self._encode_window(
+                availability_hours, business_service_hours, weeks, year, SolveStats()
+            )
+            if encoded is not None:
+                self._set_objective_values(*encoded, results)
+            return results
+
+        export_dirs = {
+            strategy: self._export_case(
+                availability_hours,
+                business_service_hours,
+                weeks,
+                year,
+                strategy,
+                solver_parameters,
+                None,
+            )
+            for strategy in strategies
+        }
+        shared_stats = SolveStats()
+        started = timer.perf_counter()
+        encoded = self._encode_window(
+            availability_hours, business_service_hours, weeks, year, shared_stats
+        )
+        if encoded is None or not encoded[1]:
+            return {
+                strategy: ScheduleResult(
+                    assignments=[],
+                    stats=SolveStats(
+                        phase_times=dict(shared_stats.phase_times),
+                        export_dir=export_dirs[strategy],
+                    ),
+                )
+                for strategy in strategies
+            }
+
+        problem, slot_candidates = encoded
+        results = self._compare_strategies(
+            problem,
+            slot_candidates,
+            strategies,
+            business_service_hours,
+            solver_parameters,
+            export_dirs,
+            shared_stats,
+            timer.perf_counter() - started,
+        )
+        self._set_objective_values(problem, slot_candidates, results)
+        return results
+
+    def _compare_strategies(
+        self,
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
+        strategies: list[str],
+        business_service_hours: list[BusinessServiceHours],
+        solver_parameters: SolverParameters,
+        export_dirs: Dict[str, str | None],
+        shared_stats: SolveStats,
+        encoding_time: float,
+    ) -> Dict[str, ScheduleResult]:
+        results = {}
+        for strategy in strategies:
+            assignments, stats = self._solve_dedicated_strategy(
+                problem,
+                slot_candidates,
+                strategy,
+                business_service_hours,
+                solver_parameters,
+                export_dirs[strategy],
+            )
+            stats.merge(shared_stats)
+            stats.wall_time += encoding_time
+            results[strategy] = ScheduleResult(
+                assignments=assignments,
+                uncoverable_slots=self._find_uncovered_slots(
+                    problem, assignments, business_service_hours
+                ),
+                stats=stats,
+            )
+        return results
+
+    def _set_objective_values(
+        self,
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
+        results: Dict[str, ScheduleResult],
+    ) -> None:
+        person_slots = self._group_slots_by_person(slot_candidates)
+        for strategy, result in results.items():
+            result.objective_value = evaluate_objective(
+                problem,
+                person_slots,
+                self._encode_hints(
+                    problem, self._to_assignment_keys(result.assignments)
+                ),
+                strategy,
+                self.gap_formulation,
+            )
+
+    def _solve_dedicated_strategy(
+        self,
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
+        strategy: str,
+        business_service_hours: list[BusinessServiceHours],
+        solver_parameters: SolverParameters,
+        export_dir: str | None,
+    ) -> Tuple[list[Assignment], SolveStats]:
+        stats = SolveStats(export_dir=export_dir)
+        started = timer.perf_counter()
+        assignments = self._solve_coverable_slots(
+            problem,
+            slot_candidates,
+            strategy,
+            business_service_hours,
+            solver_parameters,
+            set(),
+            None,
+            None,
+            None,
+            stats,
+        )
+        stats.wall_time = timer.perf_counter() - started
+        return assignments, stats
+
+    def _encode_assigned_slots(
+        self, problem: EncodedProblem, assignments: list[Assignment]
+    ) -> Set[int]:
+        slot_index = problem.slot_index()
+        slots = (
+            slot_index.get(problem.encode_slot(a.date, a.start_time, a.end_time))
+            for a in assignments
+        )
+        return {slot for slot in slots if slot is not None}
+
+    def _build_neighborhood_context(
+        self,
+        problem: EncodedProblem,
+        neighborhood: Dict[int, List[int]],
+        frozen_assignments: list[Assignment],
+    ) -> HorizonContext:
+        context = HorizonContext()
+        if not neighborhood:
+            return context
+        first_date, _, _ = problem.decode_slot(
+            min(neighborhood, key=lambda slot: problem.slot_bounds[slot])
+        )
+        self._advance_horizon_context(
+            context, [a for a in frozen_assignments if a.date >= first_date]
+        )
+        context.boundary_slots.clear()
+        self._advance_horizon_context(
+            context, [a for a in frozen_assignments if a.date < first_date]
+        )
+        return context
+
+    def _export_case(
+        self,
+        availability_hours: list[AvailabilityHours],
+        business_service_hours: list[BusinessServiceHours],
+        weeks: list[int],
+        year: int,
+        strategy: str,
+        solver_parameters: SolverParameters,
+        hints: list[Assignment] | None,
+    ) -> str | None:
+        if not self.export_dir:
+            return None
+        return str(
+            export_case(
+                self.export_dir,
+                availability_hours,
+                business_service_hours,
+                weeks,
+                year,
+                strategy,
+                solver_parameters,
+                hints,
+                type(self).__name__,
+                self._export_options(),
+            )
+        )
+
+    def _export_options(self) -> Dict[str, object]:
+        return {"rolling_horizon_weeks": self.rolling_horizon_weeks}
+
+    def _get_horizon_windows(self, weeks: list[int]) -> List[List[int]]:
+        if not self.rolling_horizon_weeks:
+            return [weeks]
+        return split_into_windows(weeks, self.rolling_horizon_weeks)
+
+    def _optimize_rolling_horizon(
+        self,
+        availability_hours: list[AvailabilityHours],
+        business_service_hours: list[BusinessServiceHours],
+        windows: List[List[int]],
+        year: int,
+        strategy: str,
+        solver_parameters: SolverParameters,
+        hinted_keys: Set[Tuple[UUID, date, time, time]],
+        on_solution: Callable[[IntermediateSolution], None] | None,
+        should_stop: Callable[[], bool] | None,
+        stats: SolveStats,
+    ) -> ScheduleResult:
+        if solver_parameters.max_time_in_seconds is not None:
+            solver_parameters = replace(
+                solver_parameters,
+                max_time_in_seconds=solver_parameters.max_time_in_seconds / len(windows),
+            )
+        context = HorizonContext()
+        result = ScheduleResult(assignments=[])
+        for window in windows:
+            window_result = self._optimize_window(
+                availability_hours,
+                business_service_hours,
+                window,
+                year,
+                strategy,
+                solver_parameters,
+                hinted_keys,
+                context,
+                self._prepend_committed_assignments(
+                    on_solution, list(result.assignments)
+                ),
+                should_stop,
+                stats,
+            )
+            self._advance_horizon_context(context, window_result.assignments)
+            result.assignments.extend(window_result.assignments)
+            result.uncoverable_slots.extend(window_result.uncoverable_slots)
+        return result
+
+    def _prepend_committed_assignments(
+        self,
+        on_solution: Callable[[IntermediateSolution], None] | None,
+        committed: list[Assignment],
+    ) -> Callable[[IntermediateSolution], None] | None:
+        if on_solution is None or not committed:
+            return on_solution
+        return lambda solution: on_solution(
+            replace(solution, assignments=committed + solution.assignments)
+        )
+
+    def _advance_horizon_context(
+        self, context: HorizonContext, assignments: list[Assignment]
+    ) -> None:
+        for a in assignments:
+            context.accumulated_hours[a.person_id] = context.accumulated_hours.get(
+                a.person_id, 0
+            ) + self._calculate_duration(a.start_time, a.end_time)
+            slot = (a.date, a.start_time, a.end_time)
+            boundary_slot = context.boundary_slots.get(a.person_id)
+            if boundary_slot is None or boundary_slot < slot:
+                context.boundary_slots[a.person_id] = slot
+
+    def _optimize_window(
+        self,
+        availability_hours: list[AvailabilityHours],
+        business_service_hours: list[BusinessServiceHours],
+        weeks: list[int],
+        year: int,
+        strategy: str,
+        solver_parameters: SolverParameters,
+        hinted_keys: Set[Tuple[UUID, date, time, time]],
+        context: HorizonContext | None,
+        on_solution: Callable[[IntermediateSolution], None] | None,
+        should_stop: Callable[[], bool] | None,
+        stats: SolveStats,
+    ) -> ScheduleResult:
+        encoded = self._encode_window(
+            availability_hours, business_service_hours, weeks, year, stats
+        )
+        if encoded is None:
+            return ScheduleResult(assignments=[])
+
+        problem, slot_candidates = encoded
+        with stats.measure("encoding"):
+            hinted_pairs = self._encode_hints(problem, hinted_keys)
+
+        hinted_pairs = self._extend_hints(
+            problem, slot_candidates, strategy, hinted_pairs, context, stats
+        )
+        assignments = self._solve_coverable_slots(
+            problem,
+            slot_candidates,
+            strategy,
+            business_service_hours,
+            solver_parameters,
+            hinted_pairs,
+            context,
+            on_solution,
+            should_stop,
+            stats,
+        )
+        return ScheduleResult(
+            assignments=assignments,
+            uncoverable_slots=self._find_uncovered_slots(
+                problem, assignments, business_service_hours
+            ),
+        )
+
+    def _extend_hints(
+        self,
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
+        strategy: str,
+        hinted_pairs: Set[Tuple[int, int]],
+        context: HorizonContext | None,
+        stats: SolveStats,
+    ) -> Set[Tuple[int, int]]:
+        return hinted_pairs
+
+    def _encode_window(
+        self,
+        availability_hours: list[AvailabilityHours],
+        business_service_hours: list[BusinessServiceHours],
+        weeks: list[int],
+        year: int,
+        stats: SolveStats,
+    ) -> Tuple[EncodedProblem, Dict[int, List[int]]] | None:
+        with stats.measure("expansion"):
+            date_range = self._get_date_range_for_weeks(weeks, year)
+            person_ids = sorted(self._extract_person_ids(availability_hours))
+            time_slots = self._create_time_slots(business_service_hours, date_range)
+            if not len(time_slots):
+                return None
+
+            availability_slots = self._create_availability_slots(
+                availability_hours, person_ids, date_range
+            )
+        with stats.measure("encoding"):
+            problem, slot_candidates = self._encode_problem(
+                person_ids, date_range, time_slots, availability_slots
+            )
+            return problem, self._drop_uncoverable_slots(slot_candidates)
+
+    def _assign_greedily(
+        self,
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
+        strategy: str,
+        hinted_pairs: Set[Tuple[int, int]],
+        context: HorizonContext | None,
+    ) -> Dict[int, int]:
+        return GreedyAssigner(
+            problem,
+            slot_candidates,
+            strategy,
+            self._encode_accumulated_hours(problem, context or HorizonContext()),
+        ).assign(hinted_pairs)
+
+    def _decode_slot_people(
+        self,
+        problem: EncodedProblem,
+        slot_people: Dict[int, int],
+        business_service_hours: list[BusinessServiceHours],
+    ) -> list[Assignment]:
+        role_id = business_service_hours[0].role_id
+        assignments = []
+        for slot in sorted(slot_people):
+            slot_date, slot_start, slot_end = problem.decode_slot(slot)
+            assignments.append(
+                Assignment(
+                    person_id=problem.person_ids[slot_people[slot]],
+                    date=slot_date,
+                    start_time=slot_start,
+                    end_time=slot_end,
+                    role_id=role_id,
+                )
+            )
+        return assignments
+
+    def _drop_uncoverable_slots(
+        self, slot_candidates: Dict[int, List[int]]
+    ) -> Dict[int, List[int]]:
+        return {
+            slot: candidates
+            for slot, candidates in slot_candidates.items()
+            if candidates
+        }
+
+    def _find_uncovered_slots(
+        self,
+        problem: EncodedProblem,
+        assignments: list[Assignment],
+        business_service_hours: list[BusinessServiceHours],
+    ) -> list[UncoverableSlot]:
+        role_id = business_service_hours[0].role_id
+        covered_slots = {(a.date, a.start_time, a.end_time) for a in assignments}
+        uncovered_slots = []
+        for slot in range(problem.num_slots):
+            slot_date, slot_start, slot_end = problem.decode_slot(slot)
+            if (slot_date, slot_start, slot_end) not in covered_slots:
+                uncovered_slots.append(
+                    UncoverableSlot(
+                        date=slot_date,
+                        start_time=slot_start,
+                        end_time=slot_end,
+                        role_id=role_id,
+                    )
+                )
+        return uncovered_slots
+
+    def _to_assignment_keys(
+        self, assignments: list[Assignment]
+    ) -> Set[Tuple[UUID, date, time, time]]:
+        return {
+            (a.person_id, a.date, a.start_time, a.end_time) for a in assignments
+        }
+
+    def _encode_hints(
+        self,
+        problem: EncodedProblem,
+        hinted_keys: Set[Tuple[UUID, date, time, time]],
+    ) -> Set[Tuple[int, int]]:
+        if not hinted_keys:
+            return set()
+        person_index = problem.person_index()
+        slot_index = problem.slot_index()
+        hinted_pairs = set()
+        for person_id, slot_date, slot_start, slot_end in hinted_keys:
+            person = person_index.get(person_id)
+            slot = slot_index.get(problem.encode_slot(slot_date, slot_start, slot_end))
+            if person is not None and slot is not None:
+                hinted_pairs.add((person, slot))
+        return hinted_pairs
+
+    def _merge_component_assignments(
+        self, results: List[list[Assignment]]
+    ) -> list[Assignment]:
+        merged = [assignment for result in results for assignment in result]
+        merged.sort(key=lambda a: (a.date, a.start_time, a.end_time, a.person_id))
+        return merged
+
+    def _has_valid_inputs(
+        self,
+        availability_hours: list[AvailabilityHours],
+        business_service_hours: list[BusinessServiceHours],
+    ) -> bool:
+        return bool(availability_hours and business_service_hours)
+
+    def _extract_person_ids(
+        self, availability_hours: list[AvailabilityHours]
+    ) -> Set[UUID]:
+        return {ah.person_id for ah in availability_hours}
+
+    def _encode_problem(
+        self,
+        person_ids: List[UUID],
+        date_range: List[date],
+        time_slots: np.ndarray,
+        availability_slots: np.ndarray,
+    ) -> Tuple[EncodedProblem, Dict[int, List[int]]]:
+        problem = EncodedProblem(
+            start_date=min(date_range),
+            person_ids=person_ids,
+            slot_days=time_slots[:, 0],
+            slot_starts=time_slots[:, 1],
+            slot_ends=time_slots[:, 2],
+            variable_names=self.variable_names,
+        )
+        availability_index = self._index_availability(availability_slots.tolist())
+        return problem, self._build_slot_candidates(problem, availability_index)
+
+    def _index_availability(
+        self, availability_slots: Iterable[Tuple[int, int, int, int]]
+    ) -> AvailabilityIndex:
+        return AvailabilityIndex(availability_slots)
+
+    def _build_slot_candidates(
+        self, problem: EncodedProblem, availability_index: AvailabilityIndex
+    ) -> Dict[int, List[int]]:
+        return {
+            slot: availability_index.people_covering(day, slot_start, slot_end)
+            for slot, (day, slot_start, slot_end) in enumerate(problem.slot_bounds)
+        }
+
+    def _group_slots_by_person(
+        self, slot_candidates: Dict[int, List[int]]
+    ) -> Dict[int, List[int]]:
+        person_slots = defaultdict(list)
+        for slot, candidates in slot_candidates.items():
+            for person in candidates:
+                person_slots[person].append(slot)
+        for slots in person_slots.values():
+            slots.sort()
+        return dict(person_slots)
+
+    def _get_date_range_for_weeks(self, weeks: list[int], year: int) -> List[date]:
+        dates = []
+        jan1 = date(year, 1, 1)
+        jan1_weekday = jan1.weekday()
+        days_to_monday = (jan1_weekday - 0) % 7
+        first_monday = jan1 - timedelta(days=days_to_monday)
+        if first_monday.year < year:
+            first_monday = first_monday + timedelta(weeks=1)
+
+        for week in weeks:
+            week_start = first_monday + timedelta(weeks=week - 1)
+            for day_offset in range(7):
+                dates.append(week_start + timedelta(days=day_offset))
+        return dates
+
+    def _create_time_slots(
+        self, business_service_hours: list[BusinessServiceHours], date_range: List[date]
+    ) -> np.ndarray:
+        return expand_business_hours(business_service_hours, date_range)
+
+    def _create_availability_slots(
+        self,
+        availability_hours: list[AvailabilityHours],
+        person_ids: List[UUID],
+        date_range: List[date],
+    ) -> np.ndarray:
+        return expand_availability_hours(availability_hours, person_ids, date_range)
+
+    def _calculate_duration(self, start_time: time, end_time: time) -> int:
+        start_dt = datetime.combine(date.today(), start_time)
+        end_dt = datetime.combine(date.today(), end_time)
+        if end_dt < start_dt:
+            end_dt += timedelta(days=1)
+        return int((end_dt - start_dt).total_seconds() / 3600)
+
+    def _encode_accumulated_hours(
+        self, problem: EncodedProblem, context: HorizonContext
+    ) -> Dict[int, int]:
+        person_index = problem.person_index()
+        return {
+            person_index[person_id]: hours
+            for person_id, hours in context.accumulated_hours.items()
+            if person_id in person_index
+        }
+
+    @abstractmethod
+    def _solve_coverable_slots(
+        self,
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
+        strategy: str,
+        business_service_hours: list[BusinessServiceHours],
+        solver_parameters: SolverParameters,
+        hinted_pairs: Set[Tuple[int, int]],
+        context: HorizonContext | None,
+        on_solution: Callable[[IntermediateSolution], None] | None,
+        should_stop: Callable[[], bool] | None,
+        stats: SolveStats,
+    ) -> list[Assignment]:
+        pass
@@ -0,0 +1,75 @@
+import argparse
+import time as timer
+from typing import Iterable, List, Tuple
+
+from modules.scheduler.benchmarks.instances import generate_instance
+from modules.scheduler.or_tools_scheduler import ORToolsScheduler
+
+
+class LinearScanAvailability:
+    def __init__(self, availability_slots: Iterable[Tuple[int, int, int, int]]):
+        self._availability_slots = list(availability_slots)
+
+    def covers(self, person: int, day: int, slot_start: int, slot_end: int) -> bool:
+        for avail_person, avail_day, avail_start, avail_end in self._availability_slots:
+            if avail_person == person and avail_day == day:
+                if avail_start <= slot_start and slot_end <= avail_end:
+                    return True
+        return False
+
+    def people_on(self, day: int) -> List[int]:
+        return sorted({person for person, _, _, _ in self._availability_slots})
+
+    def people_covering(self, day: int, slot_start: int, slot_end: int) -> List[int]:
+        return [
+            person
+            for person in self.people_on(day)
+            if self.covers(person, day, slot_start, slot_end)
+        ]
+
+
+class LinearScanScheduler(ORToolsScheduler):
+    def _index_availability(
+        self, availability_slots: Iterable[Tuple[int, int, int, int]]
+    ) -> LinearScanAvailability:
+        return LinearScanAvailability(availability_slots)
+
+
+def measure_build_time(
+    scheduler: ORToolsScheduler, num_people: int, weeks: list[int], year: int
+) -> float:
+    availability_hours, business_service_hours = generate_instance(num_people)
+    date_range = scheduler._get_date_range_for_weeks(weeks, year)
+    person_ids = sorted(scheduler._extract_person_ids(availability_hours))
+    time_slots = scheduler._create_time_slots(business_service_hours, date_range)
+    availability_slots = scheduler._create_availability_slots(
+        availability_hours, person_ids, date_range
+    )
+
+    started = timer.perf_counter()
+    problem, slot_candidates = scheduler._encode_problem(
+        person_ids, date_range, time_slots, availability_slots
+    )
+    scheduler._build_model(problem, slot_candidates, "maximize_coverage")
+    return timer.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare model-build time of the availability index against a linear scan"
+    )
+    parser.add_argument("--people", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--weeks", type=int, default=1)
+    parser.add_argument("--year", type=int, default=2024)
+    args = parser.parse_args()
+
+    weeks = list(range(1, args.weeks + 1))
+    print(f"{'people':>8} {'linear scan (s)':>16} {'index (s)':>12} {'speedup':>9}")
+    for num_people in args.people:
+        scan = measure_build_time(LinearScanScheduler(), num_people, weeks, args.year)
+        indexed = measure_build_time(ORToolsScheduler(), num_people, weeks, args.year)
+        print(f"{num_people:>8} {scan:>16.3f} {indexed:>12.3f} {scan / indexed:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
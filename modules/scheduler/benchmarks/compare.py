@@ -0,0 +1,161 @@
+import argparse
+import time as timer
+
+from modules.scheduler.benchmarks.instances import generate_synthetic_instance
+from modules.scheduler.comparison import clone_shared_model
+from modules.scheduler.models import (
+    AvailabilityHours,
+    BusinessServiceHours,
+    SolverParameters,
+)
+from modules.scheduler.or_tools_scheduler import ORToolsScheduler
+from modules.scheduler.stats import SolveStats
+
+STRATEGIES = ["maximize_coverage", "minimize_gaps", "balance_workload"]
+
+
+def measure_separate_builds(
+    scheduler: ORToolsScheduler,
+    availability_hours: list[AvailabilityHours],
+    business_service_hours: list[BusinessServiceHours],
+    weeks: list[int],
+    year: int,
+    strategies: list[str],
+) -> float:
+    started = timer.perf_counter()
+    for strategy in strategies:
+        stats = SolveStats()
+        problem, slot_candidates = scheduler._encode_window(
+            availability_hours, business_service_hours, weeks, year, stats
+        )
+        residual_candidates, forced = scheduler._reduce_problem(
+            problem, slot_candidates, [strategy], stats
+        )
+        scheduler._build_model(
+            problem, residual_candidates, strategy, stats=stats, forced=forced
+        )
+    return timer.perf_counter() - started
+
+
+def measure_shared_builds(
+    scheduler: ORToolsScheduler,
+    availability_hours: list[AvailabilityHours],
+    business_service_hours: list[BusinessServiceHours],
+    weeks: list[int],
+    year: int,
+    strategies: list[str],
+) -> float:
+    started = timer.perf_counter()
+    stats = SolveStats()
+    problem, slot_candidates = scheduler._encode_window(
+        availability_hours, business_service_hours, weeks, year, stats
+    )
+    shared = scheduler._build_shared_model(
+        problem, slot_candidates, strategies, stats
+    )
+    for strategy in strategies:
+        model, assignments = clone_shared_model(shared)
+        scheduler._set_objective(
+            model,
+            problem,
+            strategy,
+            shared.slot_candidates,
+            shared.person_slots,
+            assignments,
+            None,
+        )
+    return timer.perf_counter() - started
+
+
+def run(
+    num_people: int,
+    shifts_per_day: int,
+    num_weeks: int,
+    year: int,
+    strategies: list[str],
+    max_time_in_seconds: float,
+) -> dict:
+    scheduler = ORToolsScheduler()
+    availability_hours, business_service_hours = generate_synthetic_instance(
+        num_people, shifts_per_day=shifts_per_day
+    )
+    weeks = list(range(1, num_weeks + 1))
+    solver_parameters = SolverParameters(
+        max_time_in_seconds=max_time_in_seconds, random_seed=0
+    )
+
+    separate_build = measure_separate_builds(
+        scheduler, availability_hours, business_service_hours, weeks, year, strategies
+    )
+    shared_build = measure_shared_builds(
+        scheduler, availability_hours, business_service_hours, weeks, year, strategies
+    )
+
+    started = timer.perf_counter()
+    separate = [
+        scheduler.solve(
+            availability_hours,
+            business_service_hours,
+            weeks,
+            year,
+            strategy,
+            solver_parameters,
+        )
+        for strategy in strategies
+    ]
+    separate_time = timer.perf_counter() - started
+
+    started = timer.perf_counter()
+    scheduler.compare(
+        availability_hours,
+        business_service_hours,
+        weeks,
+        year,
+        strategies,
+        solver_parameters,
+    )
+    compare_time = timer.perf_counter() - started
+
+    return {
+        "separate_build": separate_build,
+        "shared_build": shared_build,
+        "separate_time": separate_time,
+        "compare_time": compare_time,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare solving each strategy separately against one "
+        "compare() call that shares the encoding and hard constraints"
+    )
+    parser.add_argument("--strategies", nargs="+", default=STRATEGIES)
+    parser.add_argument("--people", type=int, nargs="+", default=[50, 200, 500])
+    parser.add_argument("--shifts-per-day", type=int, default=6)
+    parser.add_argument("--weeks", type=int, default=2)
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--max-time", type=float, default=10.0)
+    args = parser.parse_args()
+
+    print(
+        f"{'people':>7} {'separate build (s)':>19} {'shared build (s)':>17} "
+        f"{'separate total (s)':>19} {'compare total (s)':>18}"
+    )
+    for num_people in args.people:
+        result = run(
+            num_people,
+            args.shifts_per_day,
+            args.weeks,
+            args.year,
+            args.strategies,
+            args.max_time,
+        )
+        print(
+            f"{num_people:>7} {result['separate_build']:>19.3f} "
+            f"{result['shared_build']:>17.3f} {result['separate_time']:>19.3f} "
+            f"{result['compare_time']:>18.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
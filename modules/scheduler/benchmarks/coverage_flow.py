@@ -0,0 +1,75 @@
+import argparse
+import time as timer
+
+from modules.scheduler.benchmarks.instances import (
+    generate_instance,
+    generate_split_shift_instance,
+)
+from modules.scheduler.models import SolverParameters
+from modules.scheduler.or_tools_scheduler import ORToolsScheduler
+
+INSTANCES = {
+    "shifts": generate_instance,
+    "split-shift": generate_split_shift_instance,
+}
+
+
+def run(
+    scheduler: ORToolsScheduler,
+    instance: str,
+    num_people: int,
+    num_weeks: int,
+    year: int,
+    max_time_in_seconds: float,
+) -> tuple[float, int]:
+    availability_hours, business_service_hours = INSTANCES[instance](num_people)
+    started = timer.perf_counter()
+    assignments = scheduler.optimize(
+        availability_hours,
+        business_service_hours,
+        list(range(1, num_weeks + 1)),
+        year,
+        "maximize_coverage",
+        SolverParameters(max_time_in_seconds=max_time_in_seconds),
+    )
+    return timer.perf_counter() - started, len(assignments)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare CP-SAT and min-cost-flow solves of maximize_coverage"
+    )
+    parser.add_argument("--instances", nargs="+", default=list(INSTANCES))
+    parser.add_argument("--people", type=int, nargs="+", default=[5, 30, 200])
+    parser.add_argument("--weeks", type=int, default=4)
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--max-time", type=float, default=30.0)
+    args = parser.parse_args()
+
+    modes = {
+        "cp-sat": ORToolsScheduler(coverage_flows=False),
+        "flow": ORToolsScheduler(),
+    }
+    print(
+        f"{'instance':>12} {'people':>7} {'mode':>7} "
+        f"{'time (s)':>9} {'assignments':>12}"
+    )
+    for instance in args.instances:
+        for num_people in args.people:
+            for name, scheduler in modes.items():
+                elapsed, count = run(
+                    scheduler,
+                    instance,
+                    num_people,
+                    args.weeks,
+                    args.year,
+                    args.max_time,
+                )
+                print(
+                    f"{instance:>12} {num_people:>7} {name:>7} "
+                    f"{elapsed:>9.3f} {count:>12}"
+                )
+
+
+if __name__ == "__main__":
+    main()
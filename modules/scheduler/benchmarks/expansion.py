@@ -0,0 +1,102 @@
+import argparse
+import time as timer
+from datetime import date
+from typing import List
+from uuid import UUID
+
+import numpy as np
+
+from modules.scheduler.benchmarks.instances import generate_instance
+from modules.scheduler.models import AvailabilityHours, BusinessServiceHours
+from modules.scheduler.or_tools_scheduler import ORToolsScheduler
+from modules.scheduler.overlap import interval_minutes
+
+
+class LoopExpansionScheduler(ORToolsScheduler):
+    def _create_time_slots(
+        self, business_service_hours: list[BusinessServiceHours], date_range: List[date]
+    ) -> np.ndarray:
+        start_date = min(date_range)
+        slots = set()
+        for bsh in business_service_hours:
+            minutes = interval_minutes(bsh.start_time, bsh.end_time)
+            for d in date_range:
+                if self._rule_applies(bsh, d):
+                    slots.add(((d - start_date).days, *minutes))
+        return np.array(sorted(slots), dtype=np.int32).reshape(-1, 3)
+
+    def _create_availability_slots(
+        self,
+        availability_hours: list[AvailabilityHours],
+        person_ids: List[UUID],
+        date_range: List[date],
+    ) -> np.ndarray:
+        start_date = min(date_range)
+        person_index = {person_id: index for index, person_id in enumerate(person_ids)}
+        slots = set()
+        for ah in availability_hours:
+            person = person_index[ah.person_id]
+            minutes = interval_minutes(ah.start_time, ah.end_time)
+            for d in date_range:
+                if self._rule_applies(ah, d):
+                    slots.add((person, (d - start_date).days, *minutes))
+        return np.array(sorted(slots), dtype=np.int32).reshape(-1, 4)
+
+    def _rule_applies(
+        self, rule: AvailabilityHours | BusinessServiceHours, d: date
+    ) -> bool:
+        if rule.specific_date:
+            return rule.specific_date == d
+        if rule.is_recurring and rule.day_of_week is not None:
+            if rule.day_of_week != d.weekday():
+                return False
+            if rule.start_date and d < rule.start_date:
+                return False
+            return not rule.end_date or d <= rule.end_date
+        if rule.start_date and rule.end_date:
+            return rule.start_date <= d <= rule.end_date
+        return False
+
+
+def measure_expansion_time(
+    scheduler: ORToolsScheduler, num_people: int, weeks: list[int], year: int
+) -> tuple[float, int]:
+    availability_hours, business_service_hours = generate_instance(num_people)
+    date_range = scheduler._get_date_range_for_weeks(weeks, year)
+    person_ids = sorted(scheduler._extract_person_ids(availability_hours))
+
+    started = timer.perf_counter()
+    scheduler._create_time_slots(business_service_hours, date_range)
+    scheduler._create_availability_slots(availability_hours, person_ids, date_range)
+    return timer.perf_counter() - started, len(availability_hours)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare per-date rule loops against vectorized rule expansion"
+    )
+    parser.add_argument("--people", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--weeks", type=int, default=52)
+    parser.add_argument("--year", type=int, default=2024)
+    args = parser.parse_args()
+
+    weeks = list(range(1, args.weeks + 1))
+    print(
+        f"{'people':>8} {'rows':>7} {'loops (s)':>10} "
+        f"{'vectorized (s)':>15} {'speedup':>9}"
+    )
+    for num_people in args.people:
+        loops, rows = measure_expansion_time(
+            LoopExpansionScheduler(), num_people, weeks, args.year
+        )
+        vectorized, _ = measure_expansion_time(
+            ORToolsScheduler(), num_people, weeks, args.year
+        )
+        print(
+            f"{num_people:>8} {rows:>7} {loops:>10.3f} "
+            f"{vectorized:>15.3f} {loops / vectorized:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
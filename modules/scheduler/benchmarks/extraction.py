@@ -0,0 +1,117 @@
+import argparse
+import time as timer
+from typing import Callable, Dict, Tuple
+
+from ortools.sat.python import cp_model
+
+from modules.scheduler.assignment_index import AssignmentIndex
+from modules.scheduler.benchmarks.instances import generate_synthetic_instance
+from modules.scheduler.models import SolverParameters
+from modules.scheduler.or_tools_scheduler import ORToolsScheduler
+from modules.scheduler.stats import SolveStats
+
+
+def extract_with_values(
+    solver: cp_model.CpSolver,
+    assignments: Dict[Tuple[int, int], cp_model.IntVar],
+) -> Dict[int, int]:
+    return {
+        slot: person
+        for (person, slot), var in assignments.items()
+        if solver.Value(var) == 1
+    }
+
+
+def extract_with_index(
+    solver: cp_model.CpSolver, assignment_index: AssignmentIndex
+) -> Dict[int, int]:
+    return assignment_index.slot_people(solver.response_proto.solution)
+
+
+def best_time(function: Callable[[], object], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = timer.perf_counter()
+        function()
+        best = min(best, timer.perf_counter() - started)
+    return best
+
+
+def run(
+    num_people: int,
+    shifts_per_day: int,
+    weeks: list[int],
+    year: int,
+    max_time_in_seconds: float,
+    repeats: int,
+) -> dict:
+    scheduler = ORToolsScheduler()
+    availability_hours, business_service_hours = generate_synthetic_instance(
+        num_people, shifts_per_day=shifts_per_day
+    )
+    problem, slot_candidates = scheduler._encode_window(
+        availability_hours, business_service_hours, weeks, year, SolveStats()
+    )
+    model, assignments = scheduler._build_model(
+        problem, slot_candidates, "maximize_coverage"
+    )
+    solver = scheduler._create_solver(
+        SolverParameters(max_time_in_seconds=max_time_in_seconds)
+    )
+    if solver.Solve(model) not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        return {"variables": len(assignments), "assigned": None}
+
+    assignment_index = AssignmentIndex(assignments)
+    values = extract_with_values(solver, assignments)
+    assert extract_with_index(solver, assignment_index) == values
+    return {
+        "variables": len(assignments),
+        "assigned": len(values),
+        "values_time": best_time(lambda: extract_with_values(solver, assignments), repeats),
+        "index_build_time": best_time(lambda: AssignmentIndex(assignments), repeats),
+        "index_time": best_time(
+            lambda: extract_with_index(solver, assignment_index), repeats
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare per-variable solver.Value() extraction against the "
+        "vectorized assignment index"
+    )
+    parser.add_argument("--people", type=int, nargs="+", default=[100, 1000, 2000])
+    parser.add_argument("--shifts-per-day", type=int, default=12)
+    parser.add_argument("--weeks", type=int, default=4)
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--max-time", type=float, default=60.0)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    weeks = list(range(1, args.weeks + 1))
+    print(
+        f"{'people':>7} {'variables':>10} {'assigned':>9} {'Value() (s)':>12} "
+        f"{'index build (s)':>16} {'index (s)':>10} {'speedup':>8}"
+    )
+    for num_people in args.people:
+        result = run(
+            num_people,
+            args.shifts_per_day,
+            weeks,
+            args.year,
+            args.max_time,
+            args.repeats,
+        )
+        if result["assigned"] is None:
+            print(f"{num_people:>7} {result['variables']:>10}  no solution found")
+            continue
+        print(
+            f"{num_people:>7} {result['variables']:>10} {result['assigned']:>9} "
+            f"{result['values_time']:>12.3f} {result['index_build_time']:>16.3f} "
+            f"{result['index_time']:>10.3f} "
+            f"{result['values_time'] / result['index_time']:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
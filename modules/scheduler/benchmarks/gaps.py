@@ -0,0 +1,85 @@
+import argparse
+import time as timer
+
+from modules.scheduler.benchmarks.instances import generate_synthetic_instance
+from modules.scheduler.benchmarks.lexicographic import measure_schedule
+from modules.scheduler.models import SolverParameters
+from modules.scheduler.or_tools_scheduler import ORToolsScheduler
+
+
+def run(
+    scheduler: ORToolsScheduler,
+    num_people: int,
+    shifts_per_day: int,
+    weeks: list[int],
+    year: int,
+    max_time_in_seconds: float,
+) -> dict:
+    availability_hours, business_service_hours = generate_synthetic_instance(
+        num_people, shifts_per_day=shifts_per_day
+    )
+    started = timer.perf_counter()
+    result = scheduler.solve(
+        availability_hours,
+        business_service_hours,
+        weeks,
+        year,
+        "minimize_gaps",
+        SolverParameters(max_time_in_seconds=max_time_in_seconds, random_seed=0),
+    )
+    solve_time = timer.perf_counter() - started
+    solver_run = result.stats.solver_runs[-1]
+    return {
+        **measure_schedule(result.assignments),
+        "variables": solver_run.num_variables,
+        "constraints": solver_run.num_constraints,
+        "build_time": sum(
+            result.stats.phase_times.get(phase, 0.0)
+            for phase in ("variables", "constraints", "objective")
+        ),
+        "solve_time": solve_time,
+        "status": solver_run.status,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare the consecutive-candidate gap model against the "
+        "per-day span gap model for minimize_gaps"
+    )
+    parser.add_argument("--people", type=int, nargs="+", default=[20, 50, 100])
+    parser.add_argument("--shifts-per-day", type=int, default=6)
+    parser.add_argument("--weeks", type=int, default=1)
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--max-time", type=float, default=30.0)
+    args = parser.parse_args()
+
+    weeks = list(range(1, args.weeks + 1))
+    formulations = {
+        formulation: ORToolsScheduler(gap_formulation=formulation)
+        for formulation in ORToolsScheduler.GAP_FORMULATIONS
+    }
+    print(
+        f"{'people':>7} {'formulation':>12} {'variables':>10} {'constraints':>12} "
+        f"{'build (s)':>10} {'solve (s)':>10} {'status':>9} {'idle (h)':>9}"
+    )
+    for num_people in args.people:
+        for name, scheduler in formulations.items():
+            result = run(
+                scheduler,
+                num_people,
+                args.shifts_per_day,
+                weeks,
+                args.year,
+                args.max_time,
+            )
+            print(
+                f"{num_people:>7} {name:>12} {result['variables']:>10} "
+                f"{result['constraints']:>12} {result['build_time']:>10.3f} "
+                f"{result['solve_time']:>10.3f} {result['status']:>9} "
+                f"{result['idle_hours']:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
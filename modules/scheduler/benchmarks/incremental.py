@@ -0,0 +1,94 @@
+import argparse
+import time as timer
+
+from modules.scheduler.benchmarks.instances import generate_synthetic_instance
+from modules.scheduler.models import SolverParameters
+from modules.scheduler.neighborhood import ChangeSet
+from modules.scheduler.or_tools_scheduler import ORToolsScheduler
+
+STRATEGIES = ["maximize_coverage", "minimize_gaps", "balance_workload"]
+
+
+def run(
+    strategy: str, num_people: int, num_weeks: int, year: int, max_time_in_seconds: float
+) -> dict:
+    availability_hours, business_service_hours = generate_synthetic_instance(num_people)
+    weeks = list(range(1, num_weeks + 1))
+    solver_parameters = SolverParameters(max_time_in_seconds=max_time_in_seconds)
+    scheduler = ORToolsScheduler()
+    current = scheduler.solve(
+        availability_hours, business_service_hours, weeks, year, strategy, solver_parameters
+    )
+    leaving = current.assignments[0].person_id
+    availability_hours = [ah for ah in availability_hours if ah.person_id != leaving]
+
+    started = timer.perf_counter()
+    full = scheduler.solve(
+        availability_hours,
+        business_service_hours,
+        weeks,
+        year,
+        strategy,
+        solver_parameters,
+        current.assignments,
+    )
+    full_time = timer.perf_counter() - started
+
+    started = timer.perf_counter()
+    incremental = scheduler.reoptimize(
+        availability_hours,
+        business_service_hours,
+        weeks,
+        year,
+        strategy,
+        current.assignments,
+        ChangeSet(person_ids={leaving}),
+        solver_parameters,
+    )
+    incremental_time = timer.perf_counter() - started
+
+    previous = {(a.person_id, a.date, a.start_time) for a in current.assignments}
+    return {
+        "full_time": full_time,
+        "incremental_time": incremental_time,
+        "full_uncovered": len(full.uncoverable_slots),
+        "incremental_uncovered": len(incremental.uncoverable_slots),
+        "full_changed": sum(
+            (a.person_id, a.date, a.start_time) not in previous for a in full.assignments
+        ),
+        "incremental_changed": sum(
+            (a.person_id, a.date, a.start_time) not in previous
+            for a in incremental.assignments
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare a full re-solve with an incremental re-solve after "
+        "one person leaves"
+    )
+    parser.add_argument("--strategies", nargs="+", default=STRATEGIES)
+    parser.add_argument("--people", type=int, nargs="+", default=[30, 100])
+    parser.add_argument("--weeks", type=int, default=4)
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--max-time", type=float, default=30.0)
+    args = parser.parse_args()
+
+    print(
+        f"{'strategy':>18} {'people':>7} {'full (s)':>9} {'incr (s)':>9} "
+        f"{'full changed':>13} {'incr changed':>13} {'uncovered':>10}"
+    )
+    for strategy in args.strategies:
+        for num_people in args.people:
+            result = run(strategy, num_people, args.weeks, args.year, args.max_time)
+            print(
+                f"{strategy:>18} {num_people:>7} {result['full_time']:>9.3f} "
+                f"{result['incremental_time']:>9.3f} {result['full_changed']:>13} "
+                f"{result['incremental_changed']:>13} "
+                f"{result['full_uncovered']}/{result['incremental_uncovered']:<8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
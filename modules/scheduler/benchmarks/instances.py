@@ -0,0 +1,208 @@
+import random
+from datetime import time
+from typing import List, Tuple
+from uuid import UUID
+
+from modules.scheduler.models import AvailabilityHours, BusinessServiceHours
+
+SHIFTS = [
+    (time(8, 0), time(12, 0)),
+    (time(12, 0), time(16, 0)),
+    (time(16, 0), time(20, 0)),
+]
+
+SPLIT_SHIFT_WINDOWS = [(6, 14), (15, 23)]
+
+SERVICE_WINDOW = (8, 20)
+
+
+def generate_instance(
+    num_people: int, seed: int = 0
+) -> Tuple[List[AvailabilityHours], List[BusinessServiceHours]]:
+    rng = random.Random(seed)
+    role_id = _uuid(rng)
+
+    business_service_hours = [
+        BusinessServiceHours(
+            id=_uuid(rng),
+            role_id=role_id,
+            day_of_week=day,
+            start_time=start,
+            end_time=end,
+            is_recurring=True,
+        )
+        for day in range(7)
+        for start, end in SHIFTS
+    ]
+
+    availability_hours = []
+    for _ in range(num_people):
+        person_id = _uuid(rng)
+        for day in rng.sample(range(7), rng.randint(3, 5)):
+            first, last = sorted(rng.sample(range(len(SHIFTS)), 2))
+            availability_hours.append(
+                AvailabilityHours(
+                    id=_uuid(rng),
+                    person_id=person_id,
+                    role_id=role_id,
+                    day_of_week=day,
+                    start_time=SHIFTS[first][0],
+                    end_time=SHIFTS[last][1],
+                    is_recurring=True,
+                )
+            )
+
+    return availability_hours, business_service_hours
+
+
+def generate_split_shift_instance(
+    num_people: int, shifts_per_day: int = 24, seed: int = 0
+) -> Tuple[List[AvailabilityHours], List[BusinessServiceHours]]:
+    rng = random.Random(seed)
+    role_id = _uuid(rng)
+
+    business_service_hours = []
+    for day in range(7):
+        for _ in range(shifts_per_day):
+            window_start, window_end = rng.choice(SPLIT_SHIFT_WINDOWS)
+            length = rng.choice([4, 6, 8])
+            start_half_hour = rng.randint(window_start * 2, window_end * 2 - length)
+            business_service_hours.append(
+                BusinessServiceHours(
+                    id=_uuid(rng),
+                    role_id=role_id,
+                    day_of_week=day,
+                    start_time=_half_hour(start_half_hour),
+                    end_time=_half_hour(start_half_hour + length),
+                    is_recurring=True,
+                )
+            )
+
+    availability_hours = []
+    for _ in range(num_people):
+        person_id = _uuid(rng)
+        for day in range(7):
+            for window_start, window_end in SPLIT_SHIFT_WINDOWS:
+                availability_hours.append(
+                    AvailabilityHours(
+                        id=_uuid(rng),
+                        person_id=person_id,
+                        role_id=role_id,
+                        day_of_week=day,
+                        start_time=time(window_start, 0),
+                        end_time=time(window_end, 0),
+                        is_recurring=True,
+                    )
+                )
+
+    return availability_hours, business_service_hours
+
+
+def generate_synthetic_instance(
+    num_people: int,
+    density: float = 0.6,
+    overlap: float = 0.25,
+    shifts_per_day: int = 6,
+    seed: int = 0,
+) -> Tuple[List[AvailabilityHours], List[BusinessServiceHours]]:
+    rng = random.Random(seed)
+    role_id = _uuid(rng)
+
+    window_start, window_end = SERVICE_WINDOW
+    span = (window_end - window_start) * 2
+    length = max(1, round(span / (1 + (shifts_per_day - 1) * (1 - overlap))))
+    step = max(1, round(length * (1 - overlap)))
+    shifts = []
+    for index in range(shifts_per_day):
+        start = window_start * 2 + index * step
+        end = min(start + length, 47)
+        if start < end:
+            shifts.append((start, end))
+
+    business_service_hours = [
+        BusinessServiceHours(
+            id=_uuid(rng),
+            role_id=role_id,
+            day_of_week=day,
+            start_time=_half_hour(start),
+            end_time=_half_hour(end),
+            is_recurring=True,
+        )
+        for day in range(7)
+        for start, end in shifts
+    ]
+
+    availability_hours = []
+    for _ in range(num_people):
+        person_id = _uuid(rng)
+        for day in range(7):
+            if rng.random() >= density:
+                continue
+            first, last = sorted(rng.choices(range(len(shifts)), k=2))
+            availability_hours.append(
+                AvailabilityHours(
+                    id=_uuid(rng),
+                    person_id=person_id,
+                    role_id=role_id,
+                    day_of_week=day,
+                    start_time=_half_hour(shifts[first][0]),
+                    end_time=_half_hour(max(end for _, end in shifts[first : last + 1])),
+                    is_recurring=True,
+                )
+            )
+
+    return availability_hours, business_service_hours
+
+
+def generate_sparse_instance(
+    num_people: int,
+    shifts_per_day: int = 24,
+    single_share: float = 0.5,
+    seed: int = 0,
+) -> Tuple[List[AvailabilityHours], List[BusinessServiceHours]]:
+    rng = random.Random(seed)
+    role_id = _uuid(rng)
+    person_ids = [_uuid(rng) for _ in range(num_people)]
+
+    window_start, window_end = SERVICE_WINDOW
+    business_service_hours = []
+    availability_hours = []
+    for day in range(7):
+        for _ in range(shifts_per_day):
+            length = rng.choice([4, 6, 8])
+            start_half_hour = rng.randint(window_start * 2, window_end * 2 - length)
+            start_time = _half_hour(start_half_hour)
+            end_time = _half_hour(start_half_hour + length)
+            business_service_hours.append(
+                BusinessServiceHours(
+                    id=_uuid(rng),
+                    role_id=role_id,
+                    day_of_week=day,
+                    start_time=start_time,
+                    end_time=end_time,
+                    is_recurring=True,
+                )
+            )
+            num_candidates = 1 if rng.random() < single_share else rng.randint(2, 4)
+            for person_id in rng.sample(person_ids, num_candidates):
+                availability_hours.append(
+                    AvailabilityHours(
+                        id=_uuid(rng),
+                        person_id=person_id,
+                        role_id=role_id,
+                        day_of_week=day,
+                        start_time=start_time,
+                        end_time=end_time,
+                        is_recurring=True,
+                    )
+                )
+
+    return availability_hours, business_service_hours
+
+
+def _half_hour(index: int) -> time:
+    return time(index // 2, 30 * (index % 2))
+
+
+def _uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
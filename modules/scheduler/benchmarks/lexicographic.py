@@ -0,0 +1,112 @@
+import argparse
+import time as timer
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List
+from uuid import UUID
+
+from modules.scheduler.benchmarks.instances import generate_sparse_instance
+from modules.scheduler.interfaces import Assignment
+from modules.scheduler.models import SolverParameters
+from modules.scheduler.or_tools_scheduler import ORToolsScheduler
+
+STRATEGIES = ["maximize_coverage", "minimize_gaps", "balance_workload", "lexicographic"]
+
+
+def measure_schedule(assignments: List[Assignment]) -> dict:
+    shifts: Dict[UUID, List[tuple]] = defaultdict(list)
+    for assignment in assignments:
+        shifts[assignment.person_id].append(
+            (
+                datetime.combine(assignment.date, assignment.start_time),
+                datetime.combine(assignment.date, assignment.end_time),
+            )
+        )
+
+    idle_hours = 0.0
+    worked_hours = []
+    for person_shifts in shifts.values():
+        person_shifts.sort()
+        worked_hours.append(
+            sum((end - start).total_seconds() for start, end in person_shifts) / 3600
+        )
+        for (_, end), (start, _) in zip(person_shifts, person_shifts[1:]):
+            if start.date() == end.date() and start > end:
+                idle_hours += (start - end).total_seconds() / 3600
+
+    return {
+        "covered": len(assignments),
+        "idle_hours": idle_hours,
+        "spread": max(worked_hours) - min(worked_hours) if worked_hours else 0.0,
+    }
+
+
+def run(
+    strategy: str,
+    num_people: int,
+    shifts_per_day: int,
+    single_share: float,
+    weeks: List[int],
+    year: int,
+    max_time_in_seconds: float,
+) -> dict:
+    availability_hours, business_service_hours = generate_sparse_instance(
+        num_people, shifts_per_day=shifts_per_day, single_share=single_share
+    )
+    started = timer.perf_counter()
+    result = ORToolsScheduler().solve(
+        availability_hours,
+        business_service_hours,
+        weeks,
+        year,
+        strategy,
+        SolverParameters(max_time_in_seconds=max_time_in_seconds, random_seed=0),
+    )
+    return {
+        **measure_schedule(result.assignments),
+        "uncoverable": len(result.uncoverable_slots),
+        "solver_runs": len(result.stats.solver_runs),
+        "time": timer.perf_counter() - started,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare the lexicographic coverage, gaps and balance "
+        "pipeline against each single-objective strategy"
+    )
+    parser.add_argument("--strategies", nargs="+", default=STRATEGIES)
+    parser.add_argument("--people", type=int, nargs="+", default=[10, 30])
+    parser.add_argument("--shifts-per-day", type=int, default=8)
+    parser.add_argument("--single-share", type=float, default=0.3)
+    parser.add_argument("--weeks", type=int, default=1)
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--max-time", type=float, default=30.0)
+    args = parser.parse_args()
+
+    weeks = list(range(1, args.weeks + 1))
+    print(
+        f"{'people':>7} {'strategy':>18} {'covered':>8} {'uncoverable':>12} "
+        f"{'idle (h)':>9} {'spread (h)':>11} {'runs':>5} {'time (s)':>9}"
+    )
+    for num_people in args.people:
+        for strategy in args.strategies:
+            result = run(
+                strategy,
+                num_people,
+                args.shifts_per_day,
+                args.single_share,
+                weeks,
+                args.year,
+                args.max_time,
+            )
+            print(
+                f"{num_people:>7} {strategy:>18} {result['covered']:>8} "
+                f"{result['uncoverable']:>12} {result['idle_hours']:>9.1f} "
+                f"{result['spread']:>11.1f} {result['solver_runs']:>5} "
+                f"{result['time']:>9.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+import argparse
+import time as timer
+from typing import Dict, List, Tuple
+
+from ortools.sat.python import cp_model
+
+from modules.scheduler.benchmarks.instances import generate_split_shift_instance
+from modules.scheduler.encoding import EncodedProblem
+from modules.scheduler.models import SolverParameters
+from modules.scheduler.or_tools_scheduler import ORToolsScheduler
+
+
+class PairwiseOverlapScheduler(ORToolsScheduler):
+    def _add_no_overlap_constraints(
+        self,
+        model: cp_model.CpModel,
+        problem: EncodedProblem,
+        person_slots: Dict[int, List[int]],
+        assignments: Dict[Tuple[int, int], cp_model.IntVar],
+    ) -> None:
+        absolute_starts = problem.absolute_starts
+        absolute_ends = problem.absolute_ends
+        for person, slots in person_slots.items():
+            for slot in slots:
+                for other in slots:
+                    if other == slot:
+                        continue
+                    if (
+                        absolute_ends[slot] <= absolute_starts[other]
+                        or absolute_ends[other] <= absolute_starts[slot]
+                    ):
+                        continue
+                    model.Add(
+                        assignments[(person, slot)] + assignments[(person, other)]
+                        <= 1
+                    )
+
+
+def run(
+    scheduler: ORToolsScheduler,
+    num_people: int,
+    shifts_per_day: int,
+    weeks: list[int],
+    year: int,
+    max_time_in_seconds: float,
+) -> Tuple[float, int, float, float]:
+    availability_hours, business_service_hours = generate_split_shift_instance(
+        num_people, shifts_per_day
+    )
+    date_range = scheduler._get_date_range_for_weeks(weeks, year)
+    person_ids = sorted(scheduler._extract_person_ids(availability_hours))
+    time_slots = scheduler._create_time_slots(business_service_hours, date_range)
+    availability_slots = scheduler._create_availability_slots(
+        availability_hours, person_ids, date_range
+    )
+    problem, slot_candidates = scheduler._encode_problem(
+        person_ids, date_range, time_slots, availability_slots
+    )
+
+    started = timer.perf_counter()
+    model, _ = scheduler._build_model(problem, slot_candidates, "maximize_coverage")
+    build_time = timer.perf_counter() - started
+
+    solver = scheduler._create_solver(
+        SolverParameters(max_time_in_seconds=max_time_in_seconds)
+    )
+    started = timer.perf_counter()
+    solver.Solve(model)
+    solve_time = timer.perf_counter() - started
+
+    return (
+        build_time,
+        len(model.Proto().constraints),
+        solve_time,
+        solver.ObjectiveValue(),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare no-overlap formulations on dense split-shift days"
+    )
+    parser.add_argument("--people", type=int, nargs="+", default=[20, 50])
+    parser.add_argument("--shifts-per-day", type=int, default=24)
+    parser.add_argument("--weeks", type=int, default=1)
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--max-time", type=float, default=30.0)
+    args = parser.parse_args()
+
+    weeks = list(range(1, args.weeks + 1))
+    formulations = {
+        "pairwise": PairwiseOverlapScheduler(),
+        "cliques": ORToolsScheduler(overlap_formulation="cliques"),
+        "intervals": ORToolsScheduler(overlap_formulation="intervals"),
+    }
+    print(
+        f"{'people':>8} {'formulation':>12} {'build (s)':>10} "
+        f"{'constraints':>12} {'solve (s)':>10} {'objective':>10}"
+    )
+    for num_people in args.people:
+        for name, scheduler in formulations.items():
+            build_time, constraints, solve_time, objective = run(
+                scheduler,
+                num_people,
+                args.shifts_per_day,
+                weeks,
+                args.year,
+                args.max_time,
+            )
+            print(
+                f"{num_people:>8} {name:>12} {build_time:>10.3f} "
+                f"{constraints:>12} {solve_time:>10.3f} {objective:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import argparse
+
+from modules.scheduler.benchmarks.instances import generate_sparse_instance
+from modules.scheduler.models import SolverParameters
+from modules.scheduler.or_tools_scheduler import ORToolsScheduler
+
+STRATEGIES = ["minimize_gaps", "balance_workload"]
+
+
+def run(
+    scheduler: ORToolsScheduler,
+    strategy: str,
+    num_people: int,
+    shifts_per_day: int,
+    single_share: float,
+    num_weeks: int,
+    year: int,
+    max_time_in_seconds: float,
+) -> dict:
+    availability_hours, business_service_hours = generate_sparse_instance(
+        num_people, shifts_per_day, single_share
+    )
+    stats = scheduler.solve(
+        availability_hours,
+        business_service_hours,
+        list(range(1, num_weeks + 1)),
+        year,
+        strategy,
+        SolverParameters(max_time_in_seconds=max_time_in_seconds, num_search_workers=1),
+    ).stats
+    return {
+        "num_variables": stats.num_variables,
+        "solve_time": sum(run.wall_time for run in stats.solver_runs),
+        "statuses": [run.status for run in stats.solver_runs],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare CP-SAT solves with and without forced-assignment "
+        "propagation on sparse instances"
+    )
+    parser.add_argument("--strategies", nargs="+", default=STRATEGIES)
+    parser.add_argument("--people", type=int, nargs="+", default=[30, 60])
+    parser.add_argument("--shifts-per-day", type=int, default=12)
+    parser.add_argument("--single-share", type=float, nargs="+", default=[0.5, 0.8])
+    parser.add_argument("--weeks", type=int, default=2)
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--max-time", type=float, default=30.0)
+    args = parser.parse_args()
+
+    modes = {
+        "full": ORToolsScheduler(propagate_forced=False),
+        "reduced": ORToolsScheduler(),
+    }
+    print(
+        f"{'strategy':>18} {'people':>7} {'single':>7} {'mode':>8} "
+        f"{'variables':>10} {'solve (s)':>10}  statuses"
+    )
+    for strategy in args.strategies:
+        for num_people in args.people:
+            for single_share in args.single_share:
+                for name, scheduler in modes.items():
+                    result = run(
+                        scheduler,
+                        strategy,
+                        num_people,
+                        args.shifts_per_day,
+                        single_share,
+                        args.weeks,
+                        args.year,
+                        args.max_time,
+                    )
+                    print(
+                        f"{strategy:>18} {num_people:>7} {single_share:>7} {name:>8} "
+                        f"{result['num_variables']:>10} {result['solve_time']:>10.3f}  "
+                        f"{','.join(result['statuses'])}"
+                    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import argparse
+import time as timer
+from collections import Counter
+
+from modules.scheduler.benchmarks.instances import generate_instance
+from modules.scheduler.models import SolverParameters
+from modules.scheduler.or_tools_scheduler import ORToolsScheduler
+
+
+def run(
+    scheduler: ORToolsScheduler,
+    num_people: int,
+    num_weeks: int,
+    strategy: str,
+    year: int,
+    max_time_in_seconds: float,
+) -> tuple[float, int, int]:
+    availability_hours, business_service_hours = generate_instance(num_people)
+    started = timer.perf_counter()
+    assignments = scheduler.optimize(
+        availability_hours,
+        business_service_hours,
+        list(range(1, num_weeks + 1)),
+        year,
+        strategy,
+        SolverParameters(max_time_in_seconds=max_time_in_seconds),
+    )
+    elapsed = timer.perf_counter() - started
+    hours = Counter()
+    for a in assignments:
+        hours[a.person_id] += scheduler._calculate_duration(a.start_time, a.end_time)
+    spread = max(hours.values()) - min(hours.values()) if hours else 0
+    return elapsed, len(assignments), spread
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare monolithic and rolling-horizon solves as the horizon grows"
+    )
+    parser.add_argument("--people", type=int, default=30)
+    parser.add_argument("--weeks", type=int, nargs="+", default=[2, 4, 8, 16])
+    parser.add_argument("--window-weeks", type=int, default=1)
+    parser.add_argument("--strategy", default="balance_workload")
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--max-time", type=float, default=10.0)
+    args = parser.parse_args()
+
+    modes = {
+        "monolithic": ORToolsScheduler(),
+        "rolling": ORToolsScheduler(rolling_horizon_weeks=args.window_weeks),
+    }
+    print(
+        f"{'weeks':>6} {'mode':>11} {'time (s)':>9} "
+        f"{'assignments':>12} {'hours spread':>13}"
+    )
+    for num_weeks in args.weeks:
+        for name, scheduler in modes.items():
+            elapsed, count, spread = run(
+                scheduler,
+                args.people,
+                num_weeks,
+                args.strategy,
+                args.year,
+                args.max_time,
+            )
+            print(
+                f"{num_weeks:>6} {name:>11} {elapsed:>9.3f} "
+                f"{count:>12} {spread:>13}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+import argparse
+import json
+import multiprocessing
+import resource
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from itertools import product, repeat
+from pathlib import Path
+from typing import Dict, List
+
+from modules.scheduler.benchmarks.instances import generate_synthetic_instance
+from modules.scheduler.interfaces import Assignment
+from modules.scheduler.models import SolverParameters
+from modules.scheduler.or_tools_scheduler import ORToolsScheduler
+from modules.scheduler.overlap import interval_minutes
+
+STRATEGIES = ["maximize_coverage", "minimize_gaps", "balance_workload"]
+OBJECTIVE_SENSES = {"maximize_coverage": 1, "minimize_gaps": -1, "balance_workload": -1}
+BUILD_PHASES = [
+    "expansion",
+    "encoding",
+    "reduction",
+    "variables",
+    "constraints",
+    "objective",
+]
+SOLVE_PHASES = ["greedy", "flows", "presolve", "search", "extraction"]
+BASELINE_PATH = Path(__file__).parent / "baselines" / "scaling.json"
+MIN_TIME_DELTA = 0.05
+MIN_MEMORY_DELTA = 16.0
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    strategy: str
+    num_people: int
+    num_weeks: int
+    density: float
+    overlap: float
+    shifts_per_day: int
+    seed: int
+
+    @property
+    def key(self) -> str:
+        return (
+            f"{self.strategy}/people={self.num_people}/weeks={self.num_weeks}"
+            f"/density={self.density}/overlap={self.overlap}"
+            f"/shifts={self.shifts_per_day}/seed={self.seed}"
+        )
+
+
+def build_grid(args: argparse.Namespace) -> List[BenchmarkCase]:
+    return [
+        BenchmarkCase(
+            strategy,
+            num_people,
+            num_weeks,
+            density,
+            overlap,
+            args.shifts_per_day,
+            args.seed,
+        )
+        for strategy, num_people, num_weeks, density, overlap in product(
+            args.strategies, args.people, args.weeks, args.density, args.overlap
+        )
+    ]
+
+
+def run_case(case: BenchmarkCase, year: int, max_time_in_seconds: float) -> dict:
+    availability_hours, business_service_hours = generate_synthetic_instance(
+        case.num_people, case.density, case.overlap, case.shifts_per_day, case.seed
+    )
+    result = ORToolsScheduler().solve(
+        availability_hours,
+        business_service_hours,
+        list(range(1, case.num_weeks + 1)),
+        year,
+        case.strategy,
+        SolverParameters(max_time_in_seconds=max_time_in_seconds, random_seed=case.seed),
+    )
+    stats = result.stats
+    return {
+        "key": case.key,
+        **asdict(case),
+        "build_time": sum(stats.phase_times.get(phase, 0.0) for phase in BUILD_PHASES),
+        "solve_time": sum(stats.phase_times.get(phase, 0.0) for phase in SOLVE_PHASES),
+        "wall_time": stats.wall_time,
+        "peak_memory_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "objective": measure_objective(case.strategy, result.assignments),
+        "assignments": len(result.assignments),
+        "uncoverable_slots": len(result.uncoverable_slots),
+        "num_variables": stats.num_variables,
+        "num_constraints": stats.num_constraints,
+        "solver_statuses": [run.status for run in stats.solver_runs],
+    }
+
+
+def measure_objective(strategy: str, assignments: List[Assignment]) -> float:
+    if strategy == "balance_workload":
+        minutes = Counter()
+        for a in assignments:
+            start, end = interval_minutes(a.start_time, a.end_time)
+            minutes[a.person_id] += end - start
+        return (max(minutes.values()) - min(minutes.values())) / 60 if minutes else 0.0
+
+    if strategy == "minimize_gaps":
+        days: Dict[tuple, List[tuple]] = defaultdict(list)
+        for a in assignments:
+            days[(a.person_id, a.date)].append(interval_minutes(a.start_time, a.end_time))
+        gap_minutes = 0
+        for intervals in days.values():
+            intervals.sort()
+            gap_minutes += sum(
+                max(0, start - end)
+                for (_, end), (start, _) in zip(intervals, intervals[1:])
+            )
+        return gap_minutes / 60
+
+    return float(len(assignments))
+
+
+def run_grid(
+    cases: List[BenchmarkCase], year: int, max_time_in_seconds: float
+) -> List[dict]:
+    with ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=1,
+    ) as executor:
+        return list(
+            executor.map(run_case, cases, repeat(year), repeat(max_time_in_seconds))
+        )
+
+
+def find_regressions(
+    results: List[dict],
+    baseline: List[dict],
+    time_threshold: float,
+    memory_threshold: float,
+    objective_tolerance: float,
+) -> List[str]:
+    baseline_by_key = {case["key"]: case for case in baseline}
+    regressions = []
+    for case in results:
+        previous = baseline_by_key.get(case["key"])
+        if previous is None:
+            continue
+
+        for metric in ["build_time", "solve_time"]:
+            if (
+                case[metric] > previous[metric] * time_threshold
+                and case[metric] - previous[metric] > MIN_TIME_DELTA
+            ):
+                regressions.append(
+                    f"{case['key']}: {metric} {previous[metric]:.3f}s -> {case[metric]:.3f}s"
+                )
+
+        if (
+            case["peak_memory_mb"] > previous["peak_memory_mb"] * memory_threshold
+            and case["peak_memory_mb"] - previous["peak_memory_mb"] > MIN_MEMORY_DELTA
+        ):
+            regressions.append(
+                f"{case['key']}: peak_memory_mb "
+                f"{previous['peak_memory_mb']:.1f} -> {case['peak_memory_mb']:.1f}"
+            )
+
+        sense = OBJECTIVE_SENSES[case["strategy"]]
+        allowed = objective_tolerance * max(abs(previous["objective"]), 1.0)
+        if sense * (case["objective"] - previous["objective"]) < -allowed:
+            regressions.append(
+                f"{case['key']}: objective {previous['objective']:g} -> {case['objective']:g}"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Run every strategy over a grid of synthetic instances and "
+        "compare against a stored baseline"
+    )
+    parser.add_argument("--strategies", nargs="+", default=STRATEGIES)
+    parser.add_argument("--people", type=int, nargs="+", default=[10, 30])
+    parser.add_argument("--weeks", type=int, nargs="+", default=[1, 2])
+    parser.add_argument("--density", type=float, nargs="+", default=[0.6])
+    parser.add_argument("--overlap", type=float, nargs="+", default=[0.25])
+    parser.add_argument("--shifts-per-day", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--max-time", type=float, default=10.0)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--time-threshold", type=float, default=1.5)
+    parser.add_argument("--memory-threshold", type=float, default=1.25)
+    parser.add_argument("--objective-tolerance", type=float, default=0.05)
+    args = parser.parse_args()
+
+    results = run_grid(build_grid(args), args.year, args.max_time)
+    print(
+        f"{'strategy':>18} {'people':>7} {'weeks':>6} {'build (s)':>10} "
+        f"{'solve (s)':>10} {'peak (MB)':>10} {'objective':>10}"
+    )
+    for case in results:
+        print(
+            f"{case['strategy']:>18} {case['num_people']:>7} {case['num_weeks']:>6} "
+            f"{case['build_time']:>10.3f} {case['solve_time']:>10.3f} "
+            f"{case['peak_memory_mb']:>10.1f} {case['objective']:>10g}"
+        )
+
+    report = {"max_time_in_seconds": args.max_time, "cases": results}
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        return
+    if not args.baseline.exists():
+        return
+
+    regressions = find_regressions(
+        results,
+        json.loads(args.baseline.read_text())["cases"],
+        args.time_threshold,
+        args.memory_threshold,
+        args.objective_tolerance,
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
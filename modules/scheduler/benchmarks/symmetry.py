@@ -0,0 +1,87 @@
+import argparse
+
+from modules.scheduler.benchmarks.instances import generate_split_shift_instance
+from modules.scheduler.benchmarks.scaling import measure_objective
+from modules.scheduler.models import SolverParameters
+from modules.scheduler.or_tools_scheduler import ORToolsScheduler
+
+STRATEGIES = ["balance_workload", "minimize_gaps"]
+
+
+def run(
+    scheduler: ORToolsScheduler,
+    strategy: str,
+    num_people: int,
+    shifts_per_day: int,
+    num_weeks: int,
+    year: int,
+    max_time_in_seconds: float,
+    seed: int,
+) -> dict:
+    availability_hours, business_service_hours = generate_split_shift_instance(
+        num_people, shifts_per_day, seed
+    )
+    result = scheduler.solve(
+        availability_hours,
+        business_service_hours,
+        list(range(1, num_weeks + 1)),
+        year,
+        strategy,
+        SolverParameters(max_time_in_seconds=max_time_in_seconds, random_seed=seed),
+    )
+    runs = result.stats.solver_runs
+    return {
+        "solve_time": sum(run.wall_time for run in runs),
+        "objective": measure_objective(strategy, result.assignments),
+        "gap": max(
+            (abs(run.objective_value - run.best_objective_bound) for run in runs),
+            default=0.0,
+        ),
+        "statuses": [run.status for run in runs],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare CP-SAT solves with and without symmetry breaking on "
+        "pools of people with identical availability"
+    )
+    parser.add_argument("--strategies", nargs="+", default=STRATEGIES)
+    parser.add_argument("--people", type=int, nargs="+", default=[20, 30, 40])
+    parser.add_argument("--shifts-per-day", type=int, default=12)
+    parser.add_argument("--weeks", type=int, default=1)
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-time", type=float, default=30.0)
+    args = parser.parse_args()
+
+    modes = {
+        "plain": ORToolsScheduler(),
+        "symmetry": ORToolsScheduler(symmetry_breaking=True),
+    }
+    print(
+        f"{'strategy':>18} {'people':>7} {'mode':>9} {'solve (s)':>10} "
+        f"{'objective':>10} {'gap':>8}  statuses"
+    )
+    for strategy in args.strategies:
+        for num_people in args.people:
+            for name, scheduler in modes.items():
+                result = run(
+                    scheduler,
+                    strategy,
+                    num_people,
+                    args.shifts_per_day,
+                    args.weeks,
+                    args.year,
+                    args.max_time,
+                    args.seed,
+                )
+                print(
+                    f"{strategy:>18} {num_people:>7} {name:>9} "
+                    f"{result['solve_time']:>10.3f} {result['objective']:>10g} "
+                    f"{result['gap']:>8g}  {','.join(result['statuses'])}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import argparse
+import tempfile
+import time as timer
+from pathlib import Path
+
+from ortools.sat.python import cp_model
+
+from modules.scheduler.benchmarks.instances import generate_synthetic_instance
+from modules.scheduler.or_tools_scheduler import ORToolsScheduler
+from modules.scheduler.stats import SolveStats
+
+STRATEGIES = ["maximize_coverage", "minimize_gaps", "balance_workload"]
+
+
+def measure_build(
+    scheduler: ORToolsScheduler,
+    strategy: str,
+    num_people: int,
+    shifts_per_day: int,
+    weeks: list[int],
+    year: int,
+    repeats: int,
+) -> dict:
+    availability_hours, business_service_hours = generate_synthetic_instance(
+        num_people, shifts_per_day=shifts_per_day
+    )
+    problem, slot_candidates = scheduler._encode_window(
+        availability_hours, business_service_hours, weeks, year, SolveStats()
+    )
+
+    best = float("inf")
+    for _ in range(repeats):
+        problem.__dict__.pop("slot_labels", None)
+        started = timer.perf_counter()
+        model, _ = scheduler._build_model(problem, slot_candidates, strategy)
+        best = min(best, timer.perf_counter() - started)
+    return {"build_time": best, "proto_bytes": measure_proto_size(model)}
+
+
+def measure_proto_size(model: cp_model.CpModel) -> int:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "model.pb"
+        model.ExportToFile(str(path))
+        return path.stat().st_size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare model-build time and proto size with and without "
+        "readable CP-SAT variable names"
+    )
+    parser.add_argument("--strategies", nargs="+", default=STRATEGIES)
+    parser.add_argument("--people", type=int, nargs="+", default=[100, 300, 1000])
+    parser.add_argument("--shifts-per-day", type=int, default=6)
+    parser.add_argument("--weeks", type=int, default=4)
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    weeks = list(range(1, args.weeks + 1))
+    modes = {
+        "named": ORToolsScheduler(variable_names=True),
+        "unnamed": ORToolsScheduler(variable_names=False),
+    }
+    print(
+        f"{'strategy':>18} {'people':>7} {'mode':>8} {'build (s)':>10} "
+        f"{'proto (KiB)':>12}"
+    )
+    for strategy in args.strategies:
+        for num_people in args.people:
+            for name, scheduler in modes.items():
+                result = measure_build(
+                    scheduler,
+                    strategy,
+                    num_people,
+                    args.shifts_per_day,
+                    weeks,
+                    args.year,
+                    args.repeats,
+                )
+                print(
+                    f"{strategy:>18} {num_people:>7} {name:>8} "
+                    f"{result['build_time']:>10.3f} "
+                    f"{result['proto_bytes'] / 1024:>12.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
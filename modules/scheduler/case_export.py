@@ -0,0 +1,141 @@
+import json
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, time
+from pathlib import Path
+from typing import Any, Dict, List, get_args, get_type_hints
+from uuid import UUID, uuid4
+
+from ortools.sat.python import cp_model
+
+from modules.scheduler.interfaces import Assignment
+from modules.scheduler.models import (
+    AvailabilityHours,
+    BusinessServiceHours,
+    SolverParameters,
+)
+
+INPUTS_FILE = "inputs.json"
+MODEL_PATTERN = "model-*.pbtxt"
+
+
+@dataclass
+class ExportedCase:
+    path: Path
+    availability_hours: list[AvailabilityHours]
+    business_service_hours: list[BusinessServiceHours]
+    weeks: list[int]
+    year: int
+    strategy: str
+    solver_parameters: SolverParameters
+    hints: list[Assignment] | None = None
+    scheduler: str = "ORToolsScheduler"
+    scheduler_options: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def model_files(self) -> List[Path]:
+        return sorted(self.path.glob(MODEL_PATTERN))
+
+
+def export_case(
+    export_dir: str | Path,
+    availability_hours: list[AvailabilityHours],
+    business_service_hours: list[BusinessServiceHours],
+    weeks: list[int],
+    year: int,
+    strategy: str,
+    solver_parameters: SolverParameters,
+    hints: list[Assignment] | None,
+    scheduler: str,
+    scheduler_options: Dict[str, Any],
+) -> Path:
+    case_dir = Path(export_dir) / (
+        f"{datetime.now():%Y%m%dT%H%M%S}-{strategy}-{uuid4().hex[:8]}"
+    )
+    case_dir.mkdir(parents=True)
+    inputs = {
+        "scheduler": scheduler,
+        "scheduler_options": scheduler_options,
+        "weeks": weeks,
+        "year": year,
+        "strategy": strategy,
+        "solver_parameters": asdict(solver_parameters),
+        "availability_hours": [asdict(ah) for ah in availability_hours],
+        "business_service_hours": [asdict(bsh) for bsh in business_service_hours],
+        "hints": [asdict(hint) for hint in hints] if hints is not None else None,
+    }
+    (case_dir / INPUTS_FILE).write_text(json.dumps(inputs, indent=2, default=_encode))
+    return case_dir
+
+
+def export_model(model: cp_model.CpModel, case_dir: str | Path) -> Path:
+    path = Path(case_dir) / f"model-{datetime.now():%H%M%S%f}-{uuid4().hex[:8]}.pbtxt"
+    model.ExportToFile(str(path))
+    return path
+
+
+def load_case(case_dir: str | Path) -> ExportedCase:
+    case_dir = Path(case_dir)
+    inputs = json.loads((case_dir / INPUTS_FILE).read_text())
+    return ExportedCase(
+        path=case_dir,
+        availability_hours=[
+            _from_dict(AvailabilityHours, ah) for ah in inputs["availability_hours"]
+        ],
+        business_service_hours=[
+            _from_dict(BusinessServiceHours, bsh)
+            for bsh in inputs["business_service_hours"]
+        ],
+        weeks=inputs["weeks"],
+        year=inputs["year"],
+        strategy=inputs["strategy"],
+        solver_parameters=SolverParameters(**inputs["solver_parameters"]),
+        hints=(
+            [_from_dict(Assignment, hint) for hint in inputs["hints"]]
+            if inputs["hints"] is not None
+            else None
+        ),
+        scheduler=inputs["scheduler"],
+        scheduler_options=inputs["scheduler_options"],
+    )
+
+
+def load_model(path: str | Path) -> cp_model.CpModel:
+    model = cp_model.CpModel()
+    model.Proto().parse_text_format(Path(path).read_text())
+    return model
+
+
+def find_cases(paths: List[str | Path]) -> List[Path]:
+    cases = []
+    for path in map(Path, paths):
+        if (path / INPUTS_FILE).exists():
+            cases.append(path)
+        else:
+            cases.extend(sorted(inputs.parent for inputs in path.glob(f"*/{INPUTS_FILE}")))
+    return cases
+
+
+def _encode(value: Any) -> str:
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _from_dict(cls: type, data: Dict[str, Any]) -> Any:
+    hints = get_type_hints(cls)
+    return cls(**{name: _decode(value, hints[name]) for name, value in data.items()})
+
+
+def _decode(value: Any, annotation: Any) -> Any:
+    if value is None:
+        return None
+    kinds = get_args(annotation) or (annotation,)
+    if UUID in kinds:
+        return UUID(value)
+    if date in kinds:
+        return date.fromisoformat(value)
+    if time in kinds:
+        return time.fromisoformat(value)
+    return value
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from ortools.sat.python import cp_model
+
+
+@dataclass
+class SharedModel:
+    model: cp_model.CpModel
+    assignments: Dict[Tuple[int, int], cp_model.IntVar]
+    slot_candidates: Dict[int, List[int]]
+    person_slots: Dict[int, List[int]]
+
+
+def clone_shared_model(
+    shared: SharedModel,
+) -> Tuple[cp_model.CpModel, Dict[Tuple[int, int], cp_model.IntVar]]:
+    model = shared.model.Clone()
+    assignments = {
+        pair: model.GetIntVarFromProtoIndex(var.Index())
+        for pair, var in shared.assignments.items()
+    }
+    return model, assignments
@@ -0,0 +1,171 @@
+from collections import defaultdict
+from typing import Dict, List, Sequence, Set, Tuple
+
+import numpy as np
+from ortools.graph.python import min_cost_flow
+
+SOURCE = 0
+SINK = 1
+
+
+def find_overlap_components(
+    slots: Sequence[int], starts: Sequence[int], ends: Sequence[int]
+) -> List[List[int]]:
+    components: List[List[int]] = []
+    component_end = None
+    for slot in sorted(slots, key=lambda slot: (starts[slot], ends[slot], slot)):
+        if component_end is not None and starts[slot] < component_end:
+            components[-1].append(slot)
+            component_end = max(component_end, ends[slot])
+        else:
+            components.append([slot])
+            component_end = ends[slot]
+    return components
+
+
+def is_clique(
+    component: Sequence[int], starts: Sequence[int], ends: Sequence[int]
+) -> bool:
+    return max(starts[slot] for slot in component) < min(
+        ends[slot] for slot in component
+    )
+
+
+def has_identical_candidates(
+    component: Sequence[int], slot_candidates: Dict[int, List[int]]
+) -> bool:
+    first = slot_candidates[component[0]]
+    return all(slot_candidates[slot] == first for slot in component[1:])
+
+
+def match_slots_to_people(
+    component: Sequence[int],
+    slot_candidates: Dict[int, List[int]],
+    hinted_pairs: Set[Tuple[int, int]],
+) -> Dict[int, int]:
+    people = sorted({person for slot in component for person in slot_candidates[slot]})
+    person_nodes = {person: 2 + len(component) + index for index, person in enumerate(people)}
+
+    tails, heads, costs = [], [], []
+    for index, slot in enumerate(component):
+        tails.append(SOURCE)
+        heads.append(2 + index)
+        costs.append(0)
+        for person in slot_candidates[slot]:
+            tails.append(2 + index)
+            heads.append(person_nodes[person])
+            costs.append(0 if (person, slot) in hinted_pairs else 1)
+    for node in person_nodes.values():
+        tails.append(node)
+        heads.append(SINK)
+        costs.append(0)
+
+    flow = min_cost_flow.SimpleMinCostFlow()
+    arcs = flow.add_arcs_with_capacity_and_unit_cost(
+        np.array(tails), np.array(heads), np.ones(len(tails), dtype=np.int64), np.array(costs)
+    )
+    flow.set_node_supply(SOURCE, len(component))
+    flow.set_node_supply(SINK, -len(component))
+    if flow.solve_max_flow_with_min_cost() != flow.OPTIMAL:
+        return {}
+
+    node_people = {node: person for person, node in person_nodes.items()}
+    slot_people = {}
+    for arc in arcs[flow.flows(arcs) > 0]:
+        tail, head = flow.tail(arc), flow.head(arc)
+        if tail >= 2 and head in node_people:
+            slot_people[component[tail - 2]] = node_people[head]
+    return slot_people
+
+
+def schedule_identical_people(
+    component: Sequence[int],
+    people: Sequence[int],
+    starts: Sequence[int],
+    ends: Sequence[int],
+    hinted_pairs: Set[Tuple[int, int]],
+) -> Dict[int, int]:
+    times = sorted({starts[slot] for slot in component} | {ends[slot] for slot in component})
+    time_nodes = {minute: node for node, minute in enumerate(times)}
+    capacity = len(people)
+
+    tails = list(range(len(times) - 1)) + [time_nodes[starts[slot]] for slot in component]
+    heads = list(range(1, len(times))) + [time_nodes[ends[slot]] for slot in component]
+    capacities = [capacity] * (len(times) - 1) + [1] * len(component)
+    costs = [0] * (len(times) - 1) + [-1] * len(component)
+
+    flow = min_cost_flow.SimpleMinCostFlow()
+    arcs = flow.add_arcs_with_capacity_and_unit_cost(
+        np.array(tails), np.array(heads), np.array(capacities), np.array(costs)
+    )
+    flow.set_node_supply(0, capacity)
+    flow.set_node_supply(len(times) - 1, -capacity)
+    if flow.solve() != flow.OPTIMAL:
+        return {}
+
+    slot_flows = flow.flows(arcs)[len(times) - 1 :]
+    selected = [slot for slot, used in zip(component, slot_flows.tolist()) if used]
+    return _assign_intervals(selected, people, starts, ends, hinted_pairs)
+
+
+def _assign_intervals(
+    slots: Sequence[int],
+    people: Sequence[int],
+    starts: Sequence[int],
+    ends: Sequence[int],
+    hinted_pairs: Set[Tuple[int, int]],
+) -> Dict[int, int]:
+    hinted_people = defaultdict(set)
+    for person, slot in hinted_pairs:
+        hinted_people[slot].add(person)
+
+    busy_until = {person: None for person in people}
+    slot_people = {}
+    for slot in sorted(slots, key=lambda slot: (starts[slot], ends[slot])):
+        free_people = [
+            person
+            for person, until in busy_until.items()
+            if until is None or until <= starts[slot]
+        ]
+        hinted = [person for person in free_people if person in hinted_people[slot]]
+        person = min(hinted or free_people)
+        busy_until[person] = ends[slot]
+        slot_people[slot] = person
+    return slot_people
+
+
+def solve_coverage_flows(
+    slot_candidates: Dict[int, List[int]],
+    starts: Sequence[int],
+    ends: Sequence[int],
+    hinted_pairs: Set[Tuple[int, int]],
+) -> Tuple[Dict[int, int], Dict[int, List[int]]]:
+    loads: Dict[int, int] = defaultdict(int)
+    slot_people: Dict[int, int] = {}
+    remaining: Dict[int, List[int]] = {}
+    for component in find_overlap_components(list(slot_candidates), starts, ends):
+        if len(component) == 1:
+            slot = component[0]
+            candidates = slot_candidates[slot]
+            hinted = [person for person in candidates if (person, slot) in hinted_pairs]
+            component_people = {
+                slot: min(hinted or candidates, key=lambda person: (loads[person], person))
+            }
+        elif is_clique(component, starts, ends):
+            component_people = match_slots_to_people(
+                component, slot_candidates, hinted_pairs
+            )
+        elif has_identical_candidates(component, slot_candidates) and all(
+            starts[slot] < ends[slot] for slot in component
+        ):
+            component_people = schedule_identical_people(
+                component, slot_candidates[component[0]], starts, ends, hinted_pairs
+            )
+        else:
+            remaining.update({slot: slot_candidates[slot] for slot in component})
+            continue
+
+        for slot, person in component_people.items():
+            loads[person] += ends[slot] - starts[slot]
+        slot_people.update(component_people)
+    return slot_people, remaining
@@ -0,0 +1,64 @@
+from collections import defaultdict
+from typing import Dict, Hashable, List, Sequence
+
+
+class _DisjointSet:
+    def __init__(self):
+        self._parents: Dict[Hashable, Hashable] = {}
+
+    def find(self, node: Hashable) -> Hashable:
+        parent = self._parents.setdefault(node, node)
+        while parent != node:
+            grandparent = self._parents[parent]
+            self._parents[node] = grandparent
+            node, parent = parent, grandparent
+        return node
+
+    def union(self, first: Hashable, second: Hashable) -> None:
+        first_root = self.find(first)
+        second_root = self.find(second)
+        if first_root != second_root:
+            self._parents[second_root] = first_root
+
+
+def find_independent_components(
+    slot_candidates: Dict[int, List[int]], starts: Sequence[int], ends: Sequence[int]
+) -> List[Dict[int, List[int]]]:
+    disjoint_set = _DisjointSet()
+    person_slots: Dict[int, List[int]] = defaultdict(list)
+    for slot, candidates in slot_candidates.items():
+        disjoint_set.find(slot)
+        for person in candidates:
+            person_slots[person].append(slot)
+
+    for slots in person_slots.values():
+        run_slot, run_end = None, None
+        for slot in sorted(slots, key=lambda slot: starts[slot]):
+            if run_slot is not None and starts[slot] < run_end:
+                disjoint_set.union(run_slot, slot)
+                run_end = max(run_end, ends[slot])
+            else:
+                run_slot, run_end = slot, ends[slot]
+
+    components: Dict[Hashable, Dict[int, List[int]]] = {}
+    for slot, candidates in slot_candidates.items():
+        components.setdefault(disjoint_set.find(slot), {})[slot] = candidates
+    return list(components.values())
+
+
+def partition_components(
+    components: List[Dict[int, List[int]]], num_parts: int
+) -> List[List[Dict[int, List[int]]]]:
+    parts: List[List[Dict[int, List[int]]]] = [
+        [] for _ in range(max(1, min(num_parts, len(components))))
+    ]
+    loads = [0] * len(parts)
+    for component in sorted(components, key=_component_size, reverse=True):
+        lightest = loads.index(min(loads))
+        parts[lightest].append(component)
+        loads[lightest] += _component_size(component)
+    return parts
+
+
+def _component_size(component: Dict[int, List[int]]) -> int:
+    return sum(len(candidates) for candidates in component.values())
@@ -0,0 +1,119 @@
+from dataclasses import dataclass
+from datetime import date, time, timedelta
+from functools import cached_property
+from typing import Dict, Iterable, List, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from modules.scheduler.overlap import MINUTES_PER_DAY, interval_minutes
+
+
+def minutes_to_time(minute: int) -> time:
+    minute %= MINUTES_PER_DAY
+    return time(minute // 60, minute % 60)
+
+
+@dataclass
+class EncodedProblem:
+    start_date: date
+    person_ids: List[UUID]
+    slot_days: np.ndarray
+    slot_starts: np.ndarray
+    slot_ends: np.ndarray
+    variable_names: bool = True
+
+    @classmethod
+    def from_slots(
+        cls, person_ids: Iterable[UUID], time_slots: List[Tuple[date, time, time]]
+    ) -> "EncodedProblem":
+        start_date = min(slot_date for slot_date, _, _ in time_slots)
+        days, starts, ends = [], [], []
+        for slot_date, slot_start, slot_end in time_slots:
+            start_minute, end_minute = interval_minutes(slot_start, slot_end)
+            days.append((slot_date - start_date).days)
+            starts.append(start_minute)
+            ends.append(end_minute)
+        return cls(
+            start_date=start_date,
+            person_ids=sorted(person_ids),
+            slot_days=np.array(days, dtype=np.int32),
+            slot_starts=np.array(starts, dtype=np.int32),
+            slot_ends=np.array(ends, dtype=np.int32),
+        )
+
+    @property
+    def num_people(self) -> int:
+        return len(self.person_ids)
+
+    @property
+    def num_slots(self) -> int:
+        return len(self.slot_days)
+
+    @cached_property
+    def slot_bounds(self) -> List[Tuple[int, int, int]]:
+        return list(
+            zip(
+                self.slot_days.tolist(),
+                self.slot_starts.tolist(),
+                self.slot_ends.tolist(),
+            )
+        )
+
+    @cached_property
+    def slot_hours(self) -> List[int]:
+        return ((self.slot_ends - self.slot_starts) // 60).tolist()
+
+    @cached_property
+    def absolute_starts(self) -> List[int]:
+        return (self.slot_days * MINUTES_PER_DAY + self.slot_starts).tolist()
+
+    @cached_property
+    def absolute_ends(self) -> List[int]:
+        return (self.slot_days * MINUTES_PER_DAY + self.slot_ends).tolist()
+
+    def person_index(self) -> Dict[UUID, int]:
+        return {person_id: index for index, person_id in enumerate(self.person_ids)}
+
+    def slot_index(self) -> Dict[Tuple[int, int, int], int]:
+        return {bounds: index for index, bounds in enumerate(self.slot_bounds)}
+
+    def encode_day(self, value: date) -> int:
+        return (value - self.start_date).days
+
+    def encode_slot(
+        self, slot_date: date, slot_start: time, slot_end: time
+    ) -> Tuple[int, int, int]:
+        return (self.encode_day(slot_date), *interval_minutes(slot_start, slot_end))
+
+    def decode_slot(self, slot: int) -> Tuple[date, time, time]:
+        day, start_minute, end_minute = self.slot_bounds[slot]
+        return (
+            self.start_date + timedelta(days=day),
+            minutes_to_time(start_minute),
+            minutes_to_time(end_minute),
+        )
+
+    @cached_property
+    def slot_labels(self) -> List[str]:
+        return [
+            "{}_{}_{}".format(*self.decode_slot(slot)) for slot in range(self.num_slots)
+        ]
+
+    def variable_name(
+        self,
+        prefix: str,
+        person: int | None = None,
+        slot: int | None = None,
+        suffix: object = None,
+    ) -> str:
+        if not self.variable_names:
+            return ""
+        parts = [prefix]
+        if person is not None:
+            parts.append(str(self.person_ids[person]))
+        if slot is not None:
+            parts.append(self.slot_labels[slot])
+        if suffix is not None:
+            parts.append(str(suffix))
+        return "_".join(parts)
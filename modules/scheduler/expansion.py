@@ -0,0 +1,107 @@
+from datetime import date
+from typing import List, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from modules.scheduler.models import AvailabilityHours, BusinessServiceHours
+from modules.scheduler.overlap import interval_minutes
+
+NO_DATE = -1
+NO_DAY_OF_WEEK = -1
+
+
+def expand_rules(
+    rules: Sequence[AvailabilityHours | BusinessServiceHours], date_range: List[date]
+) -> Tuple[np.ndarray, np.ndarray]:
+    ordinals = np.array([d.toordinal() for d in date_range], dtype=np.int64)
+    weekdays = np.array([d.weekday() for d in date_range], dtype=np.int64)
+
+    specific = _date_column([rule.specific_date for rule in rules])
+    starts = _date_column([rule.start_date for rule in rules])
+    ends = _date_column([rule.end_date for rule in rules])
+    days_of_week = np.array(
+        [
+            NO_DAY_OF_WEEK if rule.day_of_week is None else rule.day_of_week
+            for rule in rules
+        ],
+        dtype=np.int64,
+    )
+    recurring = np.array([bool(rule.is_recurring) for rule in rules], dtype=bool)
+    recurring &= days_of_week != NO_DAY_OF_WEEK
+
+    has_specific = specific != NO_DATE
+    has_start = starts != NO_DATE
+    has_end = ends != NO_DATE
+    within_range = (~has_start[:, None] | (ordinals >= starts[:, None])) & (
+        ~has_end[:, None] | (ordinals <= ends[:, None])
+    )
+
+    specific_mask = has_specific[:, None] & (ordinals == specific[:, None])
+    recurring_mask = (
+        (~has_specific & recurring)[:, None]
+        & (weekdays == days_of_week[:, None])
+        & within_range
+    )
+    ranged = ~has_specific & ~recurring & has_start & has_end
+    ranged_mask = ranged[:, None] & within_range
+
+    mask = specific_mask | recurring_mask | ranged_mask
+    rule_indices, date_indices = np.nonzero(mask)
+    return rule_indices, ordinals[date_indices] - ordinals.min()
+
+
+def expand_business_hours(
+    business_service_hours: Sequence[BusinessServiceHours], date_range: List[date]
+) -> np.ndarray:
+    if not business_service_hours or not date_range:
+        return np.empty((0, 3), dtype=np.int32)
+
+    rule_indices, days = expand_rules(business_service_hours, date_range)
+    rule_minutes = _minutes_columns(business_service_hours)
+    return _unique_rows(np.column_stack((days, rule_minutes[rule_indices])))
+
+
+def expand_availability_hours(
+    availability_hours: Sequence[AvailabilityHours],
+    person_ids: List[UUID],
+    date_range: List[date],
+) -> np.ndarray:
+    if not availability_hours or not date_range:
+        return np.empty((0, 4), dtype=np.int32)
+
+    person_index = {person_id: index for index, person_id in enumerate(person_ids)}
+    rule_people = np.array(
+        [person_index[ah.person_id] for ah in availability_hours], dtype=np.int64
+    )
+    rule_indices, days = expand_rules(availability_hours, date_range)
+    rule_minutes = _minutes_columns(availability_hours)
+    return _unique_rows(
+        np.column_stack((rule_people[rule_indices], days, rule_minutes[rule_indices]))
+    )
+
+
+def _date_column(values: List[date | None]) -> np.ndarray:
+    return np.array(
+        [NO_DATE if value is None else value.toordinal() for value in values],
+        dtype=np.int64,
+    )
+
+
+def _minutes_columns(
+    rules: Sequence[AvailabilityHours | BusinessServiceHours],
+) -> np.ndarray:
+    return np.array(
+        [interval_minutes(rule.start_time, rule.end_time) for rule in rules],
+        dtype=np.int64,
+    ).reshape(-1, 2)
+
+
+def _unique_rows(rows: np.ndarray) -> np.ndarray:
+    if len(rows) == 0:
+        return rows.astype(np.int32)
+    keys = np.zeros(len(rows), dtype=np.int64)
+    for column in rows.T:
+        keys = keys * (int(column.max()) + 1) + column
+    _, first_indices = np.unique(keys, return_index=True)
+    return rows[first_indices].astype(np.int32)
@@ -0,0 +1,131 @@
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+from modules.scheduler.encoding import EncodedProblem
+
+
+class GreedyAssigner:
+    def __init__(
+        self,
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
+        strategy: str,
+        accumulated_hours: Dict[int, int] | None = None,
+    ):
+        self.slot_candidates = slot_candidates
+        self.strategy = strategy
+        self.starts = problem.absolute_starts
+        self.ends = problem.absolute_ends
+        self.person_degrees = Counter(
+            person for candidates in slot_candidates.values() for person in candidates
+        )
+        self.loads: Dict[int, int] = defaultdict(int)
+        for person, hours in (accumulated_hours or {}).items():
+            self.loads[person] = hours * 60
+        self.schedules: Dict[int, List[Tuple[int, int, int]]] = defaultdict(list)
+        self.slot_people: Dict[int, int] = {}
+
+    def assign(self, hinted_pairs: Iterable[Tuple[int, int]] = ()) -> Dict[int, int]:
+        for person, slot in sorted(hinted_pairs):
+            if (
+                slot not in self.slot_people
+                and person in self.slot_candidates.get(slot, ())
+                and self._is_free(person, slot)
+            ):
+                self._place(person, slot)
+
+        unassigned = []
+        for slot in self._order_slots():
+            if slot in self.slot_people:
+                continue
+            person = self._choose_person(slot)
+            if person is None:
+                unassigned.append(slot)
+            else:
+                self._place(person, slot)
+
+        for slot in unassigned:
+            self._repair(slot)
+        return self.slot_people
+
+    def _order_slots(self) -> List[int]:
+        return sorted(
+            self.slot_candidates,
+            key=lambda slot: (
+                len(self.slot_candidates[slot]),
+                self.starts[slot],
+                slot,
+            ),
+        )
+
+    def _choose_person(self, slot: int) -> int | None:
+        free_people = [
+            person
+            for person in self.slot_candidates[slot]
+            if self._is_free(person, slot)
+        ]
+        if not free_people:
+            return None
+        return min(free_people, key=lambda person: self._score(person, slot))
+
+    def _score(self, person: int, slot: int) -> Tuple[int, ...]:
+        if self.strategy == "balance_workload":
+            return (self.loads[person], person)
+        if self.strategy in ("minimize_gaps", "lexicographic"):
+            return (self._gap(person, slot), self.loads[person], person)
+        return (self.person_degrees[person], self.loads[person], person)
+
+    def _gap(self, person: int, slot: int) -> int:
+        schedule = self.schedules[person]
+        if not schedule:
+            return 0
+        position = bisect_left(schedule, (self.starts[slot],))
+        gaps = []
+        if position > 0:
+            gaps.append(self.starts[slot] - schedule[position - 1][1])
+        if position < len(schedule):
+            gaps.append(schedule[position][0] - self.ends[slot])
+        return min(gaps)
+
+    def _is_free(self, person: int, slot: int) -> bool:
+        return not self._conflicts(person, slot)
+
+    def _conflicts(self, person: int, slot: int) -> List[int]:
+        schedule = self.schedules[person]
+        start, end = self.starts[slot], self.ends[slot]
+        position = bisect_left(schedule, (start,))
+        if position > 0 and schedule[position - 1][1] > start:
+            position -= 1
+
+        conflicts = []
+        while position < len(schedule) and schedule[position][0] < end:
+            conflicts.append(schedule[position][2])
+            position += 1
+        return conflicts
+
+    def _repair(self, slot: int) -> None:
+        for person in sorted(
+            self.slot_candidates[slot], key=lambda person: self._score(person, slot)
+        ):
+            conflicts = self._conflicts(person, slot)
+            if len(conflicts) != 1:
+                continue
+
+            blocked_slot = conflicts[0]
+            for other in self.slot_candidates[blocked_slot]:
+                if other != person and self._is_free(other, blocked_slot):
+                    self._remove(person, blocked_slot)
+                    self._place(other, blocked_slot)
+                    self._place(person, slot)
+                    return
+
+    def _place(self, person: int, slot: int) -> None:
+        insort(self.schedules[person], (self.starts[slot], self.ends[slot], slot))
+        self.loads[person] += self.ends[slot] - self.starts[slot]
+        self.slot_people[slot] = person
+
+    def _remove(self, person: int, slot: int) -> None:
+        self.schedules[person].remove((self.starts[slot], self.ends[slot], slot))
+        self.loads[person] -= self.ends[slot] - self.starts[slot]
+        del self.slot_people[slot]
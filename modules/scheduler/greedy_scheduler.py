@@ -0,0 +1,35 @@
+from typing import Callable, Dict, List, Set, Tuple
+
+from modules.scheduler.base_scheduler import BaseScheduler
+from modules.scheduler.encoding import EncodedProblem
+from modules.scheduler.interfaces import Assignment, IntermediateSolution
+from modules.scheduler.models import BusinessServiceHours, SolverParameters
+from modules.scheduler.rolling_horizon import HorizonContext
+from modules.scheduler.stats import SolveStats
+
+
+class GreedyScheduler(BaseScheduler):
+    def _solve_coverable_slots(
+        self,
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
+        strategy: str,
+        business_service_hours: list[BusinessServiceHours],
+        solver_parameters: SolverParameters,
+        hinted_pairs: Set[Tuple[int, int]],
+        context: HorizonContext | None,
+        on_solution: Callable[[IntermediateSolution], None] | None,
+        should_stop: Callable[[], bool] | None,
+        stats: SolveStats,
+    ) -> list[Assignment]:
+        if not slot_candidates:
+            return []
+
+        with stats.measure("greedy"):
+            slot_people = self._assign_greedily(
+                problem, slot_candidates, strategy, hinted_pairs, context
+            )
+        with stats.measure("extraction"):
+            return self._decode_slot_people(
+                problem, slot_people, business_service_hours
+            )
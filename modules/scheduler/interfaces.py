@@ -1,9 +1,16 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, time
+from typing import Callable
 from uuid import UUID
 
-from modules.scheduler.models import AvailabilityHours, BusinessServiceHours
+from modules.scheduler.models import (
+    AvailabilityHours,
+    BusinessServiceHours,
+    SolverParameters,
+)
+from modules.scheduler.neighborhood import ChangeSet
+from modules.scheduler.stats import SolveStats
 
 
 @dataclass
@@ -15,6 +22,36 @@ class Assignment:
     role_id: UUID
 
 
+@dataclass
+class UncoverableSlot:
+    date: date
+    start_time: time
+    end_time: time
+    role_id: UUID
+
+
+@dataclass
+class ScheduleResult:
+    assignments: list[Assignment]
+    uncoverable_slots: list[UncoverableSlot] = field(default_factory=list)
+    stats: SolveStats = field(default_factory=SolveStats)
+    objective_value: float | None = None
+
+
+@dataclass
+class IntermediateSolution:
+    objective_value: float
+    best_objective_bound: float
+    wall_time: float
+    assignments: list[Assignment]
+    objective: str | None = None
+    stage: int = 0
+
+
+class SolveCancelled(Exception):
+    pass
+
+
 class Scheduler(ABC):
     @abstractmethod
     def optimize(
@@ -24,6 +61,77 @@ class Scheduler(ABC):
         weeks: list[int],
         year: int,
         strategy: str,
+        solver_parameters: SolverParameters | None = None,
+        hints: list[Assignment] | None = None,
     ) -> list[Assignment]:
         pass
 
+    def solve(
+        self,
+        availability_hours: list[AvailabilityHours],
+        business_service_hours: list[BusinessServiceHours],
+        weeks: list[int],
+        year: int,
+        strategy: str,
+        solver_parameters: SolverParameters | None = None,
+        hints: list[Assignment] | None = None,
+        on_solution: Callable[[IntermediateSolution], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> ScheduleResult:
+        return ScheduleResult(
+            assignments=self.optimize(
+                availability_hours,
+                business_service_hours,
+                weeks,
+                year,
+                strategy,
+                solver_parameters,
+                hints,
+            )
+        )
+
+    def reoptimize(
+        self,
+        availability_hours: list[AvailabilityHours],
+        business_service_hours: list[BusinessServiceHours],
+        weeks: list[int],
+        year: int,
+        strategy: str,
+        current_assignments: list[Assignment],
+        change_set: ChangeSet,
+        solver_parameters: SolverParameters | None = None,
+        on_solution: Callable[[IntermediateSolution], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> ScheduleResult:
+        return self.solve(
+            availability_hours,
+            business_service_hours,
+            weeks,
+            year,
+            strategy,
+            solver_parameters,
+            current_assignments,
+            on_solution,
+            should_stop,
+        )
+
+    def compare(
+        self,
+        availability_hours: list[AvailabilityHours],
+        business_service_hours: list[BusinessServiceHours],
+        weeks: list[int],
+        year: int,
+        strategies: list[str],
+        solver_parameters: SolverParameters | None = None,
+    ) -> dict[str, ScheduleResult]:
+        return {
+            strategy: self.solve(
+                availability_hours,
+                business_service_hours,
+                weeks,
+                year,
+                strategy,
+                solver_parameters,
+            )
+            for strategy in strategies
+        }
@@ -29,3 +29,11 @@ class BusinessServiceHours:
     is_recurring: bool = True
     specific_date: date | None = None
 
+
+@dataclass
+class SolverParameters:
+    max_time_in_seconds: float | None = None
+    num_search_workers: int | None = None
+    relative_gap_limit: float | None = None
+    random_seed: int | None = None
+    log_search_progress: bool = False
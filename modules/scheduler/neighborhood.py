@@ -0,0 +1,90 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, List, Set, Tuple
+from uuid import UUID
+
+from modules.scheduler.overlap import MINUTES_PER_DAY
+
+
+@dataclass
+class ChangeSet:
+    person_ids: Set[UUID] = field(default_factory=set)
+    dates: Set[date] = field(default_factory=set)
+
+
+def find_changed_slots(
+    starts: List[int], ends: List[int], changed_days: Set[int]
+) -> Set[int]:
+    day_bounds = [
+        (day * MINUTES_PER_DAY, (day + 1) * MINUTES_PER_DAY) for day in changed_days
+    ]
+    return {
+        slot
+        for slot, (start, end) in enumerate(zip(starts, ends))
+        if any(start < day_end and day_start < end for day_start, day_end in day_bounds)
+    }
+
+
+def _is_released(
+    person: int,
+    slot: int,
+    changed_people: Set[int],
+    changed_slots: Set[int] | None,
+) -> bool:
+    if changed_slots is None:
+        return person in changed_people
+    if not changed_people:
+        return slot in changed_slots
+    return person in changed_people and slot in changed_slots
+
+
+def freeze_assignments(
+    current_pairs: Set[Tuple[int, int]],
+    slot_candidates: Dict[int, List[int]],
+    changed_people: Set[int],
+    changed_slots: Set[int] | None,
+) -> Dict[int, int]:
+    frozen = {}
+    for person, slot in sorted(current_pairs):
+        if _is_released(person, slot, changed_people, changed_slots):
+            continue
+        if slot in frozen or person not in slot_candidates.get(slot, []):
+            continue
+        frozen[slot] = person
+    return frozen
+
+
+def build_neighborhood(
+    slot_candidates: Dict[int, List[int]],
+    frozen: Dict[int, int],
+    released_slots: Set[int],
+    starts: List[int],
+    ends: List[int],
+    changed_people: Set[int],
+    changed_slots: Set[int] | None,
+) -> Dict[int, List[int]]:
+    frozen_intervals: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+    for slot, person in frozen.items():
+        frozen_intervals[person].append((starts[slot], ends[slot]))
+
+    neighborhood = {}
+    for slot, candidates in slot_candidates.items():
+        if slot in frozen:
+            continue
+        if slot not in released_slots and not any(
+            _is_released(person, slot, changed_people, changed_slots)
+            for person in candidates
+        ):
+            continue
+        free_candidates = [
+            person
+            for person in candidates
+            if not any(
+                start < ends[slot] and starts[slot] < end
+                for start, end in frozen_intervals[person]
+            )
+        ]
+        if free_candidates:
+            neighborhood[slot] = free_candidates
+    return neighborhood
@@ -0,0 +1,75 @@
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
+
+from modules.scheduler.encoding import EncodedProblem
+
+LEXICOGRAPHIC_PRIMARY_OBJECTIVE = "maximize_coverage"
+
+
+def evaluate_objective(
+    problem: EncodedProblem,
+    person_slots: Dict[int, List[int]],
+    assigned: Set[Tuple[int, int]],
+    strategy: str,
+    gap_formulation: str,
+) -> float | None:
+    if strategy == "lexicographic":
+        strategy = LEXICOGRAPHIC_PRIMARY_OBJECTIVE
+    if strategy == "maximize_coverage":
+        return float(len({slot for _, slot in assigned}))
+    if strategy == "minimize_gaps":
+        if gap_formulation == "span":
+            return -float(_span_gap_penalty(problem, assigned))
+        return -float(_consecutive_gap_penalty(problem, person_slots, assigned))
+    if strategy == "balance_workload":
+        return -float(_variance_penalty(problem, person_slots, assigned))
+    return None
+
+
+def _consecutive_gap_penalty(
+    problem: EncodedProblem,
+    person_slots: Dict[int, List[int]],
+    assigned: Set[Tuple[int, int]],
+) -> int:
+    absolute_starts = problem.absolute_starts
+    absolute_ends = problem.absolute_ends
+    penalty = 0
+    for person, slots in person_slots.items():
+        for slot1, slot2 in zip(slots, slots[1:]):
+            if (person, slot1) in assigned and (person, slot2) in assigned:
+                penalty += int((absolute_starts[slot2] - absolute_ends[slot1]) / 60)
+    return penalty
+
+
+def _span_gap_penalty(problem: EncodedProblem, assigned: Set[Tuple[int, int]]) -> int:
+    day_slots: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+    for person, slot in assigned:
+        day_slots[(person, int(problem.slot_days[slot]))].append(slot)
+
+    absolute_starts = problem.absolute_starts
+    absolute_ends = problem.absolute_ends
+    penalty = 0
+    for slots in day_slots.values():
+        worked = sum(absolute_ends[slot] - absolute_starts[slot] for slot in slots)
+        penalty += (
+            max(absolute_ends[slot] for slot in slots)
+            - min(absolute_starts[slot] for slot in slots)
+            - worked
+        )
+    return penalty
+
+
+def _variance_penalty(
+    problem: EncodedProblem,
+    person_slots: Dict[int, List[int]],
+    assigned: Set[Tuple[int, int]],
+) -> int:
+    if len(person_slots) <= 1:
+        return 0
+    slot_hours = problem.slot_hours
+    totals = [
+        sum(slot_hours[slot] for slot in slots if (person, slot) in assigned)
+        for person, slots in person_slots.items()
+    ]
+    mean = sum(totals) // len(totals)
+    return sum(abs(total - mean) for total in totals)
@@ -1,197 +1,1038 @@
+import multiprocessing
+import os
+import time as timer
 from collections import defaultdict
-from datetime import date, datetime, timedelta, time
-from typing import Dict, List, Set, Tuple
-from uuid import UUID
-
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import nullcontext
+from dataclasses import replace
+from multiprocessing.synchronize import Event
+from typing import Callable, Dict, Iterable, List, Set, Tuple
 from ortools.sat.python import cp_model
 
-from modules.scheduler.models import AvailabilityHours, BusinessServiceHours
-from modules.scheduler.interfaces import Assignment, Scheduler
+from modules.scheduler.assignment_index import AssignmentIndex
+from modules.scheduler.base_scheduler import BaseScheduler
+from modules.scheduler.case_export import export_model
+from modules.scheduler.comparison import SharedModel, clone_shared_model
+from modules.scheduler.coverage_flow import solve_coverage_flows
+from modules.scheduler.decomposition import (
+    find_independent_components,
+    partition_components,
+)
+from modules.scheduler.encoding import EncodedProblem
+from modules.scheduler.models import BusinessServiceHours, SolverParameters
+from modules.scheduler.overlap import MINUTES_PER_DAY, maximal_overlap_cliques
+from modules.scheduler.reduction import propagate_forced_assignments
+from modules.scheduler.rolling_horizon import HorizonContext
+from modules.scheduler.solution_callback import (
+    STOP_POLL_SECONDS,
+    SolutionPublisher,
+    StopPoller,
+)
+from modules.scheduler.stats import SolveStats, SolverRun
+from modules.scheduler.symmetry import find_interchangeable_people
+from modules.scheduler.interfaces import (
+    Assignment,
+    IntermediateSolution,
+    ScheduleResult,
+    SolveCancelled,
+)
+
+_component_stop_event: Event | None = None
+
+
+def _set_component_stop_event(stop_event: Event) -> None:
+    global _component_stop_event
+    _component_stop_event = stop_event
+
+
+class ORToolsScheduler(BaseScheduler):
+    OVERLAP_FORMULATIONS = ("cliques", "intervals")
+    GAP_FORMULATIONS = ("consecutive", "span")
+    COUPLED_STRATEGIES = ("minimize_gaps", "balance_workload", "lexicographic")
+    LEXICOGRAPHIC_STAGES = ("maximize_coverage", "minimize_gaps", "balance_workload")
+    FALLBACK_TIME_SHARE = 0.1
+
+    def __init__(
+        self,
+        overlap_formulation: str = "cliques",
+        gap_formulation: str = "consecutive",
+        decompose: bool = True,
+        max_workers: int | None = None,
+        parallel_min_variables: int = 2000,
+        solver_parameters: SolverParameters | None = None,
+        rolling_horizon_weeks: int | None = None,
+        greedy_hints: bool = False,
+        coverage_flows: bool = True,
+        propagate_forced: bool = True,
+        symmetry_breaking: bool = False,
+        export_dir: str | None = None,
+        variable_names: bool | None = None,
+    ):
+        if overlap_formulation not in self.OVERLAP_FORMULATIONS:
+            raise ValueError(
+                f"Invalid overlap formulation: {overlap_formulation}. "
+                f"Must be one of: {', '.join(self.OVERLAP_FORMULATIONS)}"
+            )
+        if gap_formulation not in self.GAP_FORMULATIONS:
+            raise ValueError(
+                f"Invalid gap formulation: {gap_formulation}. "
+                f"Must be one of: {', '.join(self.GAP_FORMULATIONS)}"
+            )
+        super().__init__(rolling_horizon_weeks, export_dir)
+        self.overlap_formulation = overlap_formulation
+        self.gap_formulation = gap_formulation
+        self.decompose = decompose
+        self.max_workers = max_workers
+        self.parallel_min_variables = parallel_min_variables
+        self.solver_parameters = solver_parameters or SolverParameters()
+        self.greedy_hints = greedy_hints
+        self.coverage_flows = coverage_flows
+        self.propagate_forced = propagate_forced
+        self.symmetry_breaking = symmetry_breaking
+        self.variable_names = (
+            export_dir is not None if variable_names is None else variable_names
+        )
 
+    def _export_options(self) -> Dict[str, object]:
+        return {
+            "overlap_formulation": self.overlap_formulation,
+            "gap_formulation": self.gap_formulation,
+            "decompose": self.decompose,
+            "max_workers": self.max_workers,
+            "parallel_min_variables": self.parallel_min_variables,
+            "rolling_horizon_weeks": self.rolling_horizon_weeks,
+            "greedy_hints": self.greedy_hints,
+            "coverage_flows": self.coverage_flows,
+            "propagate_forced": self.propagate_forced,
+            "symmetry_breaking": self.symmetry_breaking,
+            "variable_names": self.variable_names,
+        }
 
-class ORToolsScheduler(Scheduler):
-    def optimize(
+    def _compare_strategies(
         self,
-        availability_hours: list[AvailabilityHours],
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
+        strategies: list[str],
         business_service_hours: list[BusinessServiceHours],
-        weeks: list[int],
-        year: int,
+        solver_parameters: SolverParameters,
+        export_dirs: Dict[str, str | None],
+        shared_stats: SolveStats,
+        encoding_time: float,
+    ) -> Dict[str, ScheduleResult]:
+        shared_strategies = {
+            strategy
+            for strategy in strategies
+            if self._can_share_model(strategy, slot_candidates)
+        }
+        started = timer.perf_counter()
+        model_stats = SolveStats()
+        shared = (
+            self._build_shared_model(
+                problem, slot_candidates, shared_strategies, model_stats
+            )
+            if shared_strategies
+            else None
+        )
+        model_stats.wall_time = timer.perf_counter() - started
+
+        max_workers = min(len(strategies), self._get_max_workers())
+        if solver_parameters.num_search_workers is None:
+            solver_parameters = replace(
+                solver_parameters,
+                num_search_workers=max(1, self._get_max_workers() // len(strategies)),
+            )
+        deadline = self._get_deadline(solver_parameters)
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="strategy"
+        ) as executor:
+            futures = {
+                strategy: executor.submit(
+                    self._solve_shared_strategy,
+                    problem,
+                    shared,
+                    strategy,
+                    business_service_hours,
+                    self._get_hard_parameters(solver_parameters),
+                    export_dirs[strategy],
+                )
+                if strategy in shared_strategies
+                else executor.submit(
+                    self._solve_dedicated_strategy,
+                    problem,
+                    slot_candidates,
+                    strategy,
+                    business_service_hours,
+                    solver_parameters,
+                    export_dirs[strategy],
+                )
+                for strategy in strategies
+            }
+            outcomes = {
+                strategy: future.result() for strategy, future in futures.items()
+            }
+
+        results = {}
+        for strategy, (assignments, stats) in outcomes.items():
+            stats.merge(shared_stats)
+            stats.wall_time += encoding_time
+            if strategy in shared_strategies:
+                stats.merge(model_stats)
+                stats.wall_time += model_stats.wall_time
+            if assignments is None or (
+                strategy in shared_strategies
+                and not self._found_solution(stats.solver_runs)
+            ):
+                assignments, fallback_stats = self._solve_uncoverable_fallback(
+                    problem,
+                    slot_candidates,
+                    strategy,
+                    business_service_hours,
+                    self._get_remaining_parameters(solver_parameters, deadline, 1),
+                    export_dirs[strategy],
+                )
+                stats.merge(fallback_stats)
+                stats.wall_time += fallback_stats.wall_time
+            results[strategy] = ScheduleResult(
+                assignments=assignments,
+                uncoverable_slots=self._find_uncovered_slots(
+                    problem, assignments, business_service_hours
+                ),
+                stats=stats,
+            )
+        return results
+
+    def _can_share_model(
+        self, strategy: str, slot_candidates: Dict[int, List[int]]
+    ) -> bool:
+        if strategy == "lexicographic":
+            return False
+        if self.coverage_flows and strategy == "maximize_coverage":
+            return False
+        return not self._can_decompose(strategy, slot_candidates)
+
+    def _build_shared_model(
+        self,
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
+        strategies: Iterable[str],
+        stats: SolveStats,
+    ) -> SharedModel | None:
+        reduction = self._reduce_problem(problem, slot_candidates, strategies, stats)
+        if reduction is None:
+            return None
+        residual_candidates, forced = reduction
+        model, assignments, person_slots = self._build_constrained_model(
+            problem, residual_candidates, None, False, stats, forced
+        )
+        return SharedModel(model, assignments, residual_candidates, person_slots)
+
+    def _solve_shared_strategy(
+        self,
+        problem: EncodedProblem,
+        shared: SharedModel | None,
+        strategy: str,
+        business_service_hours: list[BusinessServiceHours],
+        solver_parameters: SolverParameters,
+        export_dir: str | None,
+    ) -> Tuple[list[Assignment] | None, SolveStats]:
+        stats = SolveStats(export_dir=export_dir)
+        if shared is None:
+            return None, stats
+
+        started = timer.perf_counter()
+        with stats.measure("variables"):
+            model, assignments = clone_shared_model(shared)
+        with stats.measure("objective"):
+            self._set_objective(
+                model,
+                problem,
+                strategy,
+                shared.slot_candidates,
+                shared.person_slots,
+                assignments,
+                None,
+            )
+        result = self._solve_and_extract_assignments(
+            model,
+            problem,
+            assignments,
+            business_service_hours,
+            solver_parameters,
+            None,
+            None,
+            stats,
+            strategy,
+        )
+        stats.wall_time = timer.perf_counter() - started
+        return result, stats
+
+    def _solve_uncoverable_fallback(
+        self,
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
+        strategy: str,
+        business_service_hours: list[BusinessServiceHours],
+        solver_parameters: SolverParameters,
+        export_dir: str | None,
+    ) -> Tuple[list[Assignment], SolveStats]:
+        stats = SolveStats(export_dir=export_dir)
+        started = timer.perf_counter()
+        assignments = self._solve_model(
+            problem,
+            slot_candidates,
+            strategy,
+            business_service_hours,
+            solver_parameters,
+            set(),
+            None,
+            soft_coverage=True,
+            stats=stats,
+        )
+        stats.wall_time = timer.perf_counter() - started
+        return assignments or [], stats
+
+    def _extend_hints(
+        self,
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
         strategy: str,
+        hinted_pairs: Set[Tuple[int, int]],
+        context: HorizonContext | None,
+        stats: SolveStats,
+    ) -> Set[Tuple[int, int]]:
+        if not (self.greedy_hints and slot_candidates):
+            return hinted_pairs
+        with stats.measure("greedy"):
+            return {
+                (person, slot)
+                for slot, person in self._assign_greedily(
+                    problem, slot_candidates, strategy, hinted_pairs, context
+                ).items()
+            }
+
+    def _solve_coverable_slots(
+        self,
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
+        strategy: str,
+        business_service_hours: list[BusinessServiceHours],
+        solver_parameters: SolverParameters,
+        hinted_pairs: Set[Tuple[int, int]],
+        context: HorizonContext | None,
+        on_solution: Callable[[IntermediateSolution], None] | None,
+        should_stop: Callable[[], bool] | None,
+        stats: SolveStats,
     ) -> list[Assignment]:
-        if not self._has_valid_inputs(availability_hours, business_service_hours):
+        if not slot_candidates:
             return []
 
-        date_range = self._get_date_range_for_weeks(weeks, year)
-        time_slots = self._create_time_slots(business_service_hours, date_range)
-        availability_slots = self._create_availability_slots(
-            availability_hours, date_range
+        if not (self.coverage_flows and strategy == "maximize_coverage"):
+            return self._solve_with_cp_sat(
+                problem,
+                slot_candidates,
+                strategy,
+                business_service_hours,
+                solver_parameters,
+                hinted_pairs,
+                context,
+                on_solution,
+                should_stop,
+                stats,
+            )
+
+        with stats.measure("flows"):
+            slot_people, remaining_candidates = solve_coverage_flows(
+                slot_candidates,
+                problem.absolute_starts,
+                problem.absolute_ends,
+                hinted_pairs,
+            )
+        with stats.measure("extraction"):
+            flow_assignments = self._decode_slot_people(
+                problem, slot_people, business_service_hours
+            )
+        if not remaining_candidates:
+            if on_solution:
+                on_solution(
+                    IntermediateSolution(
+                        objective_value=len(flow_assignments),
+                        best_objective_bound=len(flow_assignments),
+                        wall_time=0.0,
+                        assignments=flow_assignments,
+                        objective=strategy,
+                    )
+                )
+            return flow_assignments
+
+        return self._merge_component_assignments(
+            [
+                flow_assignments,
+                self._solve_with_cp_sat(
+                    problem,
+                    remaining_candidates,
+                    strategy,
+                    business_service_hours,
+                    solver_parameters,
+                    hinted_pairs,
+                    context,
+                    self._prepend_committed_assignments(on_solution, flow_assignments),
+                    should_stop,
+                    stats,
+                ),
+            ]
         )
 
-        if not self._has_valid_slots(time_slots, availability_slots):
-            return []
+    def _solve_with_cp_sat(
+        self,
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
+        strategy: str,
+        business_service_hours: list[BusinessServiceHours],
+        solver_parameters: SolverParameters,
+        hinted_pairs: Set[Tuple[int, int]],
+        context: HorizonContext | None,
+        on_solution: Callable[[IntermediateSolution], None] | None,
+        should_stop: Callable[[], bool] | None,
+        stats: SolveStats,
+    ) -> list[Assignment]:
+        if self._can_decompose(strategy, slot_candidates):
+            components = find_independent_components(
+                slot_candidates, problem.absolute_starts, problem.absolute_ends
+            )
+            if len(components) > 1:
+                return self._solve_components_concurrently(
+                    problem,
+                    components,
+                    strategy,
+                    business_service_hours,
+                    solver_parameters,
+                    hinted_pairs,
+                    on_solution,
+                    should_stop,
+                    stats,
+                )
+
+        return self._solve_component(
+            problem,
+            slot_candidates,
+            strategy,
+            business_service_hours,
+            solver_parameters,
+            hinted_pairs,
+            context,
+            on_solution,
+            should_stop,
+            stats,
+        )
 
-        model = cp_model.CpModel()
-        person_ids = self._extract_person_ids(availability_hours)
-        assignments = self._create_decision_variables(model, person_ids, time_slots)
+    def _can_decompose(
+        self, strategy: str, slot_candidates: Dict[int, List[int]]
+    ) -> bool:
+        if not self.decompose or strategy in self.COUPLED_STRATEGIES:
+            return False
+        if self._get_max_workers() <= 1:
+            return False
+        total_variables = sum(len(candidates) for candidates in slot_candidates.values())
+        return total_variables >= self.parallel_min_variables
 
-        self._add_coverage_constraints(model, time_slots, person_ids, assignments)
-        self._add_availability_constraints(
-            model, person_ids, time_slots, assignments, availability_slots
+    def _get_max_workers(self) -> int:
+        return self.max_workers or os.cpu_count() or 1
+
+    def _solve_components_concurrently(
+        self,
+        problem: EncodedProblem,
+        components: List[Dict[int, List[int]]],
+        strategy: str,
+        business_service_hours: list[BusinessServiceHours],
+        solver_parameters: SolverParameters,
+        hinted_pairs: Set[Tuple[int, int]],
+        on_solution: Callable[[IntermediateSolution], None] | None,
+        should_stop: Callable[[], bool] | None,
+        stats: SolveStats,
+    ) -> list[Assignment]:
+        started = timer.perf_counter()
+        deadline = self._get_deadline(solver_parameters)
+        max_workers = self._get_max_workers()
+        parts = partition_components(components, max_workers)
+        if solver_parameters.num_search_workers is None:
+            solver_parameters = replace(
+                solver_parameters,
+                num_search_workers=max(1, max_workers // len(parts)),
+            )
+        mp_context = multiprocessing.get_context("spawn")
+        stop_event = mp_context.Event()
+        with ProcessPoolExecutor(
+            max_workers=len(parts),
+            mp_context=mp_context,
+            initializer=_set_component_stop_event,
+            initargs=(stop_event,),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._solve_components,
+                    problem,
+                    part,
+                    strategy,
+                    business_service_hours,
+                    solver_parameters,
+                    hinted_pairs,
+                    deadline,
+                    stats.export_dir,
+                )
+                for part in parts
+            ]
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, STOP_POLL_SECONDS)
+                if should_stop and should_stop():
+                    stop_event.set()
+                if on_solution and done:
+                    self._publish_finished_parts(
+                        futures, parts, pending, on_solution, started
+                    )
+            part_assignments = []
+            for future in futures:
+                assignments, part_stats = future.result()
+                part_assignments.append(assignments)
+                stats.merge(part_stats)
+            return self._merge_component_assignments(part_assignments)
+
+    def _publish_finished_parts(
+        self,
+        futures: List[Future],
+        parts: List[List[Dict[int, List[int]]]],
+        pending: Set[Future],
+        on_solution: Callable[[IntermediateSolution], None],
+        started: float,
+    ) -> None:
+        assignments = self._merge_component_assignments(
+            [future.result()[0] for future in futures if future not in pending]
+        )
+        covered = len({(a.date, a.start_time, a.end_time) for a in assignments})
+        remaining = sum(
+            len(component)
+            for future, part in zip(futures, parts)
+            if future in pending
+            for component in part
         )
-        self._add_no_overlap_constraints(
-            model, person_ids, time_slots, assignments
+        on_solution(
+            IntermediateSolution(
+                objective_value=float(covered),
+                best_objective_bound=float(covered + remaining),
+                wall_time=timer.perf_counter() - started,
+                assignments=assignments,
+                objective="maximize_coverage",
+            )
         )
 
-        self._set_objective(model, strategy, time_slots, person_ids, assignments)
+    def _solve_components(
+        self,
+        problem: EncodedProblem,
+        components: List[Dict[int, List[int]]],
+        strategy: str,
+        business_service_hours: list[BusinessServiceHours],
+        solver_parameters: SolverParameters,
+        hinted_pairs: Set[Tuple[int, int]],
+        deadline: float | None = None,
+        export_dir: str | None = None,
+    ) -> Tuple[list[Assignment], SolveStats]:
+        stats = SolveStats(export_dir=export_dir)
+        should_stop = _component_stop_event.is_set if _component_stop_event else None
+        results = []
+        for index, component in enumerate(components):
+            results.append(
+                self._solve_component(
+                    problem,
+                    component,
+                    strategy,
+                    business_service_hours,
+                    self._get_remaining_parameters(
+                        solver_parameters, deadline, len(components) - index
+                    ),
+                    hinted_pairs,
+                    None,
+                    None,
+                    should_stop,
+                    stats,
+                )
+            )
+        return self._merge_component_assignments(results), stats
+
+    def _solve_component(
+        self,
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
+        strategy: str,
+        business_service_hours: list[BusinessServiceHours],
+        solver_parameters: SolverParameters,
+        hinted_pairs: Set[Tuple[int, int]],
+        context: HorizonContext | None,
+        on_solution: Callable[[IntermediateSolution], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+        stats: SolveStats | None = None,
+    ) -> list[Assignment]:
+        stats = stats or SolveStats()
+        deadline = self._get_deadline(solver_parameters)
+        first_run = len(stats.solver_runs)
+        reduction = self._reduce_problem(problem, slot_candidates, [strategy], stats)
+        assignments = None
+        if reduction is not None:
+            residual_candidates, forced = reduction
+            assignments = self._solve_model(
+                problem,
+                residual_candidates,
+                strategy,
+                business_service_hours,
+                self._get_hard_parameters(solver_parameters),
+                hinted_pairs,
+                context,
+                soft_coverage=False,
+                on_solution=on_solution,
+                should_stop=should_stop,
+                stats=stats,
+                forced=forced,
+            )
+        if assignments is None or not self._found_solution(
+            stats.solver_runs[first_run:]
+        ):
+            assignments = self._solve_model(
+                problem,
+                slot_candidates,
+                strategy,
+                business_service_hours,
+                self._get_remaining_parameters(solver_parameters, deadline, 1),
+                hinted_pairs,
+                context,
+                soft_coverage=True,
+                on_solution=on_solution,
+                should_stop=should_stop,
+                stats=stats,
+            )
+        return assignments or []
+
+    def _get_hard_parameters(
+        self, solver_parameters: SolverParameters
+    ) -> SolverParameters:
+        if solver_parameters.max_time_in_seconds is None:
+            return solver_parameters
+        return replace(
+            solver_parameters,
+            max_time_in_seconds=solver_parameters.max_time_in_seconds
+            * (1 - self.FALLBACK_TIME_SHARE),
+        )
+
+    def _found_solution(self, runs: List[SolverRun]) -> bool:
+        return any(run.status in ("OPTIMAL", "FEASIBLE") for run in runs)
+
+    def _reduce_problem(
+        self,
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
+        strategies: Iterable[str],
+        stats: SolveStats,
+    ) -> Tuple[Dict[int, List[int]], Dict[int, int]] | None:
+        if not self.propagate_forced:
+            return slot_candidates, {}
+        with stats.measure("reduction"):
+            reduction = propagate_forced_assignments(
+                slot_candidates, problem.absolute_starts, problem.absolute_ends
+            )
+        if reduction is not None and any(
+            self._gaps_follow_candidates(strategy) for strategy in strategies
+        ):
+            return slot_candidates, {}
+        return reduction
+
+    def _gaps_follow_candidates(self, strategy: str) -> bool:
+        return self.gap_formulation == "consecutive" and strategy in (
+            "minimize_gaps",
+            "lexicographic",
+        )
+
+    def _solve_model(
+        self,
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
+        strategy: str,
+        business_service_hours: list[BusinessServiceHours],
+        solver_parameters: SolverParameters,
+        hinted_pairs: Set[Tuple[int, int]],
+        context: HorizonContext | None,
+        soft_coverage: bool,
+        on_solution: Callable[[IntermediateSolution], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+        stats: SolveStats | None = None,
+        forced: Dict[int, int] | None = None,
+    ) -> list[Assignment] | None:
+        stages = self._get_stages(strategy, soft_coverage)
+        if len(stages) > 1:
+            return self._solve_lexicographic(
+                problem,
+                slot_candidates,
+                stages,
+                business_service_hours,
+                solver_parameters,
+                hinted_pairs,
+                context,
+                soft_coverage,
+                on_solution,
+                should_stop,
+                stats or SolveStats(),
+                forced,
+            )
+        model, assignments = self._build_model(
+            problem, slot_candidates, strategy, context, soft_coverage, stats, forced
+        )
+        if hinted_pairs:
+            self._add_solution_hints(model, assignments, hinted_pairs, forced)
 
         return self._solve_and_extract_assignments(
-            model, assignments, business_service_hours
+            model,
+            problem,
+            assignments,
+            business_service_hours,
+            solver_parameters,
+            on_solution,
+            should_stop,
+            stats,
+            strategy,
         )
 
-    def _has_valid_inputs(
+    def _get_stages(self, strategy: str, soft_coverage: bool) -> Tuple[str, ...]:
+        if strategy == "lexicographic":
+            return self.LEXICOGRAPHIC_STAGES[0 if soft_coverage else 1 :]
+        if soft_coverage and strategy != "maximize_coverage":
+            return ("maximize_coverage", strategy)
+        return (strategy,)
+
+    def _solve_lexicographic(
         self,
-        availability_hours: list[AvailabilityHours],
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
+        stages: Tuple[str, ...],
         business_service_hours: list[BusinessServiceHours],
-    ) -> bool:
-        return bool(availability_hours and business_service_hours)
+        solver_parameters: SolverParameters,
+        hinted_pairs: Set[Tuple[int, int]],
+        context: HorizonContext | None,
+        soft_coverage: bool,
+        on_solution: Callable[[IntermediateSolution], None] | None,
+        should_stop: Callable[[], bool] | None,
+        stats: SolveStats,
+        forced: Dict[int, int] | None = None,
+    ) -> list[Assignment] | None:
+        model, assignments, person_slots = self._build_constrained_model(
+            problem, slot_candidates, context, soft_coverage, stats, forced
+        )
+        deadline = self._get_deadline(solver_parameters)
+        first_run = len(stats.solver_runs)
+        result = None
+        for index, stage in enumerate(stages):
+            with stats.measure("objective"):
+                objective_terms = self._build_objective(
+                    model,
+                    problem,
+                    stage,
+                    slot_candidates,
+                    person_slots,
+                    assignments,
+                    context,
+                )
+            if not objective_terms:
+                continue
+            objective = sum(objective_terms)
+            model.Maximize(objective)
+            model.ClearHints()
+            if result is not None:
+                hinted_pairs = self._encode_hints(
+                    problem, self._to_assignment_keys(result)
+                )
+            if hinted_pairs:
+                self._add_solution_hints(model, assignments, hinted_pairs, forced)
+
+            stage_assignments = self._solve_and_extract_assignments(
+                model,
+                problem,
+                assignments,
+                business_service_hours,
+                self._get_remaining_parameters(
+                    solver_parameters, deadline, len(stages) - index
+                ),
+                on_solution,
+                should_stop,
+                stats,
+                stage,
+                len(stats.solver_runs) - first_run,
+            )
+            if stage_assignments is None:
+                return None
+            run = stats.solver_runs[-1]
+            if run.status not in ("OPTIMAL", "FEASIBLE"):
+                break
+            result = stage_assignments
+            model.Add(objective >= round(run.objective_value))
+        return result if result is not None else []
+
+    def _get_deadline(self, solver_parameters: SolverParameters) -> float | None:
+        if solver_parameters.max_time_in_seconds is None:
+            return None
+        return timer.time() + solver_parameters.max_time_in_seconds
 
-    def _has_valid_slots(
+    def _get_remaining_parameters(
         self,
-        time_slots: List[Tuple[date, time, time]],
-        availability_slots: Set[Tuple[UUID, date, time, time]],
-    ) -> bool:
-        return bool(time_slots and availability_slots)
+        solver_parameters: SolverParameters,
+        deadline: float | None,
+        remaining_runs: int,
+    ) -> SolverParameters:
+        if deadline is None:
+            return solver_parameters
+        return replace(
+            solver_parameters,
+            max_time_in_seconds=max(0.0, deadline - timer.time()) / remaining_runs,
+        )
 
-    def _extract_person_ids(
-        self, availability_hours: list[AvailabilityHours]
-    ) -> Set[UUID]:
-        return {ah.person_id for ah in availability_hours}
+    def _add_solution_hints(
+        self,
+        model: cp_model.CpModel,
+        assignments: Dict[Tuple[int, int], cp_model.IntVar],
+        hinted_pairs: Set[Tuple[int, int]],
+        forced: Dict[int, int] | None = None,
+    ) -> None:
+        forced = forced or {}
+        for (person, slot), var in assignments.items():
+            if slot not in forced:
+                model.AddHint(var, 1 if (person, slot) in hinted_pairs else 0)
+
+    def _build_model(
+        self,
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
+        strategy: str,
+        context: HorizonContext | None = None,
+        soft_coverage: bool = False,
+        stats: SolveStats | None = None,
+        forced: Dict[int, int] | None = None,
+    ) -> Tuple[cp_model.CpModel, Dict[Tuple[int, int], cp_model.IntVar]]:
+        stats = stats or SolveStats()
+        model, assignments, person_slots = self._build_constrained_model(
+            problem, slot_candidates, context, soft_coverage, stats, forced
+        )
+        with stats.measure("objective"):
+            self._set_objective(
+                model,
+                problem,
+                strategy,
+                slot_candidates,
+                person_slots,
+                assignments,
+                context,
+            )
+
+        return model, assignments
+
+    def _build_constrained_model(
+        self,
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
+        context: HorizonContext | None,
+        soft_coverage: bool,
+        stats: SolveStats,
+        forced: Dict[int, int] | None = None,
+    ) -> Tuple[
+        cp_model.CpModel,
+        Dict[Tuple[int, int], cp_model.IntVar],
+        Dict[int, List[int]],
+    ]:
+        with stats.measure("variables"):
+            model = cp_model.CpModel()
+            person_slots = self._group_slots_by_person(slot_candidates)
+            assignments = self._create_decision_variables(
+                model, problem, slot_candidates, forced
+            )
+
+        with stats.measure("constraints"):
+            self._add_coverage_constraints(
+                model, slot_candidates, assignments, soft_coverage
+            )
+            self._add_no_overlap_constraints(model, problem, person_slots, assignments)
+            if self.symmetry_breaking:
+                self._add_symmetry_breaking_constraints(
+                    model, problem, person_slots, assignments, context
+                )
+        return model, assignments, person_slots
 
     def _create_decision_variables(
         self,
         model: cp_model.CpModel,
-        person_ids: Set[UUID],
-        time_slots: List[Tuple[date, time, time]],
-    ) -> Dict[Tuple[UUID, date, time, time], cp_model.IntVar]:
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
+        forced: Dict[int, int] | None = None,
+    ) -> Dict[Tuple[int, int], cp_model.IntVar]:
+        forced = forced or {}
         assignments = {}
-        for person_id in person_ids:
-            for slot_date, slot_start, slot_end in time_slots:
-                var_name = f"assign_{person_id}_{slot_date}_{slot_start}_{slot_end}"
-                assignments[(person_id, slot_date, slot_start, slot_end)] = (
-                    model.NewBoolVar(var_name)
+        for slot, candidates in slot_candidates.items():
+            if slot in forced:
+                assignments[(forced[slot], slot)] = model.NewConstant(1)
+                continue
+            for person in candidates:
+                assignments[(person, slot)] = model.NewBoolVar(
+                    problem.variable_name("assign", person, slot)
                 )
         return assignments
 
     def _add_coverage_constraints(
         self,
         model: cp_model.CpModel,
-        time_slots: List[Tuple[date, time, time]],
-        person_ids: Set[UUID],
-        assignments: Dict[Tuple[UUID, date, time, time], cp_model.IntVar],
+        slot_candidates: Dict[int, List[int]],
+        assignments: Dict[Tuple[int, int], cp_model.IntVar],
+        soft_coverage: bool = False,
     ) -> None:
-        for slot_date, slot_start, slot_end in time_slots:
+        for slot, candidates in slot_candidates.items():
             person_assignments = self._get_person_assignments_for_slot(
-                slot_date, slot_start, slot_end, person_ids, assignments
+                slot, candidates, assignments
             )
-            if person_assignments:
+            if not person_assignments:
+                continue
+            if soft_coverage:
+                model.Add(sum(person_assignments) <= 1)
+            else:
                 model.Add(sum(person_assignments) == 1)
 
     def _get_person_assignments_for_slot(
         self,
-        slot_date: date,
-        slot_start: time,
-        slot_end: time,
-        person_ids: Set[UUID],
-        assignments: Dict[Tuple[UUID, date, time, time], cp_model.IntVar],
+        slot: int,
+        candidates: List[int],
+        assignments: Dict[Tuple[int, int], cp_model.IntVar],
     ) -> List[cp_model.IntVar]:
-        return [
-            assignments[(pid, slot_date, slot_start, slot_end)]
-            for pid in person_ids
-            if (pid, slot_date, slot_start, slot_end) in assignments
-        ]
+        return [assignments[(person, slot)] for person in candidates]
 
-    def _add_availability_constraints(
+    def _add_no_overlap_constraints(
         self,
         model: cp_model.CpModel,
-        person_ids: Set[UUID],
-        time_slots: List[Tuple[date, time, time]],
-        assignments: Dict[Tuple[UUID, date, time, time], cp_model.IntVar],
-        availability_slots: Set[Tuple[UUID, date, time, time]],
+        problem: EncodedProblem,
+        person_slots: Dict[int, List[int]],
+        assignments: Dict[Tuple[int, int], cp_model.IntVar],
     ) -> None:
-        for person_id in person_ids:
-            for slot_date, slot_start, slot_end in time_slots:
-                if (person_id, slot_date, slot_start, slot_end) not in assignments:
-                    continue
-
-                if not self._is_person_available(
-                    person_id, slot_date, slot_start, slot_end, availability_slots
-                ):
-                    model.Add(
-                        assignments[(person_id, slot_date, slot_start, slot_end)] == 0
-                    )
+        overlap_builders = {
+            "cliques": self._add_clique_no_overlap_constraints,
+            "intervals": self._add_interval_no_overlap_constraints,
+        }
 
-    def _add_no_overlap_constraints(
+        builder = overlap_builders[self.overlap_formulation]
+        for person, slots in person_slots.items():
+            builder(model, problem, person, slots, assignments)
+
+    def _add_clique_no_overlap_constraints(
         self,
         model: cp_model.CpModel,
-        person_ids: Set[UUID],
-        time_slots: List[Tuple[date, time, time]],
-        assignments: Dict[Tuple[UUID, date, time, time], cp_model.IntVar],
+        problem: EncodedProblem,
+        person: int,
+        person_slots: List[int],
+        assignments: Dict[Tuple[int, int], cp_model.IntVar],
     ) -> None:
-        for person_id in person_ids:
-            for slot_date, slot_start, slot_end in time_slots:
-                if (person_id, slot_date, slot_start, slot_end) not in assignments:
-                    continue
-
-                self._add_overlap_constraints_for_slot(
-                    model,
-                    person_id,
-                    slot_date,
-                    slot_start,
-                    slot_end,
-                    time_slots,
-                    assignments,
-                )
+        absolute_starts = problem.absolute_starts
+        absolute_ends = problem.absolute_ends
+        intervals = [
+            (absolute_starts[slot], absolute_ends[slot]) for slot in person_slots
+        ]
+        for clique in maximal_overlap_cliques(intervals):
+            model.AddAtMostOne(
+                assignments[(person, person_slots[index])] for index in clique
+            )
 
-    def _add_overlap_constraints_for_slot(
+    def _add_interval_no_overlap_constraints(
         self,
         model: cp_model.CpModel,
-        person_id: UUID,
-        slot_date: date,
-        slot_start: time,
-        slot_end: time,
-        time_slots: List[Tuple[date, time, time]],
-        assignments: Dict[Tuple[UUID, date, time, time], cp_model.IntVar],
+        problem: EncodedProblem,
+        person: int,
+        person_slots: List[int],
+        assignments: Dict[Tuple[int, int], cp_model.IntVar],
     ) -> None:
-        overlapping_slots = self._get_overlapping_slots(
-            slot_date, slot_start, slot_end, time_slots
-        )
-        for overlap_date, overlap_start, overlap_end in overlapping_slots:
-            if (person_id, overlap_date, overlap_start, overlap_end) not in assignments:
-                continue
+        absolute_starts = problem.absolute_starts
+        absolute_ends = problem.absolute_ends
+        intervals = [
+            model.NewOptionalFixedSizeIntervalVar(
+                absolute_starts[slot],
+                absolute_ends[slot] - absolute_starts[slot],
+                assignments[(person, slot)],
+                problem.variable_name("interval", person, slot),
+            )
+            for slot in person_slots
+        ]
+        if len(intervals) > 1:
+            model.AddNoOverlap(intervals)
 
-            if (overlap_date, overlap_start, overlap_end) == (
-                slot_date,
-                slot_start,
-                slot_end,
-            ):
-                continue
+    def _add_symmetry_breaking_constraints(
+        self,
+        model: cp_model.CpModel,
+        problem: EncodedProblem,
+        person_slots: Dict[int, List[int]],
+        assignments: Dict[Tuple[int, int], cp_model.IntVar],
+        context: HorizonContext | None,
+    ) -> None:
+        context = context or HorizonContext()
+        accumulated_hours = self._encode_accumulated_hours(problem, context)
+        boundary_ends = self._encode_boundary_slots(problem, context)
+        person_states = {
+            person: (accumulated_hours.get(person), boundary_ends.get(person))
+            for person in person_slots
+        }
+        for people in find_interchangeable_people(person_slots, person_states):
+            slots = person_slots[people[0]]
+            for previous, person in zip(people, people[1:]):
+                model.Add(assignments[(person, slots[0])] == 0)
+                has_earlier = assignments[(previous, slots[0])]
+                for index, slot in enumerate(slots[1:], start=1):
+                    model.Add(assignments[(person, slot)] <= has_earlier)
+                    if index < len(slots) - 1:
+                        has_earlier = self._add_prefix_assignment(
+                            model,
+                            problem,
+                            previous,
+                            slot,
+                            assignments[(previous, slot)],
+                            has_earlier,
+                        )
 
-            model.Add(
-                assignments[(person_id, slot_date, slot_start, slot_end)]
-                + assignments[(person_id, overlap_date, overlap_start, overlap_end)]
-                <= 1
-            )
+    def _add_prefix_assignment(
+        self,
+        model: cp_model.CpModel,
+        problem: EncodedProblem,
+        person: int,
+        slot: int,
+        assigned: cp_model.IntVar,
+        has_earlier: cp_model.IntVar,
+    ) -> cp_model.IntVar:
+        has_assignment = model.NewBoolVar(
+            problem.variable_name("has_assignment", person, slot)
+        )
+        model.Add(has_assignment >= has_earlier)
+        model.Add(has_assignment >= assigned)
+        model.Add(has_assignment <= has_earlier + assigned)
+        return has_assignment
 
     def _set_objective(
         self,
         model: cp_model.CpModel,
+        problem: EncodedProblem,
         strategy: str,
-        time_slots: List[Tuple[date, time, time]],
-        person_ids: Set[UUID],
-        assignments: Dict[Tuple[UUID, date, time, time], cp_model.IntVar],
+        slot_candidates: Dict[int, List[int]],
+        person_slots: Dict[int, List[int]],
+        assignments: Dict[Tuple[int, int], cp_model.IntVar],
+        context: HorizonContext | None,
     ) -> None:
         objective_terms = self._build_objective(
-            model, strategy, time_slots, person_ids, assignments
+            model,
+            problem,
+            strategy,
+            slot_candidates,
+            person_slots,
+            assignments,
+            context,
         )
         if objective_terms:
             model.Maximize(sum(objective_terms))
@@ -199,142 +1040,91 @@ class ORToolsScheduler(Scheduler):
     def _solve_and_extract_assignments(
         self,
         model: cp_model.CpModel,
-        assignments: Dict[Tuple[UUID, date, time, time], cp_model.IntVar],
+        problem: EncodedProblem,
+        assignments: Dict[Tuple[int, int], cp_model.IntVar],
         business_service_hours: list[BusinessServiceHours],
-    ) -> list[Assignment]:
-        solver = cp_model.CpSolver()
-        status = solver.Solve(model)
+        solver_parameters: SolverParameters,
+        on_solution: Callable[[IntermediateSolution], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+        stats: SolveStats | None = None,
+        objective: str | None = None,
+        stage: int = 0,
+    ) -> list[Assignment] | None:
+        stats = stats or SolveStats()
+        if should_stop and should_stop():
+            raise SolveCancelled()
+        model_file = export_model(model, stats.export_dir) if stats.export_dir else None
+        solver = self._create_solver(solver_parameters)
+        assignment_index = AssignmentIndex(assignments)
+        poller = StopPoller(solver, should_stop) if should_stop else None
+        with poller or nullcontext():
+            if on_solution:
+                publisher = SolutionPublisher(
+                    lambda solution: self._extract_assignments_from_solution(
+                        solution, problem, assignment_index, business_service_hours
+                    ),
+                    on_solution,
+                    objective,
+                    stage,
+                )
+                status = solver.Solve(model, publisher)
+                if publisher.cancellation:
+                    raise publisher.cancellation
+            else:
+                status = solver.Solve(model)
+        if poller and poller.stopped:
+            raise SolveCancelled()
+        stats.add_solver_run(
+            SolverRun.from_solver(model, solver, status, model_file, objective, stage)
+        )
 
+        if status == cp_model.INFEASIBLE:
+            return None
         if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
             return []
 
-        return self._extract_assignments_from_solution(
-            solver, assignments, business_service_hours
-        )
+        with stats.measure("extraction"):
+            return self._extract_assignments_from_solution(
+                solver, problem, assignment_index, business_service_hours
+            )
+
+    def _create_solver(self, solver_parameters: SolverParameters) -> cp_model.CpSolver:
+        solver = cp_model.CpSolver()
+        if solver_parameters.max_time_in_seconds is not None:
+            solver.parameters.max_time_in_seconds = solver_parameters.max_time_in_seconds
+        if solver_parameters.num_search_workers is not None:
+            solver.parameters.num_workers = solver_parameters.num_search_workers
+        if solver_parameters.relative_gap_limit is not None:
+            solver.parameters.relative_gap_limit = solver_parameters.relative_gap_limit
+        if solver_parameters.random_seed is not None:
+            solver.parameters.random_seed = solver_parameters.random_seed
+        if solver_parameters.log_search_progress:
+            solver.parameters.log_search_progress = True
+            solver.parameters.log_to_response = True
+        return solver
 
     def _extract_assignments_from_solution(
         self,
-        solver: cp_model.CpSolver,
-        assignments: Dict[Tuple[UUID, date, time, time], cp_model.IntVar],
+        solver: cp_model.CpSolver | cp_model.CpSolverSolutionCallback,
+        problem: EncodedProblem,
+        assignment_index: AssignmentIndex,
         business_service_hours: list[BusinessServiceHours],
     ) -> list[Assignment]:
-        assignments_list = []
-        role_id = business_service_hours[0].role_id
-
-        for (person_id, slot_date, slot_start, slot_end), var in assignments.items():
-            if solver.Value(var) == 1:
-                assignments_list.append(
-                    Assignment(
-                        person_id=person_id,
-                        date=slot_date,
-                        start_time=slot_start,
-                        end_time=slot_end,
-                        role_id=role_id,
-                    )
-                )
-
-        return assignments_list
-
-    def _get_date_range_for_weeks(self, weeks: list[int], year: int) -> List[date]:
-        dates = []
-        jan1 = date(year, 1, 1)
-        jan1_weekday = jan1.weekday()
-        days_to_monday = (jan1_weekday - 0) % 7
-        first_monday = jan1 - timedelta(days=days_to_monday)
-        if first_monday.year < year:
-            first_monday = first_monday + timedelta(weeks=1)
-
-        for week in weeks:
-            week_start = first_monday + timedelta(weeks=week - 1)
-            for day_offset in range(7):
-                dates.append(week_start + timedelta(days=day_offset))
-        return dates
-
-    def _create_time_slots(
-        self, business_service_hours: list[BusinessServiceHours], date_range: List[date]
-    ) -> List[Tuple[date, time, time]]:
-        slots = []
-        for bsh in business_service_hours:
-            for d in date_range:
-                day_of_week = d.weekday()
-                if bsh.specific_date:
-                    if bsh.specific_date == d:
-                        slots.append((d, bsh.start_time, bsh.end_time))
-                elif bsh.is_recurring and bsh.day_of_week is not None:
-                    if bsh.day_of_week == day_of_week:
-                        if not bsh.start_date or d >= bsh.start_date:
-                            if not bsh.end_date or d <= bsh.end_date:
-                                slots.append((d, bsh.start_time, bsh.end_time))
-                elif bsh.start_date and bsh.end_date:
-                    if bsh.start_date <= d <= bsh.end_date:
-                        slots.append((d, bsh.start_time, bsh.end_time))
-        return sorted(set(slots))
-
-    def _create_availability_slots(
-        self, availability_hours: list[AvailabilityHours], date_range: List[date]
-    ) -> Set[Tuple[UUID, date, time, time]]:
-        slots = set()
-        for ah in availability_hours:
-            for d in date_range:
-                day_of_week = d.weekday()
-                if ah.specific_date:
-                    if ah.specific_date == d:
-                        slots.add((ah.person_id, d, ah.start_time, ah.end_time))
-                elif ah.is_recurring and ah.day_of_week is not None:
-                    if ah.day_of_week == day_of_week:
-                        if not ah.start_date or d >= ah.start_date:
-                            if not ah.end_date or d <= ah.end_date:
-                                slots.add((ah.person_id, d, ah.start_time, ah.end_time))
-                elif ah.start_date and ah.end_date:
-                    if ah.start_date <= d <= ah.end_date:
-                        slots.add((ah.person_id, d, ah.start_time, ah.end_time))
-        return slots
-
-    def _is_person_available(
-        self,
-        person_id: UUID,
-        slot_date: date,
-        slot_start: time,
-        slot_end: time,
-        availability_slots: Set[Tuple[UUID, date, time, time]],
-    ) -> bool:
-        for pid, avail_date, avail_start, avail_end in availability_slots:
-            if pid == person_id and avail_date == slot_date:
-                if avail_start <= slot_start and slot_end <= avail_end:
-                    return True
-        return False
-
-    def _get_overlapping_slots(
-        self, slot_date: date, slot_start: time, slot_end: time, all_slots: List[Tuple[date, time, time]]
-    ) -> List[Tuple[date, time, time]]:
-        overlapping = []
-        for other_date, other_start, other_end in all_slots:
-            if other_date == slot_date:
-                if not (slot_end <= other_start or other_end <= slot_start):
-                    overlapping.append((other_date, other_start, other_end))
-        return overlapping
-
-    def _calculate_gap(
-        self, date1: date, time1: time, date2: date, time2: time
-    ) -> int:
-        dt1 = datetime.combine(date1, time1)
-        dt2 = datetime.combine(date2, time2)
-        return int((dt2 - dt1).total_seconds() / 3600)
-
-    def _calculate_duration(self, start_time: time, end_time: time) -> int:
-        start_dt = datetime.combine(date.today(), start_time)
-        end_dt = datetime.combine(date.today(), end_time)
-        if end_dt < start_dt:
-            end_dt += timedelta(days=1)
-        return int((end_dt - start_dt).total_seconds() / 3600)
+        return self._decode_slot_people(
+            problem,
+            assignment_index.slot_people(solver.response_proto.solution),
+            business_service_hours,
+        )
 
     def _build_objective(
         self,
         model: cp_model.CpModel,
+        problem: EncodedProblem,
         strategy: str,
-        time_slots: List[Tuple[date, time, time]],
-        person_ids: Set[UUID],
-        assignments: Dict[Tuple[UUID, date, time, time], cp_model.IntVar],
+        slot_candidates: Dict[int, List[int]],
+        person_slots: Dict[int, List[int]],
+        assignments: Dict[Tuple[int, int], cp_model.IntVar],
+        context: HorizonContext | None,
     ) -> List[cp_model.IntVar | cp_model.IntVar]:
         strategy_builders = {
             "maximize_coverage": self._build_maximize_coverage_objective,
@@ -344,25 +1134,34 @@ class ORToolsScheduler(Scheduler):
 
         builder = strategy_builders.get(strategy)
         if builder:
-            return builder(model, time_slots, person_ids, assignments)
+            return builder(
+                model,
+                problem,
+                slot_candidates,
+                person_slots,
+                assignments,
+                context or HorizonContext(),
+            )
         return []
 
     def _build_maximize_coverage_objective(
         self,
         model: cp_model.CpModel,
-        time_slots: List[Tuple[date, time, time]],
-        person_ids: Set[UUID],
-        assignments: Dict[Tuple[UUID, date, time, time], cp_model.IntVar],
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
+        person_slots: Dict[int, List[int]],
+        assignments: Dict[Tuple[int, int], cp_model.IntVar],
+        context: HorizonContext,
     ) -> List[cp_model.IntVar]:
         objective_terms = []
-        for slot_date, slot_start, slot_end in time_slots:
-            slot_covered = model.NewBoolVar(f"covered_{slot_date}_{slot_start}_{slot_end}")
-            person_assignments = [
-                assignments[(pid, slot_date, slot_start, slot_end)]
-                for pid in person_ids
-                if (pid, slot_date, slot_start, slot_end) in assignments
-            ]
+        for slot, candidates in slot_candidates.items():
+            person_assignments = self._get_person_assignments_for_slot(
+                slot, candidates, assignments
+            )
             if person_assignments:
+                slot_covered = model.NewBoolVar(
+                    problem.variable_name("covered", slot=slot)
+                )
                 model.AddMaxEquality(slot_covered, person_assignments)
                 objective_terms.append(slot_covered)
         return objective_terms
@@ -370,48 +1169,90 @@ class ORToolsScheduler(Scheduler):
     def _build_minimize_gaps_objective(
         self,
         model: cp_model.CpModel,
-        time_slots: List[Tuple[date, time, time]],
-        person_ids: Set[UUID],
-        assignments: Dict[Tuple[UUID, date, time, time], cp_model.IntVar],
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
+        person_slots: Dict[int, List[int]],
+        assignments: Dict[Tuple[int, int], cp_model.IntVar],
+        context: HorizonContext,
     ) -> List[cp_model.IntVar]:
+        boundary_ends = self._encode_boundary_slots(problem, context)
+        calculate_person_gaps = (
+            self._calculate_person_span_gaps
+            if self.gap_formulation == "span"
+            else self._calculate_person_gaps
+        )
         gap_terms = []
-        for person_id in person_ids:
-            person_gap_terms = self._calculate_person_gaps(
-                model, person_id, time_slots, assignments
+        for person, slots in person_slots.items():
+            person_gap_terms = calculate_person_gaps(
+                model,
+                problem,
+                person,
+                slots,
+                assignments,
+                boundary_ends.get(person),
             )
             gap_terms.extend(person_gap_terms)
 
         if not gap_terms:
             return []
 
-        gap_penalty = model.NewIntVar(0, 1000000, "gap_penalty")
+        max_penalty = (
+            len(gap_terms) * MINUTES_PER_DAY
+            if self.gap_formulation == "span"
+            else 1000000
+        )
+        gap_penalty = model.NewIntVar(0, max_penalty, "gap_penalty")
         model.Add(gap_penalty == sum(gap_terms))
         return [-gap_penalty]
 
+    def _encode_boundary_slots(
+        self, problem: EncodedProblem, context: HorizonContext
+    ) -> Dict[int, int]:
+        person_index = problem.person_index()
+        boundary_ends = {}
+        for person_id, boundary_slot in context.boundary_slots.items():
+            if person_id in person_index:
+                day, _, end_minute = problem.encode_slot(*boundary_slot)
+                boundary_ends[person_index[person_id]] = (
+                    day * MINUTES_PER_DAY + end_minute
+                )
+        return boundary_ends
+
     def _calculate_person_gaps(
         self,
         model: cp_model.CpModel,
-        person_id: UUID,
-        time_slots: List[Tuple[date, time, time]],
-        assignments: Dict[Tuple[UUID, date, time, time], cp_model.IntVar],
+        problem: EncodedProblem,
+        person: int,
+        person_slots: List[int],
+        assignments: Dict[Tuple[int, int], cp_model.IntVar],
+        boundary_end: int | None = None,
     ) -> List[cp_model.IntVar]:
-        person_slots = [
-            (slot_date, slot_start, slot_end)
-            for slot_date, slot_start, slot_end in time_slots
-            if (person_id, slot_date, slot_start, slot_end) in assignments
-        ]
-        person_slots.sort()
-
+        absolute_starts = problem.absolute_starts
+        absolute_ends = problem.absolute_ends
         gap_terms = []
+        if boundary_end is not None and person_slots:
+            first_slot = person_slots[0]
+            gap = self._calculate_gap(boundary_end, absolute_starts[first_slot])
+            assigned_first = assignments[(person, first_slot)]
+
+            gap_var = model.NewIntVar(
+                0, 10000, problem.variable_name("gap", person, suffix="boundary")
+            )
+            model.Add(gap_var == gap).OnlyEnforceIf(assigned_first)
+            model.Add(gap_var == 0).OnlyEnforceIf(assigned_first.Not())
+            gap_terms.append(gap_var)
+
         for i in range(len(person_slots) - 1):
-            slot1_date, slot1_start, slot1_end = person_slots[i]
-            slot2_date, slot2_start, slot2_end = person_slots[i + 1]
+            slot1 = person_slots[i]
+            slot2 = person_slots[i + 1]
 
-            gap = self._calculate_gap(slot1_date, slot1_end, slot2_date, slot2_start)
-            assigned1 = assignments[(person_id, slot1_date, slot1_start, slot1_end)]
-            assigned2 = assignments[(person_id, slot2_date, slot2_start, slot2_end)]
+            gap = self._calculate_gap(absolute_ends[slot1], absolute_starts[slot2])
+            assigned1 = assignments[(person, slot1)]
+            assigned2 = assignments[(person, slot2)]
 
-            gap_var = model.NewIntVar(0, 10000, f"gap_{person_id}_{i}")
+            gap_var = model.NewIntVar(
+                0, 10000, problem.variable_name("gap", person, suffix=i)
+            )
             model.Add(gap_var == gap).OnlyEnforceIf([assigned1, assigned2])
             model.Add(gap_var == 0).OnlyEnforceIf(assigned1.Not())
             model.Add(gap_var == 0).OnlyEnforceIf(assigned2.Not())
@@ -419,15 +1260,77 @@ class ORToolsScheduler(Scheduler):
 
         return gap_terms
 
+    def _calculate_person_span_gaps(
+        self,
+        model: cp_model.CpModel,
+        problem: EncodedProblem,
+        person: int,
+        person_slots: List[int],
+        assignments: Dict[Tuple[int, int], cp_model.IntVar],
+        boundary_end: int | None = None,
+    ) -> List[cp_model.IntVar]:
+        slot_days = problem.slot_days
+        absolute_starts = problem.absolute_starts
+        absolute_ends = problem.absolute_ends
+        day_slots: Dict[int, List[int]] = defaultdict(list)
+        for slot in person_slots:
+            day_slots[int(slot_days[slot])].append(slot)
+        boundary_day = (
+            boundary_end // MINUTES_PER_DAY if boundary_end is not None else None
+        )
+
+        gap_terms = []
+        for day, slots in day_slots.items():
+            has_boundary = day == boundary_day
+            if len(slots) < 2 and not has_boundary:
+                continue
+            day_start = min(absolute_starts[slot] for slot in slots)
+            if has_boundary:
+                day_start = min(day_start, boundary_end)
+            day_end = max(absolute_ends[slot] for slot in slots)
+
+            first_start = model.NewIntVar(
+                day_start, day_end, problem.variable_name("first", person, suffix=day)
+            )
+            last_end = model.NewIntVar(
+                day_start, day_end, problem.variable_name("last", person, suffix=day)
+            )
+            model.Add(first_start <= last_end)
+            if has_boundary:
+                model.Add(first_start <= boundary_end)
+            worked = []
+            for slot in slots:
+                assigned = assignments[(person, slot)]
+                model.Add(first_start <= absolute_starts[slot]).OnlyEnforceIf(assigned)
+                model.Add(last_end >= absolute_ends[slot]).OnlyEnforceIf(assigned)
+                worked.append((absolute_ends[slot] - absolute_starts[slot]) * assigned)
+
+            idle = model.NewIntVar(
+                0, day_end - day_start, problem.variable_name("idle", person, suffix=day)
+            )
+            model.Add(idle == last_end - first_start - sum(worked))
+            gap_terms.append(idle)
+
+        return gap_terms
+
+    def _calculate_gap(self, end_minute: int, start_minute: int) -> int:
+        return int((start_minute - end_minute) / 60)
+
     def _build_balance_workload_objective(
         self,
         model: cp_model.CpModel,
-        time_slots: List[Tuple[date, time, time]],
-        person_ids: Set[UUID],
-        assignments: Dict[Tuple[UUID, date, time, time], cp_model.IntVar],
+        problem: EncodedProblem,
+        slot_candidates: Dict[int, List[int]],
+        person_slots: Dict[int, List[int]],
+        assignments: Dict[Tuple[int, int], cp_model.IntVar],
+        context: HorizonContext,
     ) -> List[cp_model.IntVar]:
         person_total_hours = self._calculate_person_total_hours(
-            model, person_ids, time_slots, assignments
+            model,
+            problem,
+            person_slots,
+            assignments,
+            self._encode_accumulated_hours(problem, context),
         )
 
         if len(person_total_hours) <= 1:
@@ -438,36 +1341,46 @@ class ORToolsScheduler(Scheduler):
     def _calculate_person_total_hours(
         self,
         model: cp_model.CpModel,
-        person_ids: Set[UUID],
-        time_slots: List[Tuple[date, time, time]],
-        assignments: Dict[Tuple[UUID, date, time, time], cp_model.IntVar],
-    ) -> Dict[UUID, cp_model.IntVar]:
+        problem: EncodedProblem,
+        person_slots: Dict[int, List[int]],
+        assignments: Dict[Tuple[int, int], cp_model.IntVar],
+        accumulated_hours: Dict[int, int] | None = None,
+    ) -> Dict[int, cp_model.IntVar]:
+        accumulated_hours = accumulated_hours or {}
         person_total_hours = {}
-        for person_id in person_ids:
+        for person, slots in person_slots.items():
             person_hours_list = self._calculate_person_slot_hours(
-                model, person_id, time_slots, assignments
+                model, problem, person, slots, assignments
             )
             if person_hours_list:
-                total = model.NewIntVar(0, 10000, f"total_{person_id}")
-                model.Add(total == sum(person_hours_list))
-                person_total_hours[person_id] = total
+                total = model.NewIntVar(
+                    0, 10000, problem.variable_name("total", person)
+                )
+                model.Add(
+                    total == accumulated_hours.get(person, 0) + sum(person_hours_list)
+                )
+                person_total_hours[person] = total
+        for person, hours in accumulated_hours.items():
+            if person not in person_total_hours:
+                person_total_hours[person] = model.NewConstant(hours)
         return person_total_hours
 
     def _calculate_person_slot_hours(
         self,
         model: cp_model.CpModel,
-        person_id: UUID,
-        time_slots: List[Tuple[date, time, time]],
-        assignments: Dict[Tuple[UUID, date, time, time], cp_model.IntVar],
+        problem: EncodedProblem,
+        person: int,
+        person_slots: List[int],
+        assignments: Dict[Tuple[int, int], cp_model.IntVar],
     ) -> List[cp_model.IntVar]:
+        slot_hours = problem.slot_hours
         person_hours_list = []
-        for slot_date, slot_start, slot_end in time_slots:
-            if (person_id, slot_date, slot_start, slot_end) not in assignments:
-                continue
-
-            duration = self._calculate_duration(slot_start, slot_end)
-            hour_var = model.NewIntVar(0, duration, f"hours_{person_id}_{slot_date}")
-            assignment_var = assignments[(person_id, slot_date, slot_start, slot_end)]
+        for slot in person_slots:
+            duration = slot_hours[slot]
+            hour_var = model.NewIntVar(
+                0, duration, problem.variable_name("hours", person, slot)
+            )
+            assignment_var = assignments[(person, slot)]
 
             model.Add(hour_var == duration).OnlyEnforceIf(assignment_var)
             model.Add(hour_var == 0).OnlyEnforceIf(assignment_var.Not())
@@ -478,7 +1391,7 @@ class ORToolsScheduler(Scheduler):
     def _build_variance_penalty(
         self,
         model: cp_model.CpModel,
-        person_total_hours: Dict[UUID, cp_model.IntVar],
+        person_total_hours: Dict[int, cp_model.IntVar],
     ) -> List[cp_model.IntVar]:
         total_hours_list = list(person_total_hours.values())
         total_sum = model.NewIntVar(0, 100000, "total_sum")
@@ -489,7 +1402,8 @@ class ORToolsScheduler(Scheduler):
 
         variance_terms = []
         for hours_var in total_hours_list:
-            diff = model.NewIntVar(0, 10000, f"diff_{hours_var}")
+            name = hours_var.Name()
+            diff = model.NewIntVar(0, 10000, f"diff_{name}" if name else "")
             model.AddAbsEquality(diff, hours_var - mean_var)
             variance_terms.append(diff)
 
@@ -0,0 +1,41 @@
+from datetime import time
+from typing import Dict, List, Tuple
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def to_minutes(value: time) -> int:
+    return value.hour * 60 + value.minute
+
+
+def interval_minutes(start: time, end: time) -> Tuple[int, int]:
+    start_minute = to_minutes(start)
+    end_minute = to_minutes(end)
+    if end_minute < start_minute:
+        end_minute += MINUTES_PER_DAY
+    return start_minute, end_minute
+
+
+def maximal_overlap_cliques(intervals: List[Tuple[int, int]]) -> List[List[int]]:
+    events = []
+    for index, (start, end) in enumerate(intervals):
+        if start < end:
+            events.append((start, 1, index))
+            events.append((end, 0, index))
+    events.sort()
+
+    cliques = []
+    active: Dict[int, None] = {}
+    grew_since_last_end = False
+    for _, is_start, index in events:
+        if is_start:
+            active[index] = None
+            grew_since_last_end = True
+            continue
+
+        if grew_since_last_end and len(active) > 1:
+            cliques.append(list(active))
+        grew_since_last_end = False
+        del active[index]
+
+    return cliques
@@ -0,0 +1,34 @@
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+
+def propagate_forced_assignments(
+    slot_candidates: Dict[int, List[int]],
+    starts: List[int],
+    ends: List[int],
+) -> Tuple[Dict[int, List[int]], Dict[int, int]] | None:
+    candidates = {slot: list(people) for slot, people in slot_candidates.items()}
+    person_slots: Dict[int, List[int]] = defaultdict(list)
+    for slot, people in candidates.items():
+        for person in people:
+            person_slots[person].append(slot)
+
+    forced: Dict[int, int] = {}
+    pending = [slot for slot, people in candidates.items() if len(people) == 1]
+    while pending:
+        slot = pending.pop()
+        if slot in forced:
+            continue
+        person = candidates[slot][0]
+        forced[slot] = person
+        for other in person_slots[person]:
+            if other == slot or person not in candidates[other]:
+                continue
+            if starts[other] >= ends[slot] or starts[slot] >= ends[other]:
+                continue
+            candidates[other].remove(person)
+            if not candidates[other]:
+                return None
+            if len(candidates[other]) == 1:
+                pending.append(other)
+    return candidates, forced
@@ -0,0 +1,158 @@
+import argparse
+import json
+from dataclasses import asdict, replace
+from pathlib import Path
+from typing import Any, Dict, List
+
+from modules.scheduler.case_export import ExportedCase, find_cases, load_case, load_model
+from modules.scheduler.greedy_scheduler import GreedyScheduler
+from modules.scheduler.models import SolverParameters
+from modules.scheduler.or_tools_scheduler import ORToolsScheduler
+from modules.scheduler.stats import SolverRun
+
+SCHEDULERS = {
+    "ORToolsScheduler": ORToolsScheduler,
+    "GreedyScheduler": GreedyScheduler,
+}
+
+
+def replay_models(
+    case: ExportedCase, solver_parameters: SolverParameters
+) -> List[Dict[str, Any]]:
+    runs = []
+    for path in case.model_files:
+        model = load_model(path)
+        solver = ORToolsScheduler()._create_solver(solver_parameters)
+        status = solver.Solve(model)
+        runs.append(asdict(SolverRun.from_solver(model, solver, status, path)))
+    return runs
+
+
+def replay_inputs(
+    case: ExportedCase,
+    scheduler: str,
+    scheduler_options: Dict[str, Any],
+    solver_parameters: SolverParameters,
+) -> Dict[str, Any]:
+    result = SCHEDULERS[scheduler](**scheduler_options).solve(
+        case.availability_hours,
+        case.business_service_hours,
+        case.weeks,
+        case.year,
+        case.strategy,
+        solver_parameters,
+        case.hints,
+    )
+    return {
+        "assignments": len(result.assignments),
+        "uncoverable_slots": len(result.uncoverable_slots),
+        **asdict(result.stats),
+    }
+
+
+def _solver_parameters(case: ExportedCase, args: argparse.Namespace) -> SolverParameters:
+    overrides = {
+        "max_time_in_seconds": args.max_time,
+        "num_search_workers": args.workers,
+        "relative_gap_limit": args.relative_gap_limit,
+        "random_seed": args.seed,
+    }
+    return replace(
+        case.solver_parameters,
+        log_search_progress=args.log,
+        **{name: value for name, value in overrides.items() if value is not None},
+    )
+
+
+def _scheduler_options(
+    case: ExportedCase, scheduler: str, args: argparse.Namespace
+) -> Dict[str, Any]:
+    options = dict(case.scheduler_options) if scheduler == case.scheduler else {}
+    overrides = {
+        "overlap_formulation": args.overlap_formulation,
+        "gap_formulation": args.gap_formulation,
+        "rolling_horizon_weeks": args.rolling_horizon_weeks,
+        "coverage_flows": False if args.no_coverage_flows else None,
+        "propagate_forced": False if args.no_propagate_forced else None,
+        "decompose": False if args.no_decompose else None,
+        "greedy_hints": True if args.greedy_hints else None,
+        "symmetry_breaking": True if args.symmetry_breaking else None,
+        "variable_names": True if args.variable_names else None,
+    }
+    options.update({name: value for name, value in overrides.items() if value is not None})
+    return options
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Replay exported scheduler cases with other solver parameters "
+        "or scheduler settings"
+    )
+    parser.add_argument(
+        "cases", nargs="+", help="case directories or directories containing cases"
+    )
+    parser.add_argument(
+        "--models",
+        action="store_true",
+        help="solve the exported CP-SAT models instead of re-running the scheduler",
+    )
+    parser.add_argument("--scheduler", choices=list(SCHEDULERS))
+    parser.add_argument("--max-time", type=float)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--relative-gap-limit", type=float)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--log", action="store_true")
+    parser.add_argument("--overlap-formulation", choices=ORToolsScheduler.OVERLAP_FORMULATIONS)
+    parser.add_argument("--gap-formulation", choices=ORToolsScheduler.GAP_FORMULATIONS)
+    parser.add_argument("--rolling-horizon-weeks", type=int)
+    parser.add_argument("--no-coverage-flows", action="store_true")
+    parser.add_argument("--no-propagate-forced", action="store_true")
+    parser.add_argument("--no-decompose", action="store_true")
+    parser.add_argument("--greedy-hints", action="store_true")
+    parser.add_argument("--symmetry-breaking", action="store_true")
+    parser.add_argument("--variable-names", action="store_true")
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    report = []
+    for case_dir in find_cases(args.cases):
+        case = load_case(case_dir)
+        solver_parameters = _solver_parameters(case, args)
+        if args.models:
+            runs = replay_models(case, solver_parameters)
+            report.append({"case": str(case_dir), "solver_runs": runs})
+            for run in runs:
+                presolve = (
+                    f"presolve={run['presolve_time']:.3f}s "
+                    if run["presolve_time"] is not None
+                    else ""
+                )
+                print(
+                    f"{case_dir.name} {Path(run['model_file']).name}: {run['status']} "
+                    f"objective={run['objective_value']:g} "
+                    f"bound={run['best_objective_bound']:g} "
+                    f"{presolve}search={run['search_time']:.3f}s"
+                )
+            continue
+
+        scheduler = args.scheduler or case.scheduler
+        result = replay_inputs(
+            case,
+            scheduler,
+            _scheduler_options(case, scheduler, args),
+            solver_parameters,
+        )
+        report.append({"case": str(case_dir), "scheduler": scheduler, **result})
+        print(
+            f"{case_dir.name} {scheduler}: {result['assignments']} assignments, "
+            f"{result['uncoverable_slots']} uncoverable, "
+            f"wall={result['wall_time']:.3f}s "
+            f"statuses={[run['status'] for run in result['solver_runs']]}"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+from dataclasses import dataclass, field
+from datetime import date, time
+from typing import Dict, List, Tuple
+from uuid import UUID
+
+
+@dataclass
+class HorizonContext:
+    accumulated_hours: Dict[UUID, int] = field(default_factory=dict)
+    boundary_slots: Dict[UUID, Tuple[date, time, time]] = field(default_factory=dict)
+
+
+def split_into_windows(weeks: list[int], window_weeks: int) -> List[List[int]]:
+    ordered_weeks = sorted(set(weeks))
+    return [
+        ordered_weeks[start : start + window_weeks]
+        for start in range(0, len(ordered_weeks), window_weeks)
+    ]
@@ -0,0 +1,76 @@
+from threading import Event, Thread
+from typing import Callable
+
+from ortools.sat.python import cp_model
+
+from modules.scheduler.interfaces import (
+    Assignment,
+    IntermediateSolution,
+    SolveCancelled,
+)
+
+STOP_POLL_SECONDS = 0.1
+
+
+class SolutionPublisher(cp_model.CpSolverSolutionCallback):
+    def __init__(
+        self,
+        extract_assignments: Callable[[cp_model.CpSolverSolutionCallback], list[Assignment]],
+        on_solution: Callable[[IntermediateSolution], None],
+        objective: str | None = None,
+        stage: int = 0,
+    ):
+        super().__init__()
+        self.extract_assignments = extract_assignments
+        self.on_solution = on_solution
+        self.objective = objective
+        self.stage = stage
+        self.cancellation: SolveCancelled | None = None
+
+    def on_solution_callback(self) -> None:
+        if self.cancellation:
+            return
+        try:
+            self.on_solution(
+                IntermediateSolution(
+                    objective_value=self.ObjectiveValue(),
+                    best_objective_bound=self.BestObjectiveBound(),
+                    wall_time=self.WallTime(),
+                    assignments=self.extract_assignments(self),
+                    objective=self.objective,
+                    stage=self.stage,
+                )
+            )
+        except SolveCancelled as cancellation:
+            self.cancellation = cancellation
+            self.StopSearch()
+
+
+class StopPoller:
+    def __init__(
+        self,
+        solver: cp_model.CpSolver,
+        should_stop: Callable[[], bool],
+        interval: float = STOP_POLL_SECONDS,
+    ):
+        self.solver = solver
+        self.should_stop = should_stop
+        self.interval = interval
+        self.stopped = False
+        self.finished = Event()
+        self.thread = Thread(target=self._poll, daemon=True)
+
+    def __enter__(self) -> "StopPoller":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.finished.set()
+        self.thread.join()
+
+    def _poll(self) -> None:
+        while not self.finished.wait(self.interval):
+            if self.should_stop():
+                self.stopped = True
+                self.solver.StopSearch()
+                return
@@ -0,0 +1,103 @@
+import re
+import time as timer
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+from ortools.sat.python import cp_model
+
+SEARCH_START_PATTERN = re.compile(r"Starting search at ([\d.]+)s")
+
+
+@dataclass
+class SolverRun:
+    status: str
+    num_variables: int
+    num_constraints: int
+    objective_value: float
+    best_objective_bound: float
+    num_conflicts: int
+    num_branches: int
+    presolve_time: float | None
+    search_time: float
+    wall_time: float
+    model_file: str | None = None
+    objective: str | None = None
+    stage: int = 0
+
+    @classmethod
+    def from_solver(
+        cls,
+        model: cp_model.CpModel,
+        solver: cp_model.CpSolver,
+        status: int,
+        model_file: Path | None = None,
+        objective: str | None = None,
+        stage: int = 0,
+    ) -> "SolverRun":
+        wall_time = solver.WallTime()
+        presolve_time = (
+            _search_start(solver.ResponseProto().solve_log, wall_time)
+            if solver.parameters.log_to_response
+            else None
+        )
+        return cls(
+            status=solver.StatusName(status),
+            num_variables=len(model.Proto().variables),
+            num_constraints=len(model.Proto().constraints),
+            objective_value=solver.ObjectiveValue(),
+            best_objective_bound=solver.BestObjectiveBound(),
+            num_conflicts=solver.NumConflicts(),
+            num_branches=solver.NumBranches(),
+            presolve_time=presolve_time,
+            search_time=wall_time - (presolve_time or 0.0),
+            wall_time=wall_time,
+            model_file=str(model_file) if model_file else None,
+            objective=objective,
+            stage=stage,
+        )
+
+
+@dataclass
+class SolveStats:
+    phase_times: Dict[str, float] = field(default_factory=dict)
+    num_variables: int = 0
+    num_constraints: int = 0
+    solver_runs: List[SolverRun] = field(default_factory=list)
+    wall_time: float = 0.0
+    export_dir: str | None = None
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        started = timer.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase_time(phase, timer.perf_counter() - started)
+
+    def add_phase_time(self, phase: str, seconds: float) -> None:
+        self.phase_times[phase] = self.phase_times.get(phase, 0.0) + seconds
+
+    def add_solver_run(self, run: SolverRun) -> None:
+        self.solver_runs.append(run)
+        if run.stage == 0:
+            self.num_variables += run.num_variables
+            self.num_constraints += run.num_constraints
+        if run.presolve_time is not None:
+            self.add_phase_time("presolve", run.presolve_time)
+        self.add_phase_time("search", run.search_time)
+
+    def merge(self, other: "SolveStats") -> None:
+        for phase, seconds in other.phase_times.items():
+            self.add_phase_time(phase, seconds)
+        self.num_variables += other.num_variables
+        self.num_constraints += other.num_constraints
+        self.solver_runs.extend(other.solver_runs)
+
+
+def _search_start(solve_log: str, wall_time: float) -> float:
+    match = SEARCH_START_PATTERN.search(solve_log)
+    if not match:
+        return 0.0
+    return min(float(match.group(1)), wall_time)
@@ -0,0 +1,11 @@
+from collections import defaultdict
+from typing import Dict, Hashable, List
+
+
+def find_interchangeable_people(
+    person_slots: Dict[int, List[int]], person_states: Dict[int, Hashable]
+) -> List[List[int]]:
+    classes: Dict[Hashable, List[int]] = defaultdict(list)
+    for person, slots in sorted(person_slots.items()):
+        classes[(tuple(slots), person_states.get(person))].append(person)
+    return [people for people in classes.values() if len(people) > 1]
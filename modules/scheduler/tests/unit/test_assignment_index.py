@@ -0,0 +1,63 @@
+from ortools.sat.python import cp_model
+
+from modules.scheduler.assignment_index import AssignmentIndex
+
+
+def build_model():
+    model = cp_model.CpModel()
+    assignments = {
+        (person, slot): model.NewBoolVar(f"assign_{person}_{slot}")
+        for slot in range(3)
+        for person in range(2)
+    }
+    for slot in range(3):
+        model.AddExactlyOne(assignments[(person, slot)] for person in range(2))
+    return model, assignments
+
+
+class TestAssignmentIndex:
+    def test_maps_assigned_slots_to_people(self):
+        model, assignments = build_model()
+        model.Add(assignments[(1, 0)] == 1)
+        model.Add(assignments[(0, 1)] == 1)
+        model.Add(assignments[(1, 2)] == 1)
+        solver = cp_model.CpSolver()
+        assert solver.Solve(model) == cp_model.OPTIMAL
+
+        index = AssignmentIndex(assignments)
+
+        assert len(index) == 6
+        assert index.slot_people(solver.response_proto.solution) == {0: 1, 1: 0, 2: 1}
+
+    def test_ignores_variables_created_after_assignments(self):
+        model, assignments = build_model()
+        extra = model.NewIntVar(0, 10, "extra")
+        model.Add(extra == 7)
+        model.Add(assignments[(0, 0)] == 1)
+        solver = cp_model.CpSolver()
+        assert solver.Solve(model) == cp_model.OPTIMAL
+
+        slot_people = AssignmentIndex(assignments).slot_people(
+            solver.response_proto.solution
+        )
+
+        assert slot_people[0] == 0
+        assert len(slot_people) == 3
+
+    def test_reads_fixed_assignments(self):
+        model = cp_model.CpModel()
+        assignments = {(0, 0): model.NewConstant(1), (1, 1): model.NewBoolVar("")}
+        solver = cp_model.CpSolver()
+        assert solver.Solve(model) == cp_model.OPTIMAL
+
+        slot_people = AssignmentIndex(assignments).slot_people(
+            solver.response_proto.solution
+        )
+
+        assert slot_people[0] == 0
+
+    def test_empty_assignments(self):
+        index = AssignmentIndex({})
+
+        assert len(index) == 0
+        assert index.slot_people([]) == {}
@@ -0,0 +1,90 @@
+from modules.scheduler.availability_index import AvailabilityIndex
+
+PERSON = 0
+DAY = 0
+
+
+def minutes(hour: int) -> int:
+    return hour * 60
+
+
+class TestAvailabilityIndex:
+    def test_covers_slot_inside_interval(self):
+        index = AvailabilityIndex([(PERSON, DAY, minutes(9), minutes(17))])
+
+        assert index.covers(PERSON, DAY, minutes(9), minutes(17))
+        assert index.covers(PERSON, DAY, minutes(10), minutes(12))
+
+    def test_does_not_cover_slot_outside_interval(self):
+        index = AvailabilityIndex([(PERSON, DAY, minutes(9), minutes(17))])
+
+        assert not index.covers(PERSON, DAY, minutes(8), minutes(10))
+        assert not index.covers(PERSON, DAY, minutes(16), minutes(18))
+        assert not index.covers(PERSON, DAY, minutes(18), minutes(19))
+
+    def test_does_not_cover_other_person_or_date(self):
+        index = AvailabilityIndex([(PERSON, DAY, minutes(9), minutes(17))])
+
+        assert not index.covers(PERSON + 1, DAY, minutes(9), minutes(17))
+        assert not index.covers(PERSON, DAY + 1, minutes(9), minutes(17))
+
+    def test_merges_overlapping_and_adjacent_intervals(self):
+        index = AvailabilityIndex(
+            [
+                (PERSON, DAY, minutes(12), minutes(15)),
+                (PERSON, DAY, minutes(9), minutes(12)),
+                (PERSON, DAY, minutes(14), minutes(17)),
+                (PERSON, DAY, minutes(19), minutes(21)),
+            ]
+        )
+
+        assert index.intervals(PERSON, DAY) == [
+            (minutes(9), minutes(17)),
+            (minutes(19), minutes(21)),
+        ]
+        assert index.covers(PERSON, DAY, minutes(10), minutes(16))
+
+    def test_does_not_cover_slot_spanning_a_gap(self):
+        index = AvailabilityIndex(
+            [
+                (PERSON, DAY, minutes(9), minutes(12)),
+                (PERSON, DAY, minutes(13), minutes(17)),
+            ]
+        )
+
+        assert not index.covers(PERSON, DAY, minutes(11), minutes(14))
+        assert index.covers(PERSON, DAY, minutes(13), minutes(17))
+
+    def test_lists_people_available_on_a_day(self):
+        index = AvailabilityIndex(
+            [
+                (2, DAY, minutes(9), minutes(12)),
+                (PERSON, DAY, minutes(13), minutes(17)),
+                (1, DAY + 1, minutes(9), minutes(17)),
+            ]
+        )
+
+        assert index.people_on(DAY) == [PERSON, 2]
+        assert index.people_on(DAY + 2) == []
+
+    def test_lists_people_covering_a_slot(self):
+        index = AvailabilityIndex(
+            [
+                (2, DAY, minutes(9), minutes(17)),
+                (PERSON, DAY, minutes(9), minutes(12)),
+                (PERSON, DAY, minutes(12), minutes(15)),
+                (1, DAY, minutes(13), minutes(17)),
+                (3, DAY + 1, minutes(9), minutes(17)),
+            ]
+        )
+
+        assert index.people_covering(DAY, minutes(10), minutes(14)) == [PERSON, 2]
+        assert index.people_covering(DAY, minutes(14), minutes(16)) == [1, 2]
+        assert index.people_covering(DAY + 2, minutes(9), minutes(10)) == []
+
+    def test_empty_index(self):
+        index = AvailabilityIndex([])
+
+        assert len(index) == 0
+        assert not index.covers(PERSON, DAY, minutes(9), minutes(17))
+        assert index.intervals(PERSON, DAY) == []
@@ -0,0 +1,181 @@
+from datetime import date, time
+from uuid import uuid4
+
+import pytest
+
+from modules.scheduler.case_export import find_cases, load_case, load_model
+from modules.scheduler.greedy_scheduler import GreedyScheduler
+from modules.scheduler.interfaces import Assignment
+from modules.scheduler.models import (
+    AvailabilityHours,
+    BusinessServiceHours,
+    SolverParameters,
+)
+from modules.scheduler.neighborhood import ChangeSet
+from modules.scheduler.or_tools_scheduler import ORToolsScheduler
+from modules.scheduler.replay import replay_inputs, replay_models
+
+
+@pytest.fixture
+def inputs():
+    role_id = uuid4()
+    people = [uuid4(), uuid4()]
+    availability_hours = [
+        AvailabilityHours(
+            id=uuid4(),
+            person_id=person_id,
+            role_id=role_id,
+            day_of_week=0,
+            start_time=time(9, 0),
+            end_time=time(17, 0),
+            start_date=date(2024, 1, 1),
+            is_recurring=True,
+        )
+        for person_id in people
+    ]
+    business_service_hours = [
+        BusinessServiceHours(
+            id=uuid4(),
+            role_id=role_id,
+            day_of_week=0,
+            start_time=start,
+            end_time=end,
+            is_recurring=True,
+        )
+        for start, end in [(time(9, 0), time(13, 0)), (time(11, 0), time(15, 0))]
+    ]
+    hints = [
+        Assignment(
+            person_id=people[0],
+            date=date(2024, 1, 1),
+            start_time=time(9, 0),
+            end_time=time(13, 0),
+            role_id=role_id,
+        )
+    ]
+    return availability_hours, business_service_hours, hints
+
+
+class TestCaseExport:
+    def test_solve_exports_inputs_and_models(self, tmp_path, inputs):
+        availability_hours, business_service_hours, hints = inputs
+        scheduler = ORToolsScheduler(
+            overlap_formulation="intervals", export_dir=str(tmp_path)
+        )
+
+        result = scheduler.solve(
+            availability_hours,
+            business_service_hours,
+            [1],
+            2024,
+            "balance_workload",
+            SolverParameters(max_time_in_seconds=5.0),
+            hints,
+        )
+
+        [case_dir] = find_cases([tmp_path])
+        assert result.stats.export_dir == str(case_dir)
+        case = load_case(case_dir)
+        assert case.availability_hours == availability_hours
+        assert case.business_service_hours == business_service_hours
+        assert case.hints == hints
+        assert (case.weeks, case.year, case.strategy) == ([1], 2024, "balance_workload")
+        assert case.solver_parameters == SolverParameters(max_time_in_seconds=5.0)
+        assert case.scheduler == "ORToolsScheduler"
+        assert case.scheduler_options["overlap_formulation"] == "intervals"
+        assert [str(path) for path in case.model_files] == [
+            run.model_file for run in result.stats.solver_runs
+        ]
+
+    def test_exported_model_round_trips(self, tmp_path, inputs):
+        availability_hours, business_service_hours, _ = inputs
+        result = ORToolsScheduler(export_dir=str(tmp_path)).solve(
+            availability_hours, business_service_hours, [1], 2024, "balance_workload"
+        )
+        case = load_case(find_cases([tmp_path])[0])
+
+        model = load_model(case.model_files[0])
+
+        assert len(model.Proto().variables) == result.stats.num_variables
+        assert len(model.Proto().constraints) == result.stats.num_constraints
+
+    def test_reoptimize_exports_inputs_and_models(self, tmp_path, inputs):
+        availability_hours, business_service_hours, hints = inputs
+
+        result = ORToolsScheduler(export_dir=str(tmp_path)).reoptimize(
+            availability_hours,
+            business_service_hours,
+            [1],
+            2024,
+            "balance_workload",
+            hints,
+            ChangeSet(person_ids={hints[0].person_id}),
+        )
+
+        [case_dir] = find_cases([tmp_path])
+        assert result.stats.export_dir == str(case_dir)
+        case = load_case(case_dir)
+        assert case.hints == hints
+        assert [str(path) for path in case.model_files] == [
+            run.model_file for run in result.stats.solver_runs
+        ]
+
+    def test_compare_exports_a_case_per_strategy(self, tmp_path, inputs):
+        availability_hours, business_service_hours, _ = inputs
+        strategies = ["minimize_gaps", "balance_workload"]
+
+        results = ORToolsScheduler(export_dir=str(tmp_path)).compare(
+            availability_hours, business_service_hours, [1], 2024, strategies
+        )
+
+        for strategy in strategies:
+            case = load_case(results[strategy].stats.export_dir)
+            assert case.strategy == strategy
+            assert [str(path) for path in case.model_files] == [
+                run.model_file for run in results[strategy].stats.solver_runs
+            ]
+        assert len(find_cases([tmp_path])) == 2
+
+    def test_without_export_dir_nothing_is_written(self, tmp_path, inputs):
+        availability_hours, business_service_hours, _ = inputs
+
+        result = ORToolsScheduler().solve(
+            availability_hours, business_service_hours, [1], 2024, "balance_workload"
+        )
+
+        assert result.stats.export_dir is None
+        assert result.stats.solver_runs[0].model_file is None
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestReplay:
+    def test_replays_models_and_inputs(self, tmp_path, inputs):
+        availability_hours, business_service_hours, _ = inputs
+        original = ORToolsScheduler(export_dir=str(tmp_path)).solve(
+            availability_hours, business_service_hours, [1], 2024, "balance_workload"
+        )
+        case = load_case(find_cases([tmp_path])[0])
+
+        runs = replay_models(case, SolverParameters(num_search_workers=1))
+        replayed = replay_inputs(
+            case, "ORToolsScheduler", case.scheduler_options, case.solver_parameters
+        )
+
+        assert [run["status"] for run in runs] == ["OPTIMAL"]
+        assert runs[0]["objective_value"] == original.stats.solver_runs[0].objective_value
+        assert replayed["assignments"] == len(original.assignments)
+        assert list(tmp_path.iterdir()) == [case.path]
+
+    def test_replays_with_another_scheduler(self, tmp_path, inputs):
+        availability_hours, business_service_hours, _ = inputs
+        GreedyScheduler(export_dir=str(tmp_path)).solve(
+            availability_hours, business_service_hours, [1], 2024, "balance_workload"
+        )
+        case = load_case(find_cases([tmp_path])[0])
+
+        replayed = replay_inputs(case, "ORToolsScheduler", {}, case.solver_parameters)
+
+        assert case.scheduler == "GreedyScheduler"
+        assert case.model_files == []
+        assert replayed["assignments"] == 2
+        assert replayed["solver_runs"][0]["status"] == "OPTIMAL"
@@ -0,0 +1,111 @@
+from modules.scheduler.coverage_flow import (
+    find_overlap_components,
+    is_clique,
+    match_slots_to_people,
+    schedule_identical_people,
+    solve_coverage_flows,
+)
+
+
+def assert_no_overlap(slot_people, starts, ends):
+    by_person = {}
+    for slot, person in slot_people.items():
+        by_person.setdefault(person, []).append((starts[slot], ends[slot]))
+    for intervals in by_person.values():
+        intervals.sort()
+        for (_, end), (start, _) in zip(intervals, intervals[1:]):
+            assert end <= start
+
+
+class TestFindOverlapComponents:
+    def test_touching_slots_are_separate_components(self):
+        starts, ends = [0, 60, 120], [60, 120, 180]
+
+        components = find_overlap_components([0, 1, 2], starts, ends)
+
+        assert components == [[0], [1], [2]]
+
+    def test_chained_overlaps_form_one_component(self):
+        starts, ends = [0, 30, 90, 200], [60, 100, 150, 260]
+
+        components = find_overlap_components([3, 2, 1, 0], starts, ends)
+
+        assert components == [[0, 1, 2], [3]]
+
+    def test_clique_requires_a_common_instant(self):
+        starts, ends = [0, 30, 90], [60, 100, 150]
+
+        assert is_clique([0, 1], starts, ends)
+        assert not is_clique([0, 1, 2], starts, ends)
+
+
+class TestMatchSlotsToPeople:
+    def test_finds_a_perfect_matching(self):
+        slot_candidates = {0: [0, 1], 1: [0]}
+
+        slot_people = match_slots_to_people([0, 1], slot_candidates, set())
+
+        assert slot_people == {0: 1, 1: 0}
+
+    def test_leaves_unmatchable_slots_uncovered(self):
+        slot_candidates = {0: [0], 1: [0], 2: [0, 1]}
+
+        slot_people = match_slots_to_people([0, 1, 2], slot_candidates, set())
+
+        assert len(slot_people) == 2
+        assert sorted(slot_people.values()) == [0, 1]
+
+    def test_prefers_hinted_pairs(self):
+        slot_candidates = {0: [0, 1], 1: [0, 1]}
+
+        slot_people = match_slots_to_people([0, 1], slot_candidates, {(0, 1)})
+
+        assert slot_people == {0: 1, 1: 0}
+
+
+class TestScheduleIdenticalPeople:
+    def test_covers_as_many_slots_as_capacity_allows(self):
+        starts = [0, 30, 60, 90, 120]
+        ends = [120, 90, 150, 180, 200]
+
+        slot_people = schedule_identical_people(
+            [0, 1, 2, 3, 4], [7, 8], starts, ends, set()
+        )
+
+        assert len(slot_people) == 4
+        assert set(slot_people.values()) <= {7, 8}
+        assert_no_overlap(slot_people, starts, ends)
+
+    def test_covers_every_slot_when_depth_fits(self):
+        starts, ends = [0, 30, 60, 90], [60, 90, 120, 150]
+
+        slot_people = schedule_identical_people(
+            [0, 1, 2, 3], [3, 4], starts, ends, set()
+        )
+
+        assert len(slot_people) == 4
+        assert_no_overlap(slot_people, starts, ends)
+
+
+class TestSolveCoverageFlows:
+    def test_balances_isolated_slots(self):
+        slot_candidates = {0: [0, 1], 1: [0, 1], 2: [0, 1], 3: [0, 1]}
+        starts, ends = [0, 60, 120, 180], [60, 120, 180, 240]
+
+        slot_people, remaining = solve_coverage_flows(
+            slot_candidates, starts, ends, set()
+        )
+
+        assert remaining == {}
+        assert sorted(slot_people.values()) == [0, 0, 1, 1]
+
+    def test_defers_mixed_chains_to_the_solver(self):
+        slot_candidates = {0: [0, 1], 1: [1], 2: [0, 1]}
+        starts, ends = [0, 30, 90], [60, 100, 150]
+
+        slot_people, remaining = solve_coverage_flows(
+            slot_candidates, starts, ends, set()
+        )
+
+        assert slot_people == {}
+        assert remaining == slot_candidates
@@ -0,0 +1,76 @@
+from modules.scheduler.decomposition import (
+    find_independent_components,
+    partition_components,
+)
+
+
+class TestFindIndependentComponents:
+    def test_each_date_is_independent(self):
+        slot_candidates = {0: [0], 1: [0]}
+
+        components = find_independent_components(
+            slot_candidates, [540, 1980], [1020, 2460]
+        )
+
+        assert len(components) == 2
+
+    def test_shared_person_on_overlapping_slots_links_slots(self):
+        slot_candidates = {0: [0], 1: [0, 1], 2: [1]}
+
+        components = find_independent_components(
+            slot_candidates, [540, 720, 900], [780, 960, 1020]
+        )
+
+        assert components == [slot_candidates]
+
+    def test_shared_person_on_disjoint_slots_is_independent(self):
+        slot_candidates = {0: [0], 1: [0]}
+
+        components = find_independent_components(
+            slot_candidates, [540, 780], [720, 1020]
+        )
+
+        assert len(components) == 2
+
+    def test_overnight_slot_links_the_next_morning(self):
+        slot_candidates = {0: [0], 1: [0]}
+
+        components = find_independent_components(
+            slot_candidates, [1320, 1560], [1800, 1680]
+        )
+
+        assert components == [slot_candidates]
+
+    def test_disjoint_people_on_same_date_are_independent(self):
+        slot_candidates = {0: [0], 1: [1]}
+
+        components = find_independent_components(
+            slot_candidates, [540, 540], [1020, 1020]
+        )
+
+        assert len(components) == 2
+
+    def test_slot_without_candidates_is_its_own_component(self):
+        slot_candidates = {0: [0], 1: []}
+
+        components = find_independent_components(
+            slot_candidates, [540, 540], [1020, 1020]
+        )
+
+        assert len(components) == 2
+
+
+class TestPartitionComponents:
+    def test_balances_components_across_parts(self):
+        components = [{day: [0, 1]} for day in range(4)]
+
+        parts = partition_components(components, 2)
+
+        assert [len(part) for part in parts] == [2, 2]
+
+    def test_never_creates_more_parts_than_components(self):
+        components = [{0: [0]}]
+
+        parts = partition_components(components, 8)
+
+        assert parts == [components]
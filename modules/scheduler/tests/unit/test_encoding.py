@@ -0,0 +1,80 @@
+from datetime import date, time
+from uuid import UUID, uuid4
+
+import pytest
+
+from modules.scheduler.encoding import EncodedProblem, minutes_to_time
+
+
+@pytest.fixture
+def person1_id() -> UUID:
+    return uuid4()
+
+
+@pytest.fixture
+def person2_id() -> UUID:
+    return uuid4()
+
+
+@pytest.fixture
+def time_slots():
+    return [
+        (date(2024, 1, 1), time(9, 0), time(17, 0)),
+        (date(2024, 1, 1), time(22, 0), time(6, 0)),
+        (date(2024, 1, 3), time(8, 30), time(12, 0)),
+    ]
+
+
+class TestMinutesToTime:
+    def test_wraps_past_midnight(self):
+        assert minutes_to_time(9 * 60 + 30) == time(9, 30)
+        assert minutes_to_time(24 * 60 + 6 * 60) == time(6, 0)
+
+
+class TestEncodedProblem:
+    def test_encodes_slots_relative_to_first_date(self, person1_id, time_slots):
+        problem = EncodedProblem.from_slots({person1_id}, time_slots)
+
+        assert problem.start_date == date(2024, 1, 1)
+        assert problem.slot_bounds == [
+            (0, 540, 1020),
+            (0, 1320, 1800),
+            (2, 510, 720),
+        ]
+        assert problem.slot_hours == [8, 8, 3]
+
+    def test_decodes_slots_back_to_dates_and_times(self, person1_id, time_slots):
+        problem = EncodedProblem.from_slots({person1_id}, time_slots)
+
+        assert [problem.decode_slot(slot) for slot in range(3)] == time_slots
+
+    def test_people_are_sorted_dense_indices(self, person1_id, person2_id, time_slots):
+        problem = EncodedProblem.from_slots({person2_id, person1_id}, time_slots)
+
+        assert problem.person_ids == sorted([person1_id, person2_id])
+        assert problem.person_index() == {
+            person_id: index for index, person_id in enumerate(problem.person_ids)
+        }
+
+    def test_absolute_minutes_span_days(self, person1_id, time_slots):
+        problem = EncodedProblem.from_slots({person1_id}, time_slots)
+
+        assert problem.absolute_starts == [540, 1320, 2 * 1440 + 510]
+        assert problem.absolute_ends == [1020, 1800, 2 * 1440 + 720]
+
+    def test_variable_names_include_person_and_slot(self, person1_id, time_slots):
+        problem = EncodedProblem.from_slots({person1_id}, time_slots)
+
+        assert problem.variable_name("assign", 0, 1) == (
+            f"assign_{person1_id}_2024-01-01_22:00:00_06:00:00"
+        )
+        assert problem.variable_name("gap", 0, suffix="boundary") == (
+            f"gap_{person1_id}_boundary"
+        )
+
+    def test_disabled_variable_names_skip_slot_labels(self, person1_id, time_slots):
+        problem = EncodedProblem.from_slots({person1_id}, time_slots)
+        problem.variable_names = False
+
+        assert problem.variable_name("assign", 0, 1) == ""
+        assert "slot_labels" not in problem.__dict__
@@ -0,0 +1,189 @@
+from datetime import date, time, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+
+from modules.scheduler.expansion import (
+    expand_availability_hours,
+    expand_business_hours,
+    expand_rules,
+)
+from modules.scheduler.models import AvailabilityHours, BusinessServiceHours
+
+
+@pytest.fixture
+def role_id() -> UUID:
+    return uuid4()
+
+
+@pytest.fixture
+def person1_id() -> UUID:
+    return uuid4()
+
+
+@pytest.fixture
+def person2_id() -> UUID:
+    return uuid4()
+
+
+@pytest.fixture
+def date_range():
+    return [date(2024, 1, 1) + timedelta(days=offset) for offset in range(14)]
+
+
+def business_hours(role_id: UUID, **kwargs) -> BusinessServiceHours:
+    values = {
+        "id": uuid4(),
+        "role_id": role_id,
+        "day_of_week": None,
+        "start_time": time(9, 0),
+        "end_time": time(17, 0),
+    }
+    values.update(kwargs)
+    return BusinessServiceHours(**values)
+
+
+class TestExpandRules:
+    def test_recurring_rule_matches_its_weekday(self, role_id, date_range):
+        rules = [business_hours(role_id, day_of_week=2)]
+
+        rule_indices, days = expand_rules(rules, date_range)
+
+        assert rule_indices.tolist() == [0, 0]
+        assert days.tolist() == [2, 9]
+
+    def test_recurring_rule_respects_start_and_end_dates(self, role_id, date_range):
+        rules = [
+            business_hours(role_id, day_of_week=0, start_date=date(2024, 1, 2)),
+            business_hours(role_id, day_of_week=1, end_date=date(2024, 1, 8)),
+        ]
+
+        rule_indices, days = expand_rules(rules, date_range)
+
+        assert sorted(zip(rule_indices.tolist(), days.tolist())) == [(0, 7), (1, 1)]
+
+    def test_specific_date_wins_over_recurrence(self, role_id, date_range):
+        rules = [
+            business_hours(role_id, day_of_week=0, specific_date=date(2024, 1, 5))
+        ]
+
+        _, days = expand_rules(rules, date_range)
+
+        assert days.tolist() == [4]
+
+    def test_non_recurring_rule_covers_its_date_range(self, role_id, date_range):
+        rules = [
+            business_hours(
+                role_id,
+                is_recurring=False,
+                start_date=date(2024, 1, 3),
+                end_date=date(2024, 1, 5),
+            )
+        ]
+
+        _, days = expand_rules(rules, date_range)
+
+        assert days.tolist() == [2, 3, 4]
+
+    def test_rule_without_dates_or_weekday_never_matches(self, role_id, date_range):
+        rules = [business_hours(role_id, is_recurring=False)]
+
+        rule_indices, _ = expand_rules(rules, date_range)
+
+        assert rule_indices.size == 0
+
+    def test_days_are_relative_to_earliest_date(self, role_id):
+        date_range = [date(2024, 1, 8), date(2024, 1, 1)]
+        rules = [business_hours(role_id, day_of_week=0)]
+
+        _, days = expand_rules(rules, date_range)
+
+        assert sorted(days.tolist()) == [0, 7]
+
+
+class TestExpandBusinessHours:
+    def test_returns_unique_sorted_slot_rows(self, role_id, date_range):
+        rules = [
+            business_hours(role_id, day_of_week=1, start_time=time(13, 0)),
+            business_hours(role_id, day_of_week=0, end_time=time(12, 0)),
+            business_hours(
+                role_id, specific_date=date(2024, 1, 1), end_time=time(12, 0)
+            ),
+        ]
+
+        slots = expand_business_hours(rules, date_range)
+
+        assert slots.tolist() == [
+            [0, 540, 720],
+            [1, 780, 1020],
+            [7, 540, 720],
+            [8, 780, 1020],
+        ]
+
+    def test_overnight_slot_end_wraps_past_midnight(self, role_id, date_range):
+        rules = [
+            business_hours(
+                role_id,
+                specific_date=date(2024, 1, 1),
+                start_time=time(22, 0),
+                end_time=time(6, 0),
+            )
+        ]
+
+        assert expand_business_hours(rules, date_range).tolist() == [[0, 1320, 1800]]
+
+    def test_empty_rules(self, date_range):
+        assert expand_business_hours([], date_range).shape == (0, 3)
+
+    def test_rules_outside_the_date_range(self, role_id, date_range):
+        rules = [business_hours(role_id, day_of_week=0, end_date=date(2023, 12, 1))]
+
+        assert expand_business_hours(rules, date_range).shape == (0, 3)
+
+
+class TestExpandAvailabilityHours:
+    def test_rows_carry_person_index(
+        self, role_id, person1_id, person2_id, date_range
+    ):
+        person_ids = sorted([person1_id, person2_id])
+        rules = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person_id,
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+            )
+            for person_id in person_ids
+        ]
+
+        slots = expand_availability_hours(rules, person_ids, date_range)
+
+        assert slots.tolist() == [
+            [0, 0, 540, 1020],
+            [0, 7, 540, 1020],
+            [1, 0, 540, 1020],
+            [1, 7, 540, 1020],
+        ]
+
+    def test_empty_rules(self, person1_id, date_range):
+        assert expand_availability_hours([], [person1_id], date_range).shape == (0, 4)
+
+    def test_rules_outside_the_date_range(self, role_id, person1_id, date_range):
+        rules = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person1_id,
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+                end_date=date(2023, 12, 1),
+            )
+        ]
+
+        slots = expand_availability_hours(rules, [person1_id], date_range)
+
+        assert slots.shape == (0, 4)
@@ -0,0 +1,101 @@
+from datetime import date, time
+from uuid import uuid4
+
+import pytest
+
+from modules.scheduler.encoding import EncodedProblem
+from modules.scheduler.greedy import GreedyAssigner
+
+
+@pytest.fixture
+def person_ids():
+    return sorted(uuid4() for _ in range(3))
+
+
+def encode(person_ids, slots):
+    return EncodedProblem.from_slots(
+        person_ids,
+        [(date(2024, 1, 1), time(start), time(end)) for start, end in slots],
+    )
+
+
+class TestGreedyAssigner:
+    def test_assigns_every_slot_without_overlap(self, person_ids):
+        problem = encode(person_ids, [(9, 13), (11, 15), (13, 17)])
+        slot_candidates = {0: [0, 1], 1: [0, 1], 2: [0, 1]}
+
+        slot_people = GreedyAssigner(
+            problem, slot_candidates, "maximize_coverage"
+        ).assign()
+
+        assert sorted(slot_people) == [0, 1, 2]
+        assert slot_people[0] != slot_people[1]
+        assert slot_people[1] != slot_people[2]
+
+    def test_most_constrained_slot_is_filled_first(self, person_ids):
+        problem = encode(person_ids, [(9, 13), (11, 15)])
+        slot_candidates = {0: [0, 1], 1: [0]}
+
+        slot_people = GreedyAssigner(
+            problem, slot_candidates, "maximize_coverage"
+        ).assign()
+
+        assert slot_people == {1: 0, 0: 1}
+
+    def test_repair_moves_blocking_assignment(self, person_ids):
+        problem = encode(person_ids, [(9, 13), (11, 15)])
+        slot_candidates = {0: [0, 1], 1: [0]}
+        assigner = GreedyAssigner(problem, slot_candidates, "maximize_coverage")
+        assigner._place(0, 0)
+
+        assigner._repair(1)
+
+        assert assigner.slot_people == {0: 1, 1: 0}
+
+    def test_leaves_slot_unassigned_when_nobody_is_free(self, person_ids):
+        problem = encode(person_ids, [(9, 13), (11, 15)])
+        slot_candidates = {0: [0], 1: [0]}
+
+        slot_people = GreedyAssigner(
+            problem, slot_candidates, "maximize_coverage"
+        ).assign()
+
+        assert len(slot_people) == 1
+
+    def test_balance_workload_prefers_least_loaded_person(self, person_ids):
+        problem = encode(person_ids, [(9, 11), (11, 13), (13, 15), (15, 17)])
+        slot_candidates = {slot: [0, 1] for slot in range(4)}
+
+        slot_people = GreedyAssigner(
+            problem, slot_candidates, "balance_workload"
+        ).assign()
+
+        assert sorted(slot_people.values()) == [0, 0, 1, 1]
+
+    def test_balance_workload_counts_accumulated_hours(self, person_ids):
+        problem = encode(person_ids, [(9, 11)])
+        slot_candidates = {0: [0, 1]}
+
+        slot_people = GreedyAssigner(
+            problem, slot_candidates, "balance_workload", {0: 8}
+        ).assign()
+
+        assert slot_people == {0: 1}
+
+    def test_minimize_gaps_prefers_adjacent_assignment(self, person_ids):
+        problem = encode(person_ids, [(9, 11), (11, 13), (15, 17)])
+        slot_candidates = {0: [0], 1: [0, 1], 2: [1]}
+
+        slot_people = GreedyAssigner(problem, slot_candidates, "minimize_gaps").assign()
+
+        assert slot_people[1] == 0
+
+    def test_keeps_feasible_hints(self, person_ids):
+        problem = encode(person_ids, [(9, 13), (11, 15)])
+        slot_candidates = {0: [0, 1], 1: [0, 1]}
+
+        slot_people = GreedyAssigner(
+            problem, slot_candidates, "maximize_coverage"
+        ).assign({(1, 0), (1, 1)})
+
+        assert slot_people == {0: 1, 1: 0}
@@ -0,0 +1,120 @@
+from datetime import time
+from uuid import UUID, uuid4
+
+import pytest
+
+from modules.scheduler.base_scheduler import BaseScheduler
+from modules.scheduler.greedy_scheduler import GreedyScheduler
+from modules.scheduler.models import AvailabilityHours, BusinessServiceHours
+from modules.scheduler.or_tools_scheduler import ORToolsScheduler
+from modules.scheduler.overlap import interval_minutes
+
+
+@pytest.fixture
+def scheduler():
+    return GreedyScheduler()
+
+
+@pytest.fixture
+def role_id() -> UUID:
+    return uuid4()
+
+
+def availability(person_id: UUID, role_id: UUID, day: int, start: int, end: int):
+    return AvailabilityHours(
+        id=uuid4(),
+        person_id=person_id,
+        role_id=role_id,
+        day_of_week=day,
+        start_time=time(start, 0),
+        end_time=time(end, 0),
+        is_recurring=True,
+    )
+
+
+def business_hours(role_id: UUID, day: int, start: int, end: int):
+    return BusinessServiceHours(
+        id=uuid4(),
+        role_id=role_id,
+        day_of_week=day,
+        start_time=time(start, 0),
+        end_time=time(end, 0),
+        is_recurring=True,
+    )
+
+
+class TestGreedyScheduler:
+    def test_assignments_respect_availability_and_no_overlap(self, scheduler, role_id):
+        people = [uuid4() for _ in range(4)]
+        availability_hours = [
+            availability(person_id, role_id, day, 8, 20)
+            for person_id in people
+            for day in range(5)
+        ]
+        business_service_hours = [
+            business_hours(role_id, day, start, start + 4)
+            for day in range(5)
+            for start in [8, 10, 12, 14, 16]
+        ]
+
+        result = scheduler.solve(
+            availability_hours, business_service_hours, [1], 2024, "balance_workload"
+        )
+
+        assert len(result.assignments) == 25
+        assert result.uncoverable_slots == []
+        by_person = {}
+        for a in result.assignments:
+            by_person.setdefault((a.person_id, a.date), []).append(
+                interval_minutes(a.start_time, a.end_time)
+            )
+        for intervals in by_person.values():
+            intervals.sort()
+            for (_, end), (start, _) in zip(intervals, intervals[1:]):
+                assert end <= start
+
+    def test_reports_slots_nobody_can_cover(self, scheduler, role_id):
+        person_id = uuid4()
+        availability_hours = [availability(person_id, role_id, 0, 9, 17)]
+        business_service_hours = [
+            business_hours(role_id, 0, 9, 13),
+            business_hours(role_id, 0, 11, 15),
+            business_hours(role_id, 1, 9, 17),
+        ]
+
+        result = scheduler.solve(
+            availability_hours, business_service_hours, [1], 2024, "maximize_coverage"
+        )
+
+        assert len(result.assignments) == 1
+        assert len(result.uncoverable_slots) == 2
+
+    def test_optimize_with_empty_inputs(self, scheduler):
+        assert scheduler.optimize([], [], [1], 2024, "maximize_coverage") == []
+
+    def test_compare_assigns_greedily_for_every_strategy(self, scheduler, role_id):
+        people = [uuid4() for _ in range(2)]
+        availability_hours = [
+            availability(person_id, role_id, 0, 8, 16) for person_id in people
+        ]
+        business_service_hours = [
+            business_hours(role_id, 0, start, start + 4) for start in [8, 10, 12]
+        ]
+        strategies = ["maximize_coverage", "minimize_gaps", "balance_workload"]
+
+        results = scheduler.compare(
+            availability_hours, business_service_hours, [1], 2024, strategies
+        )
+
+        assert list(results) == strategies
+        for strategy, result in results.items():
+            assert result.stats.solver_runs == []
+            assert result.assignments == scheduler.solve(
+                availability_hours, business_service_hours, [1], 2024, strategy
+            ).assignments
+
+    def test_shares_the_pipeline_without_cp_sat_options(self):
+        assert isinstance(GreedyScheduler(), BaseScheduler)
+        assert not isinstance(GreedyScheduler(), ORToolsScheduler)
+        with pytest.raises(TypeError):
+            GreedyScheduler(coverage_flows=False)
@@ -0,0 +1,83 @@
+from modules.scheduler.neighborhood import (
+    build_neighborhood,
+    find_changed_slots,
+    freeze_assignments,
+)
+
+STARTS = [540, 660, 1980, 2100]
+ENDS = [720, 840, 2160, 2280]
+SLOT_CANDIDATES = {0: [0, 1], 1: [0, 1], 2: [0, 1], 3: [1]}
+DAY_ONE_SLOTS = {2, 3}
+
+
+class TestFindChangedSlots:
+    def test_finds_slots_on_changed_days(self):
+        assert find_changed_slots(STARTS, ENDS, {1}) == DAY_ONE_SLOTS
+
+    def test_includes_overnight_slots_reaching_into_a_changed_day(self):
+        assert find_changed_slots([1380, 1500], [1500, 1560], {1}) == {0, 1}
+
+
+class TestFreezeAssignments:
+    def test_keeps_assignments_outside_the_change_set(self):
+        current_pairs = {(0, 0), (1, 1), (0, 2), (1, 3)}
+
+        frozen = freeze_assignments(current_pairs, SLOT_CANDIDATES, {1}, None)
+
+        assert frozen == {0: 0, 2: 0}
+
+    def test_releases_changed_days(self):
+        current_pairs = {(0, 0), (1, 1), (0, 2), (1, 3)}
+
+        frozen = freeze_assignments(current_pairs, SLOT_CANDIDATES, set(), DAY_ONE_SLOTS)
+
+        assert frozen == {0: 0, 1: 1}
+
+    def test_releases_only_changed_people_on_changed_days(self):
+        current_pairs = {(0, 0), (1, 1), (0, 2), (1, 3)}
+
+        frozen = freeze_assignments(current_pairs, SLOT_CANDIDATES, {1}, DAY_ONE_SLOTS)
+
+        assert frozen == {0: 0, 1: 1, 2: 0}
+
+    def test_releases_assignments_that_are_no_longer_available(self):
+        frozen = freeze_assignments({(0, 3)}, SLOT_CANDIDATES, set(), None)
+
+        assert frozen == {}
+
+
+class TestBuildNeighborhood:
+    def test_contains_released_slots_and_changed_days(self):
+        neighborhood = build_neighborhood(
+            SLOT_CANDIDATES, {0: 0, 3: 1}, {1}, STARTS, ENDS, set(), DAY_ONE_SLOTS
+        )
+
+        assert sorted(neighborhood) == [1, 2]
+
+    def test_contains_slots_a_changed_person_can_cover(self):
+        neighborhood = build_neighborhood(
+            SLOT_CANDIDATES, {}, set(), STARTS, ENDS, {1}, None
+        )
+
+        assert sorted(neighborhood) == [0, 1, 2, 3]
+
+    def test_limits_changed_people_to_changed_days(self):
+        neighborhood = build_neighborhood(
+            SLOT_CANDIDATES, {0: 0, 2: 0}, set(), STARTS, ENDS, {1}, DAY_ONE_SLOTS
+        )
+
+        assert neighborhood == {3: [1]}
+
+    def test_excludes_candidates_overlapping_frozen_assignments(self):
+        neighborhood = build_neighborhood(
+            SLOT_CANDIDATES, {0: 0}, {1}, STARTS, ENDS, set(), None
+        )
+
+        assert neighborhood == {1: [1]}
+
+    def test_drops_slots_without_free_candidates(self):
+        neighborhood = build_neighborhood(
+            {0: [0], 1: [0]}, {0: 0}, {1}, STARTS, ENDS, set(), None
+        )
+
+        assert neighborhood == {}
@@ -1,10 +1,32 @@
-from datetime import date, time
+import time as timer
+from collections import defaultdict
+from datetime import date, time, timedelta
 from uuid import UUID, uuid4
 
 import pytest
-
-from modules.scheduler.models import AvailabilityHours, BusinessServiceHours
+from ortools.sat.python import cp_model
+
+from modules.scheduler.benchmarks.instances import (
+    generate_instance,
+    generate_sparse_instance,
+    generate_split_shift_instance,
+    generate_synthetic_instance,
+)
+from modules.scheduler.encoding import EncodedProblem
+from modules.scheduler.interfaces import (
+    Assignment,
+    SolveCancelled,
+    UncoverableSlot,
+)
+from modules.scheduler.neighborhood import ChangeSet
+from modules.scheduler.models import (
+    AvailabilityHours,
+    BusinessServiceHours,
+    SolverParameters,
+)
 from modules.scheduler.or_tools_scheduler import ORToolsScheduler
+from modules.scheduler.rolling_horizon import HorizonContext
+from modules.scheduler.stats import SolveStats, SolverRun
 
 
 @pytest.fixture
@@ -913,6 +935,1774 @@ class TestORToolsScheduler:
         time_slots = {(a.date, a.start_time, a.end_time) for a in result}
         assert len(time_slots) == 2
 
+    def test_solve_reports_slot_without_candidates_and_schedules_the_rest(
+        self, scheduler, person1_id, role_id
+    ):
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person1_id,
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=day,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+            for day in [0, 1]
+        ]
+
+        result = scheduler.solve(
+            availability_hours, business_service_hours, [1], 2024, "maximize_coverage"
+        )
+
+        assert [(a.person_id, a.date) for a in result.assignments] == [
+            (person1_id, date(2024, 1, 1))
+        ]
+        assert result.uncoverable_slots == [
+            UncoverableSlot(
+                date=date(2024, 1, 2),
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                role_id=role_id,
+            )
+        ]
+
+    def test_solve_relaxes_coverage_when_model_is_infeasible(
+        self, scheduler, person1_id, role_id
+    ):
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person1_id,
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=0,
+                start_time=start,
+                end_time=end,
+                is_recurring=True,
+            )
+            for start, end in [(time(9, 0), time(13, 0)), (time(11, 0), time(15, 0))]
+        ]
+
+        result = scheduler.solve(
+            availability_hours, business_service_hours, [1], 2024, "minimize_gaps"
+        )
+
+        assert len(result.assignments) == 1
+        assert len(result.uncoverable_slots) == 1
+        covered = result.assignments[0]
+        uncovered = result.uncoverable_slots[0]
+        assert {covered.start_time, uncovered.start_time} == {time(9, 0), time(11, 0)}
+
+    def test_relaxed_coverage_keeps_the_strategy_objective(
+        self, scheduler, person1_id, role_id
+    ):
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person1_id,
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(start, 0),
+                end_time=time(start + 2, 0),
+                is_recurring=True,
+            )
+            for start in [9, 10, 12]
+        ]
+
+        result = scheduler.solve(
+            availability_hours, business_service_hours, [1], 2024, "minimize_gaps"
+        )
+
+        assert [a.start_time for a in result.assignments] == [time(10, 0), time(12, 0)]
+        assert [u.start_time for u in result.uncoverable_slots] == [time(9, 0)]
+        coverage, gaps = result.stats.solver_runs[-2:]
+        assert (coverage.status, coverage.objective_value) == ("OPTIMAL", 2)
+        assert gaps.status == "OPTIMAL"
+
+    def test_optimize_returns_assignments_of_partial_schedule(
+        self, scheduler, person1_id, role_id
+    ):
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person1_id,
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=day,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+            for day in [0, 1]
+        ]
+
+        result = scheduler.optimize(
+            availability_hours, business_service_hours, [1], 2024, "maximize_coverage"
+        )
+
+        assert [a.date for a in result] == [date(2024, 1, 1)]
+
+    def test_build_model_creates_variables_only_for_available_pairs(
+        self, scheduler, person1_id, person2_id, role_id
+    ):
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person1_id,
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            ),
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person2_id,
+                role_id=role_id,
+                day_of_week=1,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            ),
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=day,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+            for day in [0, 1]
+        ]
+        date_range = scheduler._get_date_range_for_weeks([1], 2024)
+        person_ids = sorted([person1_id, person2_id])
+        time_slots = scheduler._create_time_slots(business_service_hours, date_range)
+        availability_slots = scheduler._create_availability_slots(
+            availability_hours, person_ids, date_range
+        )
+        problem, slot_candidates = scheduler._encode_problem(
+            person_ids, date_range, time_slots, availability_slots
+        )
+
+        _, assignments = scheduler._build_model(
+            problem, slot_candidates, "maximize_coverage"
+        )
+
+        assert {
+            (problem.person_ids[person], *problem.decode_slot(slot))
+            for person, slot in assignments
+        } == {
+            (person1_id, date(2024, 1, 1), time(9, 0), time(17, 0)),
+            (person2_id, date(2024, 1, 2), time(9, 0), time(17, 0)),
+        }
+
+    def test_optimize_interval_overlap_formulation_avoids_overlaps(
+        self, person1_id, person2_id, role_id
+    ):
+        scheduler = ORToolsScheduler(overlap_formulation="intervals")
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person_id,
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(8, 0),
+                end_time=time(18, 0),
+                is_recurring=True,
+            )
+            for person_id in [person1_id, person2_id]
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=0,
+                start_time=start,
+                end_time=end,
+                is_recurring=True,
+            )
+            for start, end in [
+                (time(8, 0), time(12, 0)),
+                (time(10, 0), time(14, 0)),
+                (time(12, 0), time(16, 0)),
+                (time(14, 0), time(18, 0)),
+            ]
+        ]
+
+        result = scheduler.optimize(
+            availability_hours, business_service_hours, [1], 2024, "maximize_coverage"
+        )
+
+        assert len(result) == 4
+        for i, assignment1 in enumerate(result):
+            for assignment2 in result[i + 1 :]:
+                if assignment1.person_id == assignment2.person_id:
+                    assert not self._times_overlap(
+                        assignment1.start_time,
+                        assignment1.end_time,
+                        assignment2.start_time,
+                        assignment2.end_time,
+                    )
+
+    @pytest.mark.parametrize("overlap_formulation", ["cliques", "intervals"])
+    def test_overlap_formulations_reject_overlaps_across_midnight(
+        self, person1_id, role_id, overlap_formulation
+    ):
+        scheduler = ORToolsScheduler(
+            overlap_formulation=overlap_formulation,
+            coverage_flows=False,
+            propagate_forced=False,
+        )
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person1_id,
+                role_id=role_id,
+                day_of_week=day_of_week,
+                start_time=start,
+                end_time=end,
+                is_recurring=True,
+            )
+            for day_of_week, start, end in [
+                (0, time(22, 0), time(6, 0)),
+                (1, time(0, 0), time(8, 0)),
+            ]
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=day_of_week,
+                start_time=start,
+                end_time=end,
+                is_recurring=True,
+            )
+            for day_of_week, start, end in [
+                (0, time(22, 0), time(6, 0)),
+                (1, time(2, 0), time(4, 0)),
+            ]
+        ]
+
+        result = scheduler.solve(
+            availability_hours, business_service_hours, [1], 2024, "maximize_coverage"
+        )
+
+        assert len(result.assignments) == 1
+        assert len(result.uncoverable_slots) == 1
+
+    def test_invalid_overlap_formulation_raises(self):
+        with pytest.raises(ValueError):
+            ORToolsScheduler(overlap_formulation="invalid")
+
+    def test_solve_component_falls_back_with_leftover_time_when_search_times_out(
+        self, scheduler, monkeypatch
+    ):
+        budgets = {}
+
+        def time_out_hard_model(*args, soft_coverage, stats, **kwargs):
+            budgets[soft_coverage] = args[4].max_time_in_seconds
+            if soft_coverage:
+                return ["fallback"]
+            timer.sleep(0.3)
+            stats.add_solver_run(
+                SolverRun(
+                    status="UNKNOWN",
+                    num_variables=1,
+                    num_constraints=0,
+                    objective_value=0.0,
+                    best_objective_bound=1.0,
+                    num_conflicts=0,
+                    num_branches=0,
+                    presolve_time=0.0,
+                    search_time=0.3,
+                    wall_time=0.3,
+                )
+            )
+            return []
+
+        monkeypatch.setattr(scheduler, "_solve_model", time_out_hard_model)
+        problem = EncodedProblem.from_slots(
+            {uuid4()}, [(date(2024, 1, 1), time(9, 0), time(17, 0))]
+        )
+
+        assignments = scheduler._solve_component(
+            problem,
+            {0: [0]},
+            "maximize_coverage",
+            [],
+            SolverParameters(max_time_in_seconds=1.0),
+            set(),
+            None,
+        )
+
+        assert assignments == ["fallback"]
+        assert budgets[False] == pytest.approx(0.9)
+        assert budgets[True] == pytest.approx(0.7, abs=0.1)
+
+    def test_solve_components_share_one_deadline(self, scheduler, monkeypatch):
+        budgets = []
+
+        def record_budget(problem, component, strategy, bsh, solver_parameters, *args):
+            budgets.append(solver_parameters.max_time_in_seconds)
+            timer.sleep(0.5)
+            return []
+
+        monkeypatch.setattr(scheduler, "_solve_component", record_budget)
+
+        scheduler._solve_components(
+            None,
+            [{0: [0]}, {1: [1]}, {2: [2]}],
+            "maximize_coverage",
+            [],
+            SolverParameters(max_time_in_seconds=3.0),
+            set(),
+            timer.time() + 3.0,
+        )
+
+        assert budgets == pytest.approx([1.0, 1.25, 2.0], abs=0.1)
+
+    def test_optimize_decomposed_in_process_pool_matches_monolithic(
+        self, person1_id, person2_id, role_id
+    ):
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person_id,
+                role_id=role_id,
+                day_of_week=day,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+            for person_id in [person1_id, person2_id]
+            for day in range(5)
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=day,
+                start_time=start,
+                end_time=end,
+                is_recurring=True,
+            )
+            for day in range(5)
+            for start, end in [(time(9, 0), time(13, 0)), (time(13, 0), time(17, 0))]
+        ]
+
+        parallel_result = ORToolsScheduler(
+            max_workers=2, parallel_min_variables=0, coverage_flows=False
+        ).solve(
+            availability_hours, business_service_hours, [1], 2024, "maximize_coverage"
+        )
+        parallel = parallel_result.assignments
+        monolithic = ORToolsScheduler(decompose=False, coverage_flows=False).optimize(
+            availability_hours, business_service_hours, [1], 2024, "maximize_coverage"
+        )
+
+        assert len(parallel_result.stats.solver_runs) == 10
+        assert len(parallel) == len(monolithic) == 10
+        assert [(a.date, a.start_time, a.end_time) for a in parallel] == sorted(
+            (a.date, a.start_time, a.end_time) for a in monolithic
+        )
+
+    def test_create_solver_applies_solver_parameters(self, scheduler):
+        solver = scheduler._create_solver(
+            SolverParameters(
+                max_time_in_seconds=5.0,
+                num_search_workers=2,
+                relative_gap_limit=0.1,
+                random_seed=7,
+                log_search_progress=True,
+            )
+        )
+
+        assert solver.parameters.max_time_in_seconds == 5.0
+        assert solver.parameters.num_workers == 2
+        assert solver.parameters.relative_gap_limit == pytest.approx(0.1)
+        assert solver.parameters.random_seed == 7
+        assert solver.parameters.log_search_progress
+        assert solver.parameters.log_to_response
+
+    def test_create_solver_leaves_search_log_off_by_default(self, scheduler):
+        solver = scheduler._create_solver(SolverParameters())
+
+        assert not solver.parameters.log_search_progress
+        assert not solver.parameters.log_to_response
+
+    def test_optimize_with_solver_parameters(self, scheduler, person1_id, role_id):
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person1_id,
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+        ]
+
+        result = scheduler.optimize(
+            availability_hours,
+            business_service_hours,
+            [1],
+            2024,
+            "maximize_coverage",
+            SolverParameters(max_time_in_seconds=1.0, num_search_workers=1),
+        )
+
+        assert len(result) == 1
+
+    def test_solve_component_adds_solution_hints(
+        self, scheduler, person1_id, person2_id, role_id
+    ):
+        slot = (date(2024, 1, 1), time(9, 0), time(17, 0))
+        problem = EncodedProblem.from_slots({person1_id, person2_id}, [slot])
+        person2 = problem.person_index()[person2_id]
+        model, assignments = scheduler._build_model(
+            problem, {0: [0, 1]}, "maximize_coverage"
+        )
+
+        hinted_pairs = scheduler._encode_hints(problem, {(person2_id, *slot)})
+        scheduler._add_solution_hints(model, assignments, hinted_pairs)
+
+        hint = model.Proto().solution_hint
+        hinted_values = dict(zip(hint.vars, hint.values))
+        assert hinted_pairs == {(person2, 0)}
+        assert hinted_values == {
+            assignments[(1 - person2, 0)].Index(): 0,
+            assignments[(person2, 0)].Index(): 1,
+        }
+
+    def test_optimize_with_hints_returns_valid_solution(
+        self, scheduler, person1_id, person2_id, role_id
+    ):
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person_id,
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+            for person_id in [person1_id, person2_id]
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+        ]
+        hints = [
+            Assignment(
+                person_id=person2_id,
+                date=date(2024, 1, 1),
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                role_id=role_id,
+            )
+        ]
+
+        result = scheduler.optimize(
+            availability_hours,
+            business_service_hours,
+            [1],
+            2024,
+            "maximize_coverage",
+            hints=hints,
+        )
+
+        assert len(result) == 1
+        assert result[0].person_id in {person1_id, person2_id}
+
+    def test_optimize_rolling_horizon_carries_hours_between_windows(
+        self, person1_id, person2_id, role_id
+    ):
+        scheduler = ORToolsScheduler(rolling_horizon_weeks=1)
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person_id,
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+            for person_id in [person1_id, person2_id]
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+        ]
+
+        result = scheduler.optimize(
+            availability_hours, business_service_hours, [1, 2], 2024, "balance_workload"
+        )
+
+        assert len(result) == 2
+        assert {a.person_id for a in result} == {person1_id, person2_id}
+        assert [a.date for a in result] == [date(2024, 1, 1), date(2024, 1, 8)]
+
+    def test_solve_rolling_horizon_reports_uncoverable_slots_per_window(
+        self, person1_id, role_id
+    ):
+        scheduler = ORToolsScheduler(rolling_horizon_weeks=1)
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person1_id,
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            ),
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=None,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=False,
+                specific_date=date(2024, 1, 9),
+            ),
+        ]
+
+        result = scheduler.solve(
+            availability_hours, business_service_hours, [1, 2], 2024, "minimize_gaps"
+        )
+
+        assert [a.date for a in result.assignments] == [
+            date(2024, 1, 1),
+            date(2024, 1, 8),
+        ]
+        assert [slot.date for slot in result.uncoverable_slots] == [date(2024, 1, 9)]
+
+    def test_solve_publishes_improving_solutions(
+        self, scheduler, person1_id, person2_id, role_id
+    ):
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person_id,
+                role_id=role_id,
+                day_of_week=day,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+            for person_id in [person1_id, person2_id]
+            for day in range(5)
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=day,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+            for day in range(5)
+        ]
+        solutions = []
+
+        result = scheduler.solve(
+            availability_hours,
+            business_service_hours,
+            [1],
+            2024,
+            "balance_workload",
+            on_solution=solutions.append,
+        )
+
+        assert solutions
+        objective_values = [solution.objective_value for solution in solutions]
+        assert objective_values == sorted(objective_values)
+        assert all(
+            solution.best_objective_bound >= solution.objective_value
+            for solution in solutions
+        )
+        assert solutions[-1].assignments == result.assignments
+
+    def test_cancelling_from_a_solution_stops_the_search(self):
+        availability_hours, business_service_hours = generate_split_shift_instance(
+            20, 12
+        )
+        solutions = []
+
+        def cancel(solution):
+            solutions.append(solution)
+            raise SolveCancelled()
+
+        with pytest.raises(SolveCancelled):
+            ORToolsScheduler().solve(
+                availability_hours,
+                business_service_hours,
+                [1, 2],
+                2024,
+                "balance_workload",
+                SolverParameters(max_time_in_seconds=60),
+                on_solution=cancel,
+            )
+
+        assert len(solutions) == 1
+
+    def test_should_stop_interrupts_the_search_between_solutions(self):
+        availability_hours, business_service_hours = generate_split_shift_instance(
+            20, 12
+        )
+        started = timer.perf_counter()
+
+        with pytest.raises(SolveCancelled):
+            ORToolsScheduler().solve(
+                availability_hours,
+                business_service_hours,
+                [1, 2],
+                2024,
+                "balance_workload",
+                SolverParameters(max_time_in_seconds=60),
+                should_stop=lambda: timer.perf_counter() - started > 0.5,
+            )
+
+        assert timer.perf_counter() - started < 10
+
+    def test_should_stop_reaches_decomposed_components(self):
+        availability_hours, business_service_hours = generate_instance(3)
+        scheduler = ORToolsScheduler(
+            max_workers=2, parallel_min_variables=0, coverage_flows=False
+        )
+
+        with pytest.raises(SolveCancelled):
+            scheduler.solve(
+                availability_hours,
+                business_service_hours,
+                [1],
+                2024,
+                "maximize_coverage",
+                should_stop=lambda: True,
+            )
+
+    def test_solve_with_solution_listener_keeps_process_decomposition(
+        self, person1_id, person2_id, role_id
+    ):
+        scheduler = ORToolsScheduler(
+            max_workers=2, parallel_min_variables=1, coverage_flows=False
+        )
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person_id,
+                role_id=role_id,
+                day_of_week=day,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+            for person_id, day in [(person1_id, 0), (person2_id, 1)]
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=day,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+            for day in [0, 1]
+        ]
+        solutions = []
+
+        result = scheduler.solve(
+            availability_hours,
+            business_service_hours,
+            [1],
+            2024,
+            "maximize_coverage",
+            on_solution=lambda solution: solutions.append(solution),
+        )
+
+        assert len(result.assignments) == 2
+        assert len(result.stats.solver_runs) == 2
+        assert solutions[-1].assignments == result.assignments
+        assert solutions[-1].objective_value == 2
+        assert solutions[-1].best_objective_bound == 2
+
+    def test_solve_rolling_horizon_publishes_committed_assignments(
+        self, person1_id, role_id
+    ):
+        scheduler = ORToolsScheduler(rolling_horizon_weeks=1)
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person1_id,
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+        ]
+        solutions = []
+
+        result = scheduler.solve(
+            availability_hours,
+            business_service_hours,
+            [1, 2],
+            2024,
+            "maximize_coverage",
+            on_solution=solutions.append,
+        )
+
+        assert [a.date for a in solutions[-1].assignments] == [
+            date(2024, 1, 1),
+            date(2024, 1, 8),
+        ]
+        assert solutions[-1].assignments == result.assignments
+
+    def test_greedy_hints_complete_base_hints(
+        self, person1_id, person2_id, role_id
+    ):
+        scheduler = ORToolsScheduler(greedy_hints=True)
+        slots = [
+            (date(2024, 1, 1), time(9, 0), time(13, 0)),
+            (date(2024, 1, 1), time(11, 0), time(15, 0)),
+        ]
+        problem = EncodedProblem.from_slots({person1_id, person2_id}, slots)
+        slot_candidates = {0: [0, 1], 1: [0, 1]}
+
+        slot_people = scheduler._assign_greedily(
+            problem, slot_candidates, "maximize_coverage", {(1, 0)}, None
+        )
+
+        assert slot_people == {0: 1, 1: 0}
+
+    def test_solve_with_greedy_hints(self, person1_id, person2_id, role_id):
+        scheduler = ORToolsScheduler(greedy_hints=True)
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person_id,
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+            for person_id in [person1_id, person2_id]
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=0,
+                start_time=start,
+                end_time=end,
+                is_recurring=True,
+            )
+            for start, end in [(time(9, 0), time(13, 0)), (time(11, 0), time(15, 0))]
+        ]
+
+        result = scheduler.solve(
+            availability_hours, business_service_hours, [1], 2024, "balance_workload"
+        )
+
+        assert {a.person_id for a in result.assignments} == {person1_id, person2_id}
+        assert result.uncoverable_slots == []
+
+    @pytest.mark.parametrize("num_people", [3, 6])
+    def test_coverage_flows_match_cp_sat_coverage(self, num_people):
+        availability_hours, business_service_hours = generate_split_shift_instance(
+            num_people, shifts_per_day=8
+        )
+
+        flow_result = ORToolsScheduler().solve(
+            availability_hours, business_service_hours, [1], 2024, "maximize_coverage"
+        )
+        cp_sat_result = ORToolsScheduler(coverage_flows=False).solve(
+            availability_hours, business_service_hours, [1], 2024, "maximize_coverage"
+        )
+
+        assert len(flow_result.assignments) == len(cp_sat_result.assignments)
+        by_person = {}
+        for a in flow_result.assignments:
+            by_person.setdefault((a.person_id, a.date), []).append(a)
+        for assignments in by_person.values():
+            assignments.sort(key=lambda a: a.start_time)
+            for first, second in zip(assignments, assignments[1:]):
+                assert first.end_time <= second.start_time
+
+    def test_coverage_flows_publish_a_single_proven_solution(self):
+        availability_hours, business_service_hours = generate_instance(4)
+        solutions = []
+
+        result = ORToolsScheduler().solve(
+            availability_hours,
+            business_service_hours,
+            [1],
+            2024,
+            "maximize_coverage",
+            on_solution=solutions.append,
+        )
+
+        assert len(solutions) == 1
+        assert solutions[0].objective_value == solutions[0].best_objective_bound
+        assert solutions[0].assignments == result.assignments
+
+    def test_coverage_flows_fall_back_to_cp_sat_for_mixed_components(
+        self, scheduler, person1_id, person2_id, role_id
+    ):
+        slots = [
+            (date(2024, 1, 1), time(9, 0), time(11, 0)),
+            (date(2024, 1, 1), time(10, 0), time(12, 0)),
+            (date(2024, 1, 1), time(11, 30), time(13, 0)),
+            (date(2024, 1, 2), time(9, 0), time(11, 0)),
+        ]
+        problem = EncodedProblem.from_slots({person1_id, person2_id}, slots)
+        slot_candidates = {0: [0, 1], 1: [1], 2: [0, 1], 3: [0, 1]}
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(13, 0),
+                is_recurring=True,
+            )
+        ]
+        cp_sat_slots = []
+        solve_with_cp_sat = scheduler._solve_with_cp_sat
+
+        def record_cp_sat(problem, slot_candidates, *args):
+            cp_sat_slots.append(sorted(slot_candidates))
+            return solve_with_cp_sat(problem, slot_candidates, *args)
+
+        scheduler._solve_with_cp_sat = record_cp_sat
+        assignments = scheduler._solve_coverable_slots(
+            problem,
+            slot_candidates,
+            "maximize_coverage",
+            business_service_hours,
+            SolverParameters(),
+            set(),
+            None,
+            None,
+            None,
+            SolveStats(),
+        )
+
+        assert cp_sat_slots == [[0, 1, 2]]
+        assert len(assignments) == 4
+
+    def test_solve_reports_phase_timings_and_solver_stats(
+        self, scheduler, person1_id, person2_id, role_id
+    ):
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person_id,
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+            for person_id in [person1_id, person2_id]
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=0,
+                start_time=start,
+                end_time=end,
+                is_recurring=True,
+            )
+            for start, end in [(time(9, 0), time(13, 0)), (time(11, 0), time(15, 0))]
+        ]
+
+        result = scheduler.solve(
+            availability_hours, business_service_hours, [1], 2024, "balance_workload"
+        )
+
+        stats = result.stats
+        assert {
+            "expansion",
+            "encoding",
+            "variables",
+            "constraints",
+            "objective",
+            "search",
+            "extraction",
+        } <= set(stats.phase_times)
+        assert "presolve" not in stats.phase_times
+        assert len(stats.solver_runs) == 1
+        run = stats.solver_runs[0]
+        assert run.status == "OPTIMAL"
+        assert run.num_variables == stats.num_variables > 0
+        assert run.num_constraints == stats.num_constraints > 0
+        assert run.objective_value == run.best_objective_bound
+        assert run.presolve_time is None
+        assert run.search_time == run.wall_time
+        assert stats.wall_time >= run.wall_time
+
+    def test_solve_splits_presolve_from_search_when_logging(
+        self, scheduler, person1_id, role_id
+    ):
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person1_id,
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+        ]
+
+        stats = scheduler.solve(
+            availability_hours,
+            business_service_hours,
+            [1],
+            2024,
+            "balance_workload",
+            SolverParameters(log_search_progress=True),
+        ).stats
+
+        run = stats.solver_runs[0]
+        assert run.presolve_time is not None
+        assert run.presolve_time + run.search_time == pytest.approx(run.wall_time)
+        assert "presolve" in stats.phase_times
+
+    def test_solve_reports_flow_phase_without_solver_runs(self):
+        availability_hours, business_service_hours = generate_instance(4)
+
+        stats = ORToolsScheduler().solve(
+            availability_hours, business_service_hours, [1], 2024, "maximize_coverage"
+        ).stats
+
+        assert "flows" in stats.phase_times
+        assert stats.solver_runs == []
+
+    def test_calculate_person_gaps_includes_boundary_slot(
+        self, scheduler, person1_id
+    ):
+        slot = (date(2024, 1, 8), time(9, 0), time(17, 0))
+        problem = EncodedProblem.from_slots({person1_id}, [slot])
+        model, assignments = scheduler._build_model(problem, {0: [0]}, "invalid")
+        context = HorizonContext(
+            boundary_slots={person1_id: (date(2024, 1, 7), time(9, 0), time(17, 0))}
+        )
+
+        gap_terms = scheduler._calculate_person_gaps(
+            model,
+            problem,
+            0,
+            [0],
+            assignments,
+            scheduler._encode_boundary_slots(problem, context)[0],
+        )
+
+        solver = cp_model.CpSolver()
+        solver.Solve(model)
+        assert [solver.Value(term) for term in gap_terms] == [16]
+
+    def test_span_gaps_count_idle_time_between_assigned_slots(self, person1_id):
+        scheduler = ORToolsScheduler(gap_formulation="span")
+        slots = [
+            (date(2024, 1, 8), time(8, 0), time(10, 0)),
+            (date(2024, 1, 8), time(12, 0), time(14, 0)),
+            (date(2024, 1, 8), time(16, 0), time(18, 0)),
+            (date(2024, 1, 9), time(8, 0), time(10, 0)),
+        ]
+        problem = EncodedProblem.from_slots({person1_id}, slots)
+        model, assignments = scheduler._build_model(
+            problem, {slot: [0] for slot in range(4)}, "invalid", soft_coverage=True
+        )
+        for slot, assigned in enumerate([1, 0, 1, 1]):
+            model.Add(assignments[(0, slot)] == assigned)
+
+        gap_terms = scheduler._calculate_person_span_gaps(
+            model, problem, 0, [0, 1, 2, 3], assignments
+        )
+        model.Minimize(sum(gap_terms))
+
+        solver = cp_model.CpSolver()
+        solver.Solve(model)
+        assert [solver.Value(term) for term in gap_terms] == [6 * 60]
+
+    def test_span_gaps_include_boundary_slot_on_the_same_day(self, person1_id):
+        scheduler = ORToolsScheduler(gap_formulation="span")
+        slot = (date(2024, 1, 8), time(13, 0), time(17, 0))
+        problem = EncodedProblem.from_slots({person1_id}, [slot])
+        model, assignments = scheduler._build_model(problem, {0: [0]}, "invalid")
+        context = HorizonContext(
+            boundary_slots={person1_id: (date(2024, 1, 8), time(8, 0), time(12, 0))}
+        )
+
+        gap_terms = scheduler._calculate_person_span_gaps(
+            model,
+            problem,
+            0,
+            [0],
+            assignments,
+            scheduler._encode_boundary_slots(problem, context)[0],
+        )
+        model.Minimize(sum(gap_terms))
+
+        solver = cp_model.CpSolver()
+        solver.Solve(model)
+        assert [solver.Value(term) for term in gap_terms] == [60]
+
+    def test_optimize_minimize_gaps_span_formulation_builds_compact_days(
+        self, person1_id, person2_id, role_id
+    ):
+        scheduler = ORToolsScheduler(gap_formulation="span")
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person_id,
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(8, 0),
+                end_time=time(18, 0),
+                is_recurring=True,
+            )
+            for person_id in [person1_id, person2_id]
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=0,
+                start_time=start,
+                end_time=end,
+                is_recurring=True,
+            )
+            for start, end in [
+                (time(8, 0), time(10, 0)),
+                (time(10, 0), time(12, 0)),
+                (time(14, 0), time(16, 0)),
+                (time(16, 0), time(18, 0)),
+            ]
+        ]
+
+        result = scheduler.solve(
+            availability_hours, business_service_hours, [1], 2024, "minimize_gaps"
+        )
+
+        assert len(result.assignments) == 4
+        assert result.stats.solver_runs[-1].objective_value == 0
+        starts_by_person = defaultdict(set)
+        for assignment in result.assignments:
+            starts_by_person[assignment.person_id].add(assignment.start_time)
+        assert sorted(map(sorted, starts_by_person.values())) == [
+            [time(8, 0), time(10, 0)],
+            [time(14, 0), time(16, 0)],
+        ]
+
+    def test_invalid_gap_formulation_raises(self):
+        with pytest.raises(ValueError):
+            ORToolsScheduler(gap_formulation="invalid")
+
+    def test_compare_matches_separate_solves(self):
+        availability_hours, business_service_hours = generate_instance(3)
+        scheduler = ORToolsScheduler()
+        solver_parameters = SolverParameters(num_search_workers=1, random_seed=0)
+        strategies = ["maximize_coverage", "minimize_gaps", "balance_workload"]
+
+        results = scheduler.compare(
+            availability_hours,
+            business_service_hours,
+            [1],
+            2024,
+            strategies,
+            solver_parameters,
+        )
+
+        assert list(results) == strategies
+        for strategy in strategies:
+            separate = scheduler.solve(
+                availability_hours,
+                business_service_hours,
+                [1],
+                2024,
+                strategy,
+                solver_parameters,
+            )
+            assert len(results[strategy].assignments) == len(separate.assignments)
+            assert [run.status for run in results[strategy].stats.solver_runs] == [
+                run.status for run in separate.stats.solver_runs
+            ]
+            assert [
+                run.objective_value for run in results[strategy].stats.solver_runs
+            ] == [run.objective_value for run in separate.stats.solver_runs]
+
+    def test_compare_reports_objectives_of_the_final_assignments(self):
+        availability_hours, business_service_hours = generate_instance(3)
+        solver_parameters = SolverParameters(num_search_workers=1, random_seed=0)
+
+        results = ORToolsScheduler().compare(
+            availability_hours,
+            business_service_hours,
+            [1],
+            2024,
+            ["maximize_coverage", "minimize_gaps", "balance_workload", "lexicographic"],
+            solver_parameters,
+        )
+        decomposed = ORToolsScheduler(
+            max_workers=2, parallel_min_variables=0, coverage_flows=False
+        ).compare(
+            availability_hours,
+            business_service_hours,
+            [1],
+            2024,
+            ["maximize_coverage"],
+            solver_parameters,
+        )["maximize_coverage"]
+
+        for strategy in ["maximize_coverage", "lexicographic"]:
+            assert results[strategy].objective_value == len(
+                results[strategy].assignments
+            )
+        for strategy in ["minimize_gaps", "balance_workload"]:
+            assert results[strategy].objective_value == (
+                results[strategy].stats.solver_runs[-1].objective_value
+            )
+        assert len(decomposed.stats.solver_runs) > 1
+        assert decomposed.objective_value == len(decomposed.assignments)
+        assert decomposed.objective_value > max(
+            run.objective_value for run in decomposed.stats.solver_runs
+        )
+
+    def test_compare_builds_shared_constraints_once(self, monkeypatch):
+        availability_hours, business_service_hours = generate_instance(3)
+        scheduler = ORToolsScheduler()
+        build_constrained_model = scheduler._build_constrained_model
+        calls = []
+
+        def count_builds(*args, **kwargs):
+            calls.append(args)
+            return build_constrained_model(*args, **kwargs)
+
+        monkeypatch.setattr(scheduler, "_build_constrained_model", count_builds)
+
+        results = scheduler.compare(
+            availability_hours,
+            business_service_hours,
+            [1],
+            2024,
+            ["minimize_gaps", "balance_workload"],
+        )
+
+        assert len(calls) == 1
+        assert all(
+            "constraints" in result.stats.phase_times for result in results.values()
+        )
+
+    def test_compare_falls_back_to_partial_coverage_per_strategy(
+        self, scheduler, person1_id, person2_id, role_id, monkeypatch
+    ):
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person_id,
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+            for person_id in [person1_id, person2_id]
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(start, 0),
+                end_time=time(start + 4, 0),
+                is_recurring=True,
+            )
+            for start in [9, 10, 11]
+        ]
+        solve_fallback = scheduler._solve_uncoverable_fallback
+        calls = []
+
+        def count_fallbacks(*args, **kwargs):
+            calls.append(args)
+            return solve_fallback(*args, **kwargs)
+
+        monkeypatch.setattr(scheduler, "_solve_uncoverable_fallback", count_fallbacks)
+
+        results = scheduler.compare(
+            availability_hours,
+            business_service_hours,
+            [1],
+            2024,
+            ["minimize_gaps", "balance_workload"],
+        )
+
+        assert [call[2] for call in calls] == ["minimize_gaps", "balance_workload"]
+        for result in results.values():
+            assert len(result.assignments) == 2
+            assert len(result.uncoverable_slots) == 1
+            assert [run.status for run in result.stats.solver_runs] == [
+                "INFEASIBLE",
+                "OPTIMAL",
+                "OPTIMAL",
+            ]
+
+    def test_reoptimize_only_reassigns_the_changed_person(
+        self, scheduler, person1_id, person2_id, person3_id, role_id
+    ):
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person_id,
+                role_id=role_id,
+                day_of_week=day_of_week,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+            for person_id in [person2_id, person3_id]
+            for day_of_week in [0, 1]
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=day_of_week,
+                start_time=time(9, 0),
+                end_time=time(13, 0),
+                is_recurring=True,
+            )
+            for day_of_week in [0, 1]
+        ]
+        current_assignments = [
+            Assignment(
+                person_id=person_id,
+                date=slot_date,
+                start_time=time(9, 0),
+                end_time=time(13, 0),
+                role_id=role_id,
+            )
+            for person_id, slot_date in [
+                (person1_id, date(2024, 1, 1)),
+                (person2_id, date(2024, 1, 2)),
+            ]
+        ]
+
+        result = scheduler.reoptimize(
+            availability_hours,
+            business_service_hours,
+            [1],
+            2024,
+            "balance_workload",
+            current_assignments,
+            ChangeSet(person_ids={person1_id}),
+        )
+
+        assert [(a.person_id, a.date) for a in result.assignments] == [
+            (person3_id, date(2024, 1, 1)),
+            (person2_id, date(2024, 1, 2)),
+        ]
+        assert result.uncoverable_slots == []
+        assert "neighborhood" in result.stats.phase_times
+
+    def test_reoptimize_solves_only_changed_dates(self):
+        availability_hours, business_service_hours = generate_instance(4)
+        scheduler = ORToolsScheduler()
+        full = scheduler.solve(
+            availability_hours, business_service_hours, [1], 2024, "balance_workload"
+        )
+
+        result = scheduler.reoptimize(
+            availability_hours,
+            business_service_hours,
+            [1],
+            2024,
+            "balance_workload",
+            full.assignments,
+            ChangeSet(dates={date(2024, 1, 3)}),
+        )
+
+        unchanged = [a for a in full.assignments if a.date != date(2024, 1, 3)]
+        assert [a for a in result.assignments if a.date != date(2024, 1, 3)] == unchanged
+        assert len(result.assignments) == len(full.assignments)
+        assert result.stats.num_variables < full.stats.num_variables
+
+    def test_reoptimize_publishes_frozen_assignments(
+        self, scheduler, person1_id, person2_id, role_id
+    ):
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person_id,
+                role_id=role_id,
+                day_of_week=day_of_week,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+            for person_id in [person1_id, person2_id]
+            for day_of_week in [0, 1]
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=day_of_week,
+                start_time=time(9, 0),
+                end_time=time(13, 0),
+                is_recurring=True,
+            )
+            for day_of_week in [0, 1]
+        ]
+        frozen_assignment = Assignment(
+            person_id=person1_id,
+            date=date(2024, 1, 2),
+            start_time=time(9, 0),
+            end_time=time(13, 0),
+            role_id=role_id,
+        )
+        solutions = []
+
+        result = scheduler.reoptimize(
+            availability_hours,
+            business_service_hours,
+            [1],
+            2024,
+            "balance_workload",
+            [frozen_assignment],
+            ChangeSet(dates={date(2024, 1, 1)}),
+            on_solution=solutions.append,
+        )
+
+        assert [(a.person_id, a.date) for a in result.assignments] == [
+            (person2_id, date(2024, 1, 1)),
+            (person1_id, date(2024, 1, 2)),
+        ]
+        assert sorted(solutions[-1].assignments, key=lambda a: a.date) == (
+            result.assignments
+        )
+
+    def test_propagate_forced_keeps_the_optimal_objective(self):
+        availability_hours, business_service_hours = generate_sparse_instance(
+            6, shifts_per_day=4, single_share=0.7
+        )
+
+        results = [
+            ORToolsScheduler(propagate_forced=propagate_forced).solve(
+                availability_hours,
+                business_service_hours,
+                [1],
+                2024,
+                "balance_workload",
+            )
+            for propagate_forced in [False, True]
+        ]
+
+        full, reduced = [result.stats for result in results]
+        assert [run.status for run in reduced.solver_runs] == ["OPTIMAL", "OPTIMAL"]
+        assert reduced.solver_runs[-1].objective_value == (
+            full.solver_runs[-1].objective_value
+        )
+        assert reduced.num_variables < full.num_variables
+        assert "reduction" in reduced.phase_times
+        assert len(results[1].assignments) == len(results[0].assignments)
+
+    def test_propagate_forced_keeps_the_minimize_gaps_optimum(self):
+        availability_hours, business_service_hours = generate_synthetic_instance(10)
+
+        results = [
+            ORToolsScheduler(propagate_forced=propagate_forced).solve(
+                availability_hours,
+                business_service_hours,
+                [1, 2],
+                2024,
+                "minimize_gaps",
+            )
+            for propagate_forced in [False, True]
+        ]
+
+        full, reduced = [result.stats.solver_runs[-1] for result in results]
+        assert (reduced.status, reduced.objective_value) == (
+            full.status,
+            full.objective_value,
+        )
+
+    def test_conflicting_forced_assignments_skip_the_hard_model(
+        self, person1_id, person2_id, role_id
+    ):
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person1_id,
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(15, 0),
+                is_recurring=True,
+            )
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=0,
+                start_time=start,
+                end_time=end,
+                is_recurring=True,
+            )
+            for start, end in [(time(9, 0), time(13, 0)), (time(11, 0), time(15, 0))]
+        ]
+
+        results = [
+            ORToolsScheduler(propagate_forced=propagate_forced).solve(
+                availability_hours,
+                business_service_hours,
+                [1],
+                2024,
+                "balance_workload",
+            )
+            for propagate_forced in [False, True]
+        ]
+
+        assert [run.status for run in results[0].stats.solver_runs] == [
+            "INFEASIBLE",
+            "OPTIMAL",
+        ]
+        assert [run.status for run in results[1].stats.solver_runs] == ["OPTIMAL"]
+        assert len(results[1].assignments) == 1
+        assert len(results[1].uncoverable_slots) == 1
+
+    def test_forced_assignments_are_not_hinted(
+        self, scheduler, person1_id, person2_id
+    ):
+        slots = [
+            (date(2024, 1, 1), time(9, 0), time(13, 0)),
+            (date(2024, 1, 1), time(13, 0), time(17, 0)),
+        ]
+        problem = EncodedProblem.from_slots({person1_id, person2_id}, slots)
+        model, assignments = scheduler._build_model(
+            problem, {0: [0], 1: [0, 1]}, "balance_workload", forced={0: 0}
+        )
+
+        scheduler._add_solution_hints(model, assignments, {(0, 0), (1, 1)}, {0: 0})
+
+        assert len(model.Proto().solution_hint.vars) == 2
+        solver = cp_model.CpSolver()
+        assert solver.Solve(model) == cp_model.OPTIMAL
+        assert solver.Value(assignments[(0, 0)]) == 1
+
+    def test_symmetry_breaking_orders_first_slots_of_interchangeable_people(
+        self, person1_id, person2_id, person3_id
+    ):
+        slots = [
+            (date(2024, 1, 1), time(9, 0), time(10, 0)),
+            (date(2024, 1, 1), time(11, 0), time(14, 0)),
+            (date(2024, 1, 1), time(15, 0), time(17, 0)),
+        ]
+        problem = EncodedProblem.from_slots({person1_id, person2_id, person3_id}, slots)
+        slot_candidates = {slot: [0, 1, 2] for slot in range(3)}
+        model, assignments = ORToolsScheduler(symmetry_breaking=True)._build_model(
+            problem, slot_candidates, "balance_workload"
+        )
+        plain_model, _ = ORToolsScheduler()._build_model(
+            problem, slot_candidates, "balance_workload"
+        )
+
+        solver = cp_model.CpSolver()
+        assert solver.Solve(model) == cp_model.OPTIMAL
+        first_slots = [
+            min(slot for slot in range(3) if solver.Value(assignments[(person, slot)]))
+            for person in range(3)
+        ]
+        assert first_slots == [0, 1, 2]
+        assert (
+            len(model.Proto().constraints) == len(plain_model.Proto().constraints) + 12
+        )
+
+    def test_symmetry_breaking_grows_linearly_with_slots(
+        self, person1_id, person2_id
+    ):
+        slots = [
+            (date(2024, 1, 1) + timedelta(days=day), time(9, 0), time(17, 0))
+            for day in range(40)
+        ]
+        problem = EncodedProblem.from_slots({person1_id, person2_id}, slots)
+        slot_candidates = {slot: [0, 1] for slot in range(40)}
+
+        def linear_terms(symmetry_breaking: bool) -> int:
+            scheduler = ORToolsScheduler(symmetry_breaking=symmetry_breaking)
+            model, _ = scheduler._build_model(problem, slot_candidates, "invalid")
+            return sum(
+                len(constraint.linear.vars) for constraint in model.Proto().constraints
+            )
+
+        assert linear_terms(True) - linear_terms(False) < 10 * len(slots)
+
+    def test_symmetry_breaking_keeps_people_with_different_history_apart(
+        self, person1_id, person2_id
+    ):
+        slots = [(date(2024, 1, 8), time(9, 0), time(13, 0))]
+        problem = EncodedProblem.from_slots({person1_id, person2_id}, slots)
+        context = HorizonContext(accumulated_hours={person1_id: 8})
+        with_context, _ = ORToolsScheduler(symmetry_breaking=True)._build_model(
+            problem, {0: [0, 1]}, "balance_workload", context
+        )
+        plain_model, _ = ORToolsScheduler()._build_model(
+            problem, {0: [0, 1]}, "balance_workload", context
+        )
+
+        assert len(with_context.Proto().constraints) == len(
+            plain_model.Proto().constraints
+        )
+
+    def test_variable_names_are_only_kept_for_export_or_debugging(self, tmp_path):
+        assert not ORToolsScheduler().variable_names
+        assert ORToolsScheduler(export_dir=str(tmp_path)).variable_names
+        assert ORToolsScheduler(variable_names=True).variable_names
+        assert not ORToolsScheduler(
+            export_dir=str(tmp_path), variable_names=False
+        ).variable_names
+
+    def test_unnamed_models_leave_variable_names_empty(
+        self, person1_id, person2_id
+    ):
+        slots = [
+            (date(2024, 1, 1), time(9, 0), time(13, 0)),
+            (date(2024, 1, 1), time(12, 0), time(17, 0)),
+        ]
+        problem = EncodedProblem.from_slots({person1_id, person2_id}, slots)
+        problem.variable_names = False
+        slot_candidates = {0: [0, 1], 1: [0, 1]}
+        model, assignments = ORToolsScheduler()._build_model(
+            problem, slot_candidates, "minimize_gaps"
+        )
+        named_model, named_assignments = ORToolsScheduler()._build_model(
+            EncodedProblem.from_slots({person1_id, person2_id}, slots),
+            slot_candidates,
+            "minimize_gaps",
+        )
+
+        assert {
+            variable.name for variable in model.Proto().variables if variable.name
+        } == {"gap_penalty"}
+        assert named_assignments[(0, 1)].Name() == (
+            f"assign_{problem.person_ids[0]}_2024-01-01_12:00:00_17:00:00"
+        )
+        assert len(model.Proto().variables) == len(named_model.Proto().variables)
+        assert assignments.keys() == named_assignments.keys()
+
+    def test_lexicographic_keeps_each_stage_optimum(self):
+        availability_hours, business_service_hours = generate_instance(3)
+        solver_parameters = SolverParameters(num_search_workers=1, random_seed=0)
+        scheduler = ORToolsScheduler()
+
+        result = scheduler.solve(
+            availability_hours,
+            business_service_hours,
+            [1],
+            2024,
+            "lexicographic",
+            solver_parameters,
+        )
+        gaps = scheduler.solve(
+            availability_hours,
+            business_service_hours,
+            [1],
+            2024,
+            "minimize_gaps",
+            solver_parameters,
+        )
+
+        runs = result.stats.solver_runs
+        assert [run.status for run in runs] == ["OPTIMAL", "OPTIMAL"]
+        assert runs[0].objective_value == gaps.stats.solver_runs[0].objective_value
+        assert len(result.assignments) == len(gaps.assignments)
+
+    def test_lexicographic_labels_stages_and_counts_the_model_once(self):
+        availability_hours, business_service_hours = generate_instance(3)
+        solutions = []
+
+        result = ORToolsScheduler().solve(
+            availability_hours,
+            business_service_hours,
+            [1],
+            2024,
+            "lexicographic",
+            SolverParameters(num_search_workers=1, random_seed=0),
+            on_solution=solutions.append,
+        )
+
+        runs = result.stats.solver_runs
+        assert [(run.objective, run.stage) for run in runs] == [
+            ("minimize_gaps", 0),
+            ("balance_workload", 1),
+        ]
+        assert result.stats.num_variables == runs[0].num_variables
+        assert result.stats.num_constraints == runs[0].num_constraints
+        assert {(solution.objective, solution.stage) for solution in solutions} == {
+            ("minimize_gaps", 0),
+            ("balance_workload", 1),
+        }
+        assert solutions[-1].objective == "balance_workload"
+
+    def test_lexicographic_stage_optimum_becomes_a_constraint(self, monkeypatch):
+        availability_hours, business_service_hours = generate_instance(3)
+        scheduler = ORToolsScheduler()
+        solve = scheduler._solve_and_extract_assignments
+        models = []
+
+        def record_models(model, *args, **kwargs):
+            models.append(len(model.Proto().constraints))
+            return solve(model, *args, **kwargs)
+
+        monkeypatch.setattr(scheduler, "_solve_and_extract_assignments", record_models)
+
+        scheduler.solve(
+            availability_hours, business_service_hours, [1], 2024, "lexicographic"
+        )
+
+        assert len(models) == 2
+        assert models[1] > models[0]
+
+    def test_lexicographic_relaxation_starts_from_coverage(
+        self, scheduler, person1_id, role_id
+    ):
+        availability_hours = [
+            AvailabilityHours(
+                id=uuid4(),
+                person_id=person1_id,
+                role_id=role_id,
+                day_of_week=0,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                is_recurring=True,
+            )
+        ]
+        business_service_hours = [
+            BusinessServiceHours(
+                id=uuid4(),
+                role_id=role_id,
+                day_of_week=0,
+                start_time=start,
+                end_time=end,
+                is_recurring=True,
+            )
+            for start, end in [(time(9, 0), time(13, 0)), (time(11, 0), time(15, 0))]
+        ]
+
+        result = scheduler.solve(
+            availability_hours, business_service_hours, [1], 2024, "lexicographic"
+        )
+
+        assert len(result.assignments) == 1
+        assert len(result.uncoverable_slots) == 1
+        coverage, gaps = result.stats.solver_runs
+        assert (coverage.status, coverage.objective_value) == ("OPTIMAL", 1)
+        assert gaps.status == "OPTIMAL"
+
     @staticmethod
     def _times_overlap(
         start1: time, end1: time, start2: time, end2: time
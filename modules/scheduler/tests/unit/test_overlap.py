@@ -0,0 +1,44 @@
+from datetime import time
+
+from modules.scheduler.overlap import interval_minutes, maximal_overlap_cliques
+
+
+class TestIntervalMinutes:
+    def test_converts_times_to_minutes(self):
+        assert interval_minutes(time(9, 30), time(17, 0)) == (570, 1020)
+
+    def test_wraps_overnight_intervals(self):
+        assert interval_minutes(time(22, 0), time(6, 0)) == (1320, 1800)
+
+
+class TestMaximalOverlapCliques:
+    def test_no_overlap_yields_no_cliques(self):
+        assert maximal_overlap_cliques([(0, 60), (60, 120), (180, 240)]) == []
+
+    def test_pair_of_overlapping_intervals(self):
+        assert maximal_overlap_cliques([(0, 60), (30, 90)]) == [[0, 1]]
+
+    def test_chain_yields_one_clique_per_overlap(self):
+        cliques = maximal_overlap_cliques([(0, 60), (30, 90), (70, 120)])
+
+        assert [sorted(clique) for clique in cliques] == [[0, 1], [1, 2]]
+
+    def test_nested_intervals_form_single_clique(self):
+        cliques = maximal_overlap_cliques([(0, 240), (30, 90), (60, 120)])
+
+        assert [sorted(clique) for clique in cliques] == [[0, 1, 2]]
+
+    def test_each_overlapping_pair_is_in_some_clique(self):
+        intervals = [(0, 120), (60, 180), (90, 150), (170, 300), (200, 260), (250, 400)]
+
+        cliques = [set(clique) for clique in maximal_overlap_cliques(intervals)]
+
+        for i, (start1, end1) in enumerate(intervals):
+            for j, (start2, end2) in enumerate(intervals[i + 1 :], start=i + 1):
+                if start1 < end2 and start2 < end1:
+                    assert any({i, j} <= clique for clique in cliques)
+                else:
+                    assert not any({i, j} <= clique for clique in cliques)
+
+    def test_ignores_empty_intervals(self):
+        assert maximal_overlap_cliques([(60, 60), (0, 120)]) == []
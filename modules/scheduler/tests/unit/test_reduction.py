@@ -0,0 +1,43 @@
+from modules.scheduler.reduction import propagate_forced_assignments
+
+STARTS = [540, 600, 720, 900]
+ENDS = [720, 780, 900, 1020]
+
+
+class TestPropagateForcedAssignments:
+    def test_forces_single_candidate_slots(self):
+        candidates, forced = propagate_forced_assignments(
+            {0: [0], 2: [0, 1]}, STARTS, ENDS
+        )
+
+        assert forced == {0: 0}
+        assert candidates == {0: [0], 2: [0, 1]}
+
+    def test_removes_forced_person_from_overlapping_slots(self):
+        candidates, forced = propagate_forced_assignments(
+            {0: [0], 1: [0, 1], 2: [0, 1]}, STARTS, ENDS
+        )
+
+        assert forced == {0: 0, 1: 1, 2: 0}
+        assert candidates == {0: [0], 1: [1], 2: [0]}
+
+    def test_propagates_chains_of_forced_assignments(self):
+        candidates, forced = propagate_forced_assignments(
+            {0: [0], 1: [0, 1], 2: [1, 2], 3: [2, 0]}, STARTS, ENDS
+        )
+
+        assert forced == {0: 0, 1: 1, 2: 2}
+        assert candidates == {0: [0], 1: [1], 2: [2], 3: [2, 0]}
+
+    def test_returns_none_when_forced_assignments_conflict(self):
+        assert propagate_forced_assignments({0: [0], 1: [0]}, STARTS, ENDS) is None
+
+    def test_leaves_unforced_problem_unchanged(self):
+        slot_candidates = {0: [0, 1], 1: [0, 1]}
+
+        candidates, forced = propagate_forced_assignments(
+            slot_candidates, STARTS, ENDS
+        )
+
+        assert forced == {}
+        assert candidates == slot_candidates
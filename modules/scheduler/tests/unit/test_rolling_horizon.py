@@ -0,0 +1,12 @@
+from modules.scheduler.rolling_horizon import split_into_windows
+
+
+class TestSplitIntoWindows:
+    def test_splits_weeks_into_fixed_size_windows(self):
+        assert split_into_windows([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+
+    def test_sorts_and_deduplicates_weeks(self):
+        assert split_into_windows([3, 1, 2, 1], 2) == [[1, 2], [3]]
+
+    def test_single_window_when_size_covers_all_weeks(self):
+        assert split_into_windows([1, 2], 4) == [[1, 2]]
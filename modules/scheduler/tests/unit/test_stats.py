@@ -0,0 +1,80 @@
+from dataclasses import replace
+
+from modules.scheduler.stats import SolverRun, SolveStats, _search_start
+
+
+def solver_run(presolve_time: float | None, search_time: float) -> SolverRun:
+    return SolverRun(
+        status="OPTIMAL",
+        num_variables=10,
+        num_constraints=4,
+        objective_value=3.0,
+        best_objective_bound=3.0,
+        num_conflicts=0,
+        num_branches=7,
+        presolve_time=presolve_time,
+        search_time=search_time,
+        wall_time=(presolve_time or 0.0) + search_time,
+    )
+
+
+class TestSolveStats:
+    def test_measure_accumulates_phase_time(self):
+        stats = SolveStats()
+
+        with stats.measure("encoding"):
+            pass
+        with stats.measure("encoding"):
+            pass
+
+        assert list(stats.phase_times) == ["encoding"]
+        assert stats.phase_times["encoding"] >= 0
+
+    def test_solver_runs_add_counts_and_solver_phases(self):
+        stats = SolveStats()
+
+        stats.add_solver_run(solver_run(0.5, 1.5))
+        stats.add_solver_run(solver_run(0.25, 0.75))
+
+        assert stats.num_variables == 20
+        assert stats.num_constraints == 8
+        assert stats.phase_times == {"presolve": 0.75, "search": 2.25}
+
+    def test_later_stages_on_the_same_model_are_not_counted_again(self):
+        stats = SolveStats()
+
+        stats.add_solver_run(solver_run(0.5, 1.5))
+        stats.add_solver_run(replace(solver_run(0.25, 0.75), stage=1))
+
+        assert stats.num_variables == 10
+        assert stats.num_constraints == 4
+        assert stats.phase_times == {"presolve": 0.75, "search": 2.25}
+
+    def test_solver_runs_without_presolve_time_only_count_search(self):
+        stats = SolveStats()
+
+        stats.add_solver_run(solver_run(None, 1.5))
+
+        assert stats.phase_times == {"search": 1.5}
+
+    def test_merge_does_not_count_solver_phases_twice(self):
+        stats = SolveStats()
+        part = SolveStats()
+        part.add_solver_run(solver_run(0.5, 1.5))
+        part.add_phase_time("variables", 0.25)
+
+        stats.merge(part)
+
+        assert stats.phase_times == {"presolve": 0.5, "search": 1.5, "variables": 0.25}
+        assert stats.num_variables == 10
+        assert len(stats.solver_runs) == 1
+
+
+class TestSearchStart:
+    def test_reads_search_start_from_solver_log(self):
+        log = "Starting presolve at 0.00s\nStarting search at 0.42s with 8 workers.\n"
+
+        assert _search_start(log, 1.0) == 0.42
+
+    def test_missing_log_counts_everything_as_search(self):
+        assert _search_start("", 1.0) == 0.0
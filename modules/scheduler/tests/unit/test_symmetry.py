@@ -0,0 +1,18 @@
+from modules.scheduler.symmetry import find_interchangeable_people
+
+
+class TestFindInterchangeablePeople:
+    def test_groups_people_with_identical_slots(self):
+        person_slots = {0: [1, 2], 1: [1, 2], 2: [1], 3: [1, 2]}
+
+        assert find_interchangeable_people(person_slots, {}) == [[0, 1, 3]]
+
+    def test_splits_classes_by_state(self):
+        person_slots = {0: [1, 2], 1: [1, 2], 2: [1, 2]}
+
+        classes = find_interchangeable_people(person_slots, {0: (8, None), 2: (8, None)})
+
+        assert classes == [[0, 2]]
+
+    def test_ignores_unique_people(self):
+        assert find_interchangeable_people({0: [1], 1: [2]}, {}) == []